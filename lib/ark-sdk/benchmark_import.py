@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Measure ark_sdk Import Time
+
+Runs `python -X importtime -c "import <module>"` several times in fresh
+interpreters and reports the median cumulative import time of the module
+along with the slowest modules it pulls in.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+def run_importtime(module: str) -> Dict[str, Tuple[int, int]]:
+    """Import a module in a fresh interpreter, returning (self, cumulative) microseconds per imported module"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    timings = {}
+    for line in result.stderr.splitlines():
+        # import time:   self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main():
+    """Main function to benchmark the import time of ark_sdk"""
+    parser = argparse.ArgumentParser(description='Measure the import time of ark_sdk')
+    parser.add_argument('-m', '--module', default='ark_sdk', help='Module to import')
+    parser.add_argument('-n', '--runs', type=int, default=5, help='Number of fresh interpreters to run')
+    parser.add_argument('--top', type=int, default=10, help='Number of slowest modules to list')
+    
+    args = parser.parse_args()
+    runs: List[Dict[str, Tuple[int, int]]] = [run_importtime(args.module) for _ in range(args.runs)]
+    
+    cumulative = [run[args.module][1] for run in runs]
+    loaded = [name for name in runs[-1] if name.startswith(f'{args.module}.')]
+    print(f"{args.module}: median {statistics.median(cumulative) / 1000:.1f} ms over {args.runs} runs, {len(loaded)} submodules loaded")
+    
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    for name, (self_us, _) in slowest:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
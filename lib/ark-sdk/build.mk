@@ -25,7 +25,7 @@ CLEAN_TARGETS += $(ARK_SDK_LIB_DIR)/node_modules
 CLEAN_TARGETS += $(ARK_SDK_LIB_DIR)/out
 
 # Define phony targets
-.PHONY: $(ARK_SDK_LIB_NAME)-build $(ARK_SDK_LIB_NAME)-test $(ARK_SDK_LIB_NAME)-clean-stamps
+.PHONY: $(ARK_SDK_LIB_NAME)-build $(ARK_SDK_LIB_NAME)-test $(ARK_SDK_LIB_NAME)-importtime $(ARK_SDK_LIB_NAME)-clean-stamps
 
 # Generate clean-stamps target
 $(eval $(call CLEAN_STAMPS_TEMPLATE,$(ARK_SDK_LIB_NAME)))
@@ -45,6 +45,10 @@ $(ARK_SDK_WHL): $(ARK_SDK_OPENAPI) $(ARK_SDK_LIB_DIR)/generate_ark_clients.py $(
 	@mkdir -p $(ARK_SDK_OUT)/py-sdk
 	cd $(ARK_SDK_LIB_DIR) && PATH="$(BUILD_EXTRA_PATH)" npx --yes @openapitools/openapi-generator-cli generate -i $(ARK_SDK_OPENAPI) -g python -o $(ARK_SDK_OUT)/py-sdk --package-name ark_sdk
 	cd $(ARK_SDK_LIB_DIR) && tar -cf - -C gen_sdk/overlay/python . | tar -xf - -C $(ARK_SDK_OUT)/py-sdk
+	cd $(ARK_SDK_LIB_DIR) && for init in ark_sdk/__init__.py ark_sdk/models/__init__.py; do \
+		uv run python generate_ark_clients.py -l $(ARK_SDK_OUT)/py-sdk/$$init > $(ARK_SDK_OUT)/py-sdk/$$init.lazy && \
+		mv $(ARK_SDK_OUT)/py-sdk/$$init.lazy $(ARK_SDK_OUT)/py-sdk/$$init || exit 1; \
+	done
 	cd $(ARK_SDK_LIB_DIR) && uv run python generate_ark_clients.py -v $(ARK_SDK_OPENAPI) > $(ARK_SDK_OUT)/py-sdk/ark_sdk/versions.py
 	cd $(ARK_SDK_LIB_DIR) && uv run python generate_ark_clients.py -t $(ARK_SDK_OPENAPI) > $(ARK_SDK_OUT)/py-sdk/test/test_ark_client.py
 	cd $(ARK_SDK_LIB_DIR) && uv sync
@@ -56,3 +60,8 @@ $(ARK_SDK_STAMP_TEST): $(ARK_SDK_WHL)
 	cd $(ARK_SDK_OUT)/py-sdk && uv sync
 	cd $(ARK_SDK_OUT)/py-sdk && uv run python -m pytest test
 	@touch $@
+
+# Import time benchmark
+$(ARK_SDK_LIB_NAME)-importtime: $(ARK_SDK_WHL) # HELP: Measure ARK SDK import time
+	cd $(ARK_SDK_OUT)/py-sdk && uv sync
+	cd $(ARK_SDK_OUT)/py-sdk && uv run python $(BUILD_ROOT)/$(ARK_SDK_LIB_DIR)/benchmark_import.py
@@ -5,7 +5,7 @@ This module provides authentication functionality for ARK services.
 
 from .exceptions import AuthenticationError, TokenValidationError
 from .config import AuthConfig
-from .validator import TokenValidator
+from .validator import TokenValidator, get_token_validator
 from .basic import BasicAuthValidator
 
 __all__ = [
@@ -13,5 +13,6 @@ __all__ = [
     "TokenValidationError",
     "AuthConfig",
     "TokenValidator",
+    "get_token_validator",
     "BasicAuthValidator",
 ]
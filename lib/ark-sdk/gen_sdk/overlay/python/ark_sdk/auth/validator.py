@@ -1,21 +1,52 @@
 """Token validation for ARK SDK."""
 
+import asyncio
+import hashlib
 import logging
 import os
-import json
-from typing import Optional, Dict, Any
+import re
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from jose import jwt, jwk
 from jose.exceptions import JWTError, ExpiredSignatureError, JWTClaimsError
-import requests
+import httpx
 
 from .exceptions import TokenValidationError, InvalidTokenError as AuthInvalidTokenError, ExpiredTokenError
 from .config import AuthConfig
 
 logger = logging.getLogger(__name__)
 
+# Seconds a JWKS is used when the IdP's response has no Cache-Control max-age
+JWKS_CACHE_TTL = float(os.getenv("JWKS_CACHE_TTL", "3600"))
+# Minimum seconds between JWKS downloads, also when a token has an unknown kid
+JWKS_MIN_REFRESH_INTERVAL = float(os.getenv("JWKS_MIN_REFRESH_INTERVAL", "30"))
+# Verified tokens remembered until they expire
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def _max_age(cache_control: Optional[str]) -> Optional[float]:
+    """Get the max-age of a Cache-Control header, 0 for no-cache or no-store."""
+    if not cache_control:
+        return None
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+    match = _MAX_AGE.search(cache_control)
+    return float(match.group(1)) if match else None
+
 
 class TokenValidator:
-    """Validates JWT tokens using JWKS."""
+    """
+    Validates JWT tokens using JWKS.
+
+    The JWKS is cached until its Cache-Control max-age (or JWKS_CACHE_TTL)
+    runs out, and refreshed early when a token is signed with an unknown
+    kid. Refreshes are single-flight and at most every
+    JWKS_MIN_REFRESH_INTERVAL seconds. Verified tokens are remembered by
+    digest until their exp, so repeated requests skip signature checks.
+    """
     
     def __init__(self, config: Optional[AuthConfig] = None):
         if config is None:
@@ -23,7 +54,11 @@ class TokenValidator:
         else:
             self.config = config
         self._jwks_cache: Optional[Dict[str, Any]] = None
-        self._cache_expiry: Optional[float] = None
+        self._cache_expiry = 0.0
+        self._fetched_at = 0.0
+        self._signing_keys: Dict[str, str] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._verified: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
 
     
     def _create_config_from_env(self) -> AuthConfig:
@@ -44,26 +79,63 @@ class TokenValidator:
             jwks_url=jwks_url
         )
     
-    def _fetch_jwks(self) -> Dict[str, Any]:
-        """Fetch JWKS from the configured URL."""
+    async def _fetch_jwks(self) -> Tuple[Dict[str, Any], Optional[float]]:
+        """Fetch JWKS from the configured URL, with its Cache-Control max-age."""
         if not self.config.jwks_url:
             raise TokenValidationError("JWKS URL not configured")
         
         try:
-            response = requests.get(self.config.jwks_url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            async with httpx.AsyncClient(timeout=10) as client:
+                response = await client.get(self.config.jwks_url)
+                response.raise_for_status()
+                return response.json(), _max_age(response.headers.get("cache-control"))
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch JWKS: {e}")
             raise TokenValidationError(f"Failed to fetch JWKS: {e}")
     
-    def _get_jwks(self) -> Dict[str, Any]:
-        """Get JWKS with caching."""
-        if self._jwks_cache is None:
-            self._jwks_cache = self._fetch_jwks()
-        return self._jwks_cache
+    async def _get_jwks(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get JWKS with caching.
+
+        refresh fetches it again before it expires (e.g. for an unknown kid),
+        unless it was fetched less than JWKS_MIN_REFRESH_INTERVAL ago.
+        """
+        if not refresh and self._jwks_cache is not None and time.monotonic() < self._cache_expiry:
+            return self._jwks_cache
+        async with self._refresh_lock:
+            # Another request may have fetched it while this one waited
+            now = time.monotonic()
+            if self._jwks_cache is not None:
+                recent = now - self._fetched_at < JWKS_MIN_REFRESH_INTERVAL
+                if (now < self._cache_expiry and not refresh) or (refresh and recent):
+                    return self._jwks_cache
+            try:
+                jwks, max_age = await self._fetch_jwks()
+            except TokenValidationError:
+                if self._jwks_cache is None:
+                    raise
+                # Keep using the keys we have while the IdP is unreachable
+                self._fetched_at = now
+                self._cache_expiry = now + JWKS_MIN_REFRESH_INTERVAL
+                return self._jwks_cache
+            ttl = JWKS_CACHE_TTL if max_age is None else max_age
+            self._jwks_cache = jwks
+            self._signing_keys = {}
+            self._fetched_at = now
+            self._cache_expiry = now + max(ttl, JWKS_MIN_REFRESH_INTERVAL)
+            return jwks
+    
+    def _find_signing_key(self, jwks: Dict[str, Any], kid: str) -> Optional[str]:
+        """Get the PEM of a key in the JWKS, converting each key once."""
+        if kid not in self._signing_keys:
+            for key in jwks.get('keys', []):
+                if key.get('kid') == kid:
+                    # Construct the key
+                    self._signing_keys[kid] = jwk.construct(key).to_pem().decode('utf-8')
+                    break
+        return self._signing_keys.get(kid)
     
-    def _get_signing_key(self, token: str) -> str:
+    async def _get_signing_key(self, token: str) -> str:
         """Get the signing key for a JWT token from JWKS."""
         try:
             # Decode header to get kid (key ID)
@@ -74,13 +146,12 @@ class TokenValidator:
                 raise TokenValidationError("Token header does not contain 'kid'")
             
             # Get JWKS
-            jwks = self._get_jwks()
-            
-            # Find the key with matching kid
-            for key in jwks.get('keys', []):
-                if key.get('kid') == kid:
-                    # Construct the key
-                    return jwk.construct(key).to_pem().decode('utf-8')
+            signing_key = self._find_signing_key(await self._get_jwks(), kid)
+            if signing_key is None:
+                # The IdP may have rotated its keys since the JWKS was fetched
+                signing_key = self._find_signing_key(await self._get_jwks(refresh=True), kid)
+            if signing_key is not None:
+                return signing_key
             
             raise TokenValidationError(f"Unable to find key with kid: {kid}")
             
@@ -101,9 +172,18 @@ class TokenValidator:
         Raises:
             TokenValidationError: If token validation fails
         """
+        digest = hashlib.sha256(token.encode('utf-8')).digest()
+        cached = self._verified.get(digest)
+        if cached is not None:
+            payload, exp = cached
+            if time.time() < exp:
+                self._verified.move_to_end(digest)
+                return payload
+            del self._verified[digest]
+        
         try:
             # Get the signing key
-            signing_key = self._get_signing_key(token)
+            signing_key = await self._get_signing_key(token)
 
             # Use issuer and audience from configuration
             audience = self.config.audience
@@ -127,6 +207,7 @@ class TokenValidator:
                 options=options
             )
 
+            self._remember(digest, payload)
             return payload
 
         except ExpiredSignatureError as e:
@@ -142,4 +223,23 @@ class TokenValidator:
             logger.error(f"Token validation error: {e}")
             raise TokenValidationError(f"Token validation failed: {e}")
 
+    def _remember(self, digest: bytes, payload: Dict[str, Any]):
+        """Remember a verified token until it expires."""
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or TOKEN_CACHE_SIZE <= 0:
+            return
+        self._verified[digest] = (payload, float(exp))
+        self._verified.move_to_end(digest)
+        while len(self._verified) > TOKEN_CACHE_SIZE:
+            self._verified.popitem(last=False)
+
+
+_token_validator: Optional[TokenValidator] = None
+
 
+def get_token_validator() -> TokenValidator:
+    """Get the process-wide token validator, configured from the environment."""
+    global _token_validator
+    if _token_validator is None:
+        _token_validator = TokenValidator()
+    return _token_validator
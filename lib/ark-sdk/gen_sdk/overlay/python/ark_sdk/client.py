@@ -1,8 +1,10 @@
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from ark_sdk import versions
-from ark_sdk.k8s import get_context
+from ark_sdk.k8s import get_context, get_api_client_pool
+from ark_sdk.informer import get_informer_registry
+from ark_sdk.streaming_config import get_streaming_endpoint_cache
 from ark_sdk.executor import (
     Parameter,
     Model,
@@ -18,18 +20,34 @@ from ark_sdk.executor_app import ExecutorApp
 V1_ALPHA1 = "v1alpha1"
 V1_PREALPHA1 = "v1prealpha1"
 
+# Per-(version, namespace) client views; all of them share the pooled connections
+_clients: Dict[Tuple[str, str], versions._ARKClient] = {}
+
 def get_client(namespace: Optional[str], version: str):
     # If namespace is None, get it from context
     if namespace is None:
         namespace = get_context()["namespace"]
 
+    key = (version, namespace)
+    ark_client = _clients.get(key)
+    if ark_client is not None:
+        return ark_client
+
     clazz = {
         V1_ALPHA1: versions.ARKClientV1alpha1,
         V1_PREALPHA1: versions.ARKClientV1prealpha1
     }.get(version)
     if not clazz:
         raise Exception(f"No client for {version}")
-    return clazz(namespace)
+    ark_client = _clients[key] = clazz(namespace)
+    return ark_client
+
+async def close_clients():
+    """Stop informers and watches, drop all cached ARK clients and close the shared connection pool."""
+    await get_informer_registry().stop()
+    get_streaming_endpoint_cache().invalidate()
+    _clients.clear()
+    await get_api_client_pool().close()
 
 @asynccontextmanager
 async def with_ark_client(namespace: Optional[str], version: str):
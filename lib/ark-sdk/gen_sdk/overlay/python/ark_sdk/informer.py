@@ -0,0 +1,518 @@
+"""Informer-backed read cache for ARK custom resources."""
+import asyncio
+import json
+import logging
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from kubernetes_asyncio import client, watch
+from kubernetes_asyncio.client.rest import ApiException
+
+from ark_sdk.k8s import get_api_client_pool, in_ephemeral_loop
+
+logger = logging.getLogger(__name__)
+
+# Set to "true" to serve ARKResourceClient reads from informers
+INFORMER_CACHE_ENV = "ARK_SDK_INFORMER_CACHE"
+
+# Server-side timeout for each watch request before it is re-established
+WATCH_TIMEOUT_SECONDS = 300
+
+# Delay before relisting after an unexpected watch failure
+RETRY_BACKOFF_SECONDS = 5
+
+EventHandler = Callable[[str, Dict[str, Any]], None]
+
+# Maps an object to the index keys it should be found under
+IndexFunc = Callable[[Dict[str, Any]], List[str]]
+
+# Core API collections (group "") the informer can follow, by plural
+CORE_LIST_METHODS = {
+    "events": "list_namespaced_event",
+}
+
+SKILLS_ANNOTATION_REGEX = re.compile(r'a2a\..*\/skills$')
+
+
+def _field(obj: Dict[str, Any], *path: str) -> List[str]:
+    """Index a single nested string field, if set."""
+    value: Any = obj
+    for key in path:
+        if not isinstance(value, dict):
+            return []
+        value = value.get(key)
+    return [value] if isinstance(value, str) and value else []
+
+
+def _query_target_keys(query: Dict[str, Any]) -> List[str]:
+    """Index queries by target as "type/name"."""
+    target = (query.get("spec") or {}).get("target") or {}
+    if target.get("type") and target.get("name"):
+        return [f"{target['type']}/{target['name']}"]
+    return []
+
+
+def _agent_skill_tag_keys(agent: Dict[str, Any]) -> List[str]:
+    """Index agents by the tags of the skills in their A2A skills annotation."""
+    annotations = (agent.get("metadata") or {}).get("annotations") or {}
+    keys: Set[str] = set()
+    for annotation_key, value in annotations.items():
+        if not SKILLS_ANNOTATION_REGEX.search(annotation_key):
+            continue
+        try:
+            skills = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        for skill in skills if isinstance(skills, list) else []:
+            if isinstance(skill, dict):
+                keys.update(tag for tag in skill.get("tags") or [] if isinstance(tag, str))
+    return sorted(keys)
+
+
+# Secondary indexes maintained for each plural, by index name
+INDEXERS: Dict[str, Dict[str, IndexFunc]] = {
+    "evaluations": {
+        "queryRef": lambda obj: _field(obj, "spec", "config", "queryRef", "name"),
+    },
+    "queries": {
+        "sessionId": lambda obj: _field(obj, "spec", "sessionId"),
+        "conversationId": lambda obj: _field(obj, "spec", "conversationId"),
+        "target": _query_target_keys,
+    },
+    "memories": {
+        "name": lambda obj: _field(obj, "metadata", "name"),
+    },
+    "agents": {
+        "skillTag": _agent_skill_tag_keys,
+    },
+}
+
+
+def register_indexer(plural: str, index: str, func: IndexFunc):
+    """Declare an additional secondary index for a plural.
+
+    Must be called before the informer for that plural is created.
+    """
+    INDEXERS.setdefault(plural, {})[index] = func
+
+
+def get_indexer(plural: str, index: str) -> IndexFunc:
+    """Get the key function for a declared index."""
+    try:
+        return INDEXERS[plural][index]
+    except KeyError:
+        raise ValueError(f"No index '{index}' declared for {plural}")
+
+
+def _parse_label_selector(selector: Optional[str]) -> Optional[List[Tuple[str, str, Optional[str]]]]:
+    """
+    Parse an equality-based label selector into (key, operator, value) terms.
+
+    Returns None for set-based selectors (in, notin, ...), which are left to
+    the API server.
+    """
+    if not selector:
+        return []
+
+    terms: List[Tuple[str, str, Optional[str]]] = []
+    for term in selector.split(","):
+        term = term.strip()
+        if not term:
+            continue
+        if "(" in term or " " in term:
+            return None
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            terms.append((key, "!=", value))
+        elif "==" in term:
+            key, value = term.split("==", 1)
+            terms.append((key, "=", value))
+        elif "=" in term:
+            key, value = term.split("=", 1)
+            terms.append((key, "=", value))
+        elif term.startswith("!"):
+            terms.append((term[1:], "!", None))
+        else:
+            terms.append((term, "exists", None))
+    return terms
+
+
+def _matches_labels(labels: Dict[str, str], terms: List[Tuple[str, str, Optional[str]]]) -> bool:
+    """Check a label set against parsed selector terms."""
+    for key, operator, value in terms:
+        if operator == "=" and labels.get(key) != value:
+            return False
+        if operator == "!=" and labels.get(key) == value:
+            return False
+        if operator == "exists" and key not in labels:
+            return False
+        if operator == "!" and key in labels:
+            return False
+    return True
+
+
+def _is_newer(candidate: Dict[str, Any], current: Optional[Dict[str, Any]]) -> bool:
+    """Check whether candidate is at least as recent as current."""
+    if current is None:
+        return True
+    candidate_rv = candidate.get("metadata", {}).get("resourceVersion", "")
+    current_rv = current.get("metadata", {}).get("resourceVersion", "")
+    # resourceVersions are opaque, only compare them when both are numeric
+    if candidate_rv.isdigit() and current_rv.isdigit():
+        return int(candidate_rv) >= int(current_rv)
+    return True
+
+
+class Informer:
+    """
+    Local copy of one (namespace, plural) collection kept current by list+watch.
+
+    Custom resources are followed through the custom objects API; an empty
+    group follows a core collection listed in CORE_LIST_METHODS (e.g. events).
+
+    The informer lists the collection once, then watches from the returned
+    resourceVersion. When the watch expires it resumes from the last seen
+    resourceVersion; when the server answers 410 Gone it relists.
+    """
+
+    def __init__(self, group: str, version: str, plural: str, namespace: str):
+        self.group = group
+        self.version = version
+        self.plural = plural
+        self.namespace = namespace
+        self.resource_version: Optional[str] = None
+        self._store: Dict[str, Dict[str, Any]] = {}
+        self._indexers: Dict[str, IndexFunc] = dict(INDEXERS.get(plural, {}))
+        # index name -> index key -> object names
+        self._indexes: Dict[str, Dict[str, Set[str]]] = {index: {} for index in self._indexers}
+        self._handlers: List[EventHandler] = []
+        self._synced = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the initial list has completed."""
+        return self._synced.is_set()
+
+    def start(self):
+        """Start the list+watch loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the list+watch loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the initial list, returning False on timeout."""
+        try:
+            await asyncio.wait_for(self._synced.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def add_event_handler(self, handler: EventHandler):
+        """Register a handler called with (event_type, object) on every change."""
+        self._handlers.append(handler)
+
+    def remove_event_handler(self, handler: EventHandler):
+        """Unregister a handler added with add_event_handler."""
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a cached object by name."""
+        return self._store.get(name)
+
+    def list(self, label_selector: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        List cached objects, optionally filtered by label selector.
+
+        Returns None if the selector can't be evaluated locally.
+        """
+        terms = _parse_label_selector(label_selector)
+        if terms is None:
+            return None
+        items = list(self._store.values())
+        if terms:
+            items = [
+                item for item in items
+                if _matches_labels(item.get("metadata", {}).get("labels") or {}, terms)
+            ]
+        return items
+
+    def by_index(self, index: str, key: str) -> List[Dict[str, Any]]:
+        """Get the cached objects stored under an index key."""
+        if index not in self._indexes:
+            raise ValueError(f"No index '{index}' declared for {self.plural}")
+        names = self._indexes[index].get(key, ())
+        return [self._store[name] for name in names]
+
+    def index_keys(self, index: str) -> List[str]:
+        """Get the keys of an index, e.g. to match them by substring."""
+        if index not in self._indexes:
+            raise ValueError(f"No index '{index}' declared for {self.plural}")
+        return list(self._indexes[index])
+
+    def _index(self, name: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]):
+        """Move an object between index buckets as its keys change."""
+        for index, func in self._indexers.items():
+            buckets = self._indexes[index]
+            old_keys = set(func(old)) if old is not None else set()
+            new_keys = set(func(new)) if new is not None else set()
+            for key in old_keys - new_keys:
+                bucket = buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(name)
+                    if not bucket:
+                        del buckets[key]
+            for key in new_keys - old_keys:
+                buckets.setdefault(key, set()).add(name)
+
+    def apply(self, event_type: str, obj: Dict[str, Any]):
+        """Apply a single change to the store and notify handlers."""
+        name = obj.get("metadata", {}).get("name")
+        if not name:
+            return
+        if event_type == "DELETED":
+            old = self._store.pop(name, None)
+            if old is None:
+                return
+            self._index(name, old, None)
+        else:
+            old = self._store.get(name)
+            if not _is_newer(obj, old):
+                return
+            self._store[name] = obj
+            self._index(name, old, obj)
+        self._notify(event_type, obj)
+
+    def _notify(self, event_type: str, obj: Dict[str, Any]):
+        for handler in self._handlers:
+            try:
+                handler(event_type, obj)
+            except Exception as e:
+                logger.warning(f"Informer handler failed for {self.plural}: {e}")
+
+    def _replace(self, items: List[Dict[str, Any]]):
+        """Replace the store after a (re)list, emitting only the differences."""
+        previous = self._store
+        self._store = {}
+        for item in items:
+            name = item.get("metadata", {}).get("name")
+            if not name:
+                continue
+            old = previous.get(name)
+            self._store[name] = item
+            self._index(name, old, item)
+            if old is None:
+                self._notify("ADDED", item)
+            elif old.get("metadata", {}).get("resourceVersion") != item.get("metadata", {}).get("resourceVersion"):
+                self._notify("MODIFIED", item)
+        for name, obj in previous.items():
+            if name not in self._store:
+                self._index(name, obj, None)
+                self._notify("DELETED", obj)
+
+    def _list_call(self, api_client) -> Tuple[Callable[..., Any], Dict[str, Any]]:
+        """Get the list function of the collection and its arguments."""
+        if not self.group:
+            list_func = getattr(client.CoreV1Api(api_client), CORE_LIST_METHODS[self.plural])
+            return list_func, {"namespace": self.namespace}
+        return client.CustomObjectsApi(api_client).list_namespaced_custom_object, {
+            "group": self.group,
+            "version": self.version,
+            "namespace": self.namespace,
+            "plural": self.plural,
+        }
+
+    async def _list(self, api_client):
+        list_func, kwargs = self._list_call(api_client)
+        if self.group:
+            result = await list_func(**kwargs)
+        else:
+            # Read core objects as raw JSON, like custom objects and watch events
+            response = await list_func(_preload_content=False, **kwargs)
+            result = json.loads(await response.read())
+        self._replace(result.get("items") or [])
+        self.resource_version = result.get("metadata", {}).get("resourceVersion")
+        self._synced.set()
+        logger.info(
+            f"Informer synced {len(self._store)} {self.plural} in namespace {self.namespace} "
+            f"at resourceVersion {self.resource_version}"
+        )
+
+    async def _watch(self, api_client):
+        list_func, kwargs = self._list_call(api_client)
+        w = watch.Watch()
+        try:
+            async for event in w.stream(
+                list_func,
+                resource_version=self.resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                **kwargs,
+            ):
+                obj = event["raw_object"]
+                if event["type"] != "BOOKMARK":
+                    self.apply(event["type"], obj)
+                self.resource_version = obj.get("metadata", {}).get("resourceVersion", self.resource_version)
+        finally:
+            await w.close()
+
+    async def _run(self):
+        relist = True
+        while True:
+            try:
+                async with get_api_client_pool().api_client() as api_client:
+                    if relist:
+                        await self._list(api_client)
+                        relist = False
+                    await self._watch(api_client)
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                relist = True
+                if e.status == 410:
+                    logger.info(f"Informer for {self.plural} in {self.namespace} expired, relisting")
+                    continue
+                logger.warning(f"Informer for {self.plural} in {self.namespace} failed: {e}")
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS)
+            except Exception as e:
+                relist = True
+                logger.warning(f"Informer for {self.plural} in {self.namespace} failed: {e}")
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS)
+
+
+async def wait_for_change(api_class, method: str, resource_version: Optional[str], **kwargs) -> str:
+    """
+    Wait until a watched collection changes after resource_version.
+
+    Runs api_class(api_client).<method> as a watch (e.g. CoreV1Api and
+    "list_namespaced_config_map" with a metadata.name field selector),
+    resuming from the last seen resourceVersion when the watch expires.
+    Returns the first event type, or "ERROR" if the watch can't continue
+    (e.g. 410 Gone), in which case callers should treat the data as stale.
+
+    The watch can stay open for as long as the cached data is valid, so it
+    runs on its own ApiClient rather than holding a pooled connection.
+    """
+    while True:
+        try:
+            async with client.ApiClient() as api_client:
+                list_func = getattr(api_class(api_client), method)
+                w = watch.Watch()
+                try:
+                    async for event in w.stream(
+                        list_func,
+                        resource_version=resource_version,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                        **kwargs,
+                    ):
+                        if event["type"] != "BOOKMARK":
+                            return event["type"]
+                        obj = event["raw_object"]
+                        resource_version = obj.get("metadata", {}).get("resourceVersion", resource_version)
+                finally:
+                    await w.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"Watch for {method} stopped: {e}")
+            return "ERROR"
+
+
+class InformerRegistry:
+    """Process-wide set of informers keyed by (group, version, plural, namespace)."""
+
+    def __init__(self, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.getenv(INFORMER_CACHE_ENV, "").lower() in ("1", "true", "yes")
+        self.enabled = enabled
+        self._informers: Dict[Tuple[str, str, str, str], Informer] = {}
+        # Holders of each informer taken with acquire()
+        self._holders: Dict[Tuple[str, str, str, str], int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_informer(self, group: str, version: str, plural: str, namespace: str) -> Informer:
+        """Get the informer for a collection, starting it on first use."""
+        key = (group, version, plural, namespace)
+        informer = self._informers.get(key)
+        if informer is None:
+            self._loop = asyncio.get_running_loop()
+            informer = self._informers[key] = Informer(group, version, plural, namespace)
+            informer.start()
+        return informer
+
+    def acquire(self, group: str, version: str, plural: str, namespace: str) -> Informer:
+        """Get the informer for a collection, to be given back with release()."""
+        informer = self.get_informer(group, version, plural, namespace)
+        key = (group, version, plural, namespace)
+        self._holders[key] = self._holders.get(key, 0) + 1
+        return informer
+
+    async def release(self, group: str, version: str, plural: str, namespace: str):
+        """
+        Give back an informer taken with acquire().
+
+        The last release stops the informer, unless the read cache is enabled
+        and serves client reads from it.
+        """
+        key = (group, version, plural, namespace)
+        holders = self._holders.get(key, 0) - 1
+        if holders > 0:
+            self._holders[key] = holders
+            return
+        self._holders.pop(key, None)
+        if self.enabled:
+            return
+        informer = self._informers.pop(key, None)
+        if informer is not None:
+            await informer.stop()
+
+    def get_synced(self, group: str, version: str, plural: str, namespace: str) -> Optional[Informer]:
+        """
+        Get a synced informer for a collection if the cache is enabled.
+
+        Returns None while the informer is still listing, so callers fall
+        back to the API server.
+        """
+        if not self.enabled or in_ephemeral_loop():
+            return None
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            return None
+        informer = self.get_informer(group, version, plural, namespace)
+        return informer if informer.has_synced else None
+
+    def observe(self, group: str, version: str, plural: str, namespace: str, event_type: str, obj: Dict[str, Any]):
+        """Apply the result of a write made through this process to its informer."""
+        informer = self._informers.get((group, version, plural, namespace))
+        if informer is not None and informer.has_synced:
+            informer.apply(event_type, obj)
+
+    async def stop(self):
+        """Stop all informers."""
+        informers = list(self._informers.values())
+        self._informers.clear()
+        self._holders.clear()
+        self._loop = None
+        for informer in informers:
+            await informer.stop()
+
+
+_informer_registry: Optional[InformerRegistry] = None
+
+def get_informer_registry() -> InformerRegistry:
+    """Get the process-wide informer registry."""
+    global _informer_registry
+    if _informer_registry is None:
+        _informer_registry = InformerRegistry()
+    return _informer_registry
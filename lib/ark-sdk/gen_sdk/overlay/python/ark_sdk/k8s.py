@@ -1,14 +1,17 @@
 """Kubernetes utilities and client initialization."""
+import asyncio
 import functools
 import logging
 import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from functools import lru_cache
 
-from kubernetes import config
+from kubernetes import client as sync_client, config
 from kubernetes.config.config_exception import ConfigException
 from kubernetes_asyncio import client, config as async_config
 import base64
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from kubernetes_asyncio.client.api_client import ApiClient
 from kubernetes_asyncio.client.rest import ApiException
 
@@ -16,6 +19,12 @@ logger = logging.getLogger(__name__)
 
 NS_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
 
+# Maximum number of concurrent connections to the API server per process
+POOL_MAXSIZE_ENV = "ARK_K8S_POOL_MAXSIZE"
+
+# Set while a coroutine runs on a throwaway loop (see run_on_ephemeral_loop)
+_ephemeral_loop: ContextVar[bool] = ContextVar("ark_sdk_ephemeral_loop", default=False)
+
 def get_namespace():
     """Get current namespace using standard Kubernetes patterns."""
     context_info = get_context()
@@ -33,43 +42,116 @@ def get_context():
     2. Fall back to ~/.kube/config context (dev mode)
     3. Fall back to 'default' namespace
 
-    Note: Does not cache results to ensure multiple clients see correct context.
+    Results are cached by the process-wide ContextProvider and reloaded
+    whenever the namespace file or kubeconfig changes on disk.
+    """
+    return get_context_provider().get()
+
+
+class ContextProvider:
+    """
+    Cached Kubernetes context lookup.
+
+    Keeps the last resolved context together with the modification times of
+    the files it was read from (the in-cluster namespace file and every
+    kubeconfig file), and only re-reads them once one of those changes. A
+    call that hits the cache costs a few stat() calls.
     """
 
-    # First try: in-cluster service account (preferred when running in pods)
-    if os.path.isfile(NS_PATH):
+    def __init__(self, ns_path: str = NS_PATH, kubeconfig: Optional[str] = None):
+        self.ns_path = ns_path
+        self.kubeconfig = kubeconfig
+        self._key: Optional[Tuple[Any, ...]] = None
+        self._context: Optional[Dict[str, Optional[str]]] = None
+
+    def _kubeconfig_paths(self) -> List[str]:
+        location = self.kubeconfig or config.KUBE_CONFIG_DEFAULT_LOCATION
+        return [os.path.expanduser(path) for path in location.split(os.pathsep) if path]
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[int]:
         try:
-            with open(NS_PATH) as f:
-                namespace = f.read().strip()
-            logger.info(f"Using in-cluster namespace: {namespace}")
-            return {
-                'namespace': namespace,
-                'cluster': None  # Cluster name not available in standard in-cluster setup
-            }
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _source_key(self) -> Tuple[Any, ...]:
+        """Identify the files the context is read from and their current versions."""
+        ns_mtime = self._mtime(self.ns_path)
+        if ns_mtime is not None:
+            return (self.ns_path, ns_mtime)
+        return tuple((path, self._mtime(path)) for path in self._kubeconfig_paths())
+
+    def get(self) -> Dict[str, Optional[str]]:
+        """Get the current context, reloading it if its source files changed."""
+        key = self._source_key()
+        if self._context is None or key != self._key:
+            self._context = self._load()
+            self._key = key
+        return dict(self._context)
+
+    def invalidate(self):
+        """Drop the cached context so the next call reloads it."""
+        self._key = None
+        self._context = None
+
+    def _load(self) -> Dict[str, Optional[str]]:
+        # First try: in-cluster service account (preferred when running in pods)
+        if os.path.isfile(self.ns_path):
+            try:
+                with open(self.ns_path) as f:
+                    namespace = f.read().strip()
+                logger.info(f"Using in-cluster namespace: {namespace}")
+                return {
+                    'namespace': namespace,
+                    'cluster': None  # Cluster name not available in standard in-cluster setup
+                }
+            except Exception as e:
+                logger.warning(f"Failed to read in-cluster namespace: {e}")
+
+        # Second try: kubeconfig context (dev mode)
+        try:
+            _, active_context = config.list_kube_config_contexts(config_file=self.kubeconfig)
+            if active_context and 'context' in active_context:
+                ctx = active_context['context']
+                namespace = ctx.get('namespace', 'default')
+                cluster = ctx.get('cluster', None)
+                logger.info(f"Using kubeconfig context namespace: {namespace}, cluster: {cluster}")
+                return {
+                    'namespace': namespace,
+                    'cluster': cluster
+                }
         except Exception as e:
-            logger.warning(f"Failed to read in-cluster namespace: {e}")
+            logger.warning(f"Failed to read kubeconfig context: {e}")
+
+        # Final fallback
+        logger.info("Using fallback namespace: default")
+        return {
+            'namespace': 'default',
+            'cluster': None
+        }
 
-    # Second try: kubeconfig context (dev mode)
-    try:
-        _, active_context = config.list_kube_config_contexts()
-        if active_context and 'context' in active_context:
-            ctx = active_context['context']
-            namespace = ctx.get('namespace', 'default')
-            cluster = ctx.get('cluster', None)
-            logger.info(f"Using kubeconfig context namespace: {namespace}, cluster: {cluster}")
-            return {
-                'namespace': namespace,
-                'cluster': cluster
-            }
-    except Exception as e:
-        logger.warning(f"Failed to read kubeconfig context: {e}")
 
-    # Final fallback
-    logger.info("Using fallback namespace: default")
-    return {
-        'namespace': 'default',
-        'cluster': None
-    }
+_context_provider: Optional[ContextProvider] = None
+
+def get_context_provider() -> ContextProvider:
+    """Get the process-wide Kubernetes context provider."""
+    global _context_provider
+    if _context_provider is None:
+        _context_provider = ContextProvider()
+    return _context_provider
+
+def set_context_provider(provider: Optional[ContextProvider]) -> Optional[ContextProvider]:
+    """
+    Replace the process-wide context provider, returning the previous one.
+
+    Lets tests switch between contexts (e.g. providers reading different
+    kubeconfig files); passing None restores the default on next use.
+    """
+    global _context_provider
+    previous = _context_provider
+    _context_provider = provider
+    return previous
 
 def is_k8s():
     """Check if running in a Kubernetes cluster."""
@@ -111,6 +193,100 @@ async def init_k8s():
         async_config.load_incluster_config()
 
 
+def run_on_ephemeral_loop(coro):
+    """Run a coroutine on a short-lived event loop from synchronous code.
+
+    Connections opened on such a loop are not added to the shared pool, since
+    they would be bound to a loop that is closed as soon as the call returns.
+    """
+    token = _ephemeral_loop.set(True)
+    try:
+        return asyncio.run(coro)
+    finally:
+        _ephemeral_loop.reset(token)
+
+
+def in_ephemeral_loop() -> bool:
+    """Whether the current coroutine runs under run_on_ephemeral_loop."""
+    return _ephemeral_loop.get()
+
+
+class ApiClientPool:
+    """
+    Process-wide Kubernetes API connection pool shared by all ARK clients.
+
+    Holds one long-lived sync ApiClient and one kubernetes_asyncio ApiClient
+    (bound to the event loop that first used it), so per-namespace resource
+    clients reuse the same sockets and TLS sessions instead of opening new
+    ones for every request.
+    """
+
+    def __init__(self, pool_maxsize: Optional[int] = None):
+        if pool_maxsize is None and os.getenv(POOL_MAXSIZE_ENV):
+            pool_maxsize = int(os.environ[POOL_MAXSIZE_ENV])
+        self.pool_maxsize = pool_maxsize
+        self._sync_api_client: Optional[sync_client.ApiClient] = None
+        self._async_api_client: Optional[ApiClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_sync_api_client(self) -> sync_client.ApiClient:
+        """Get the shared sync ApiClient, creating it on first use."""
+        if self._sync_api_client is None:
+            configuration = sync_client.Configuration.get_default_copy()
+            if self.pool_maxsize:
+                configuration.connection_pool_maxsize = self.pool_maxsize
+            self._sync_api_client = sync_client.ApiClient(configuration)
+        return self._sync_api_client
+
+    @asynccontextmanager
+    async def api_client(self) -> AsyncIterator[ApiClient]:
+        """
+        Yield an async ApiClient backed by the shared connection pool.
+
+        Falls back to a per-call client when running on a loop other than the
+        one owning the pool (e.g. sync callers going through asyncio.run).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not None and self._async_loop.is_closed():
+            # The owning loop is gone, its connections can't be reused
+            self._async_api_client = None
+            self._async_loop = None
+
+        if self._async_api_client is None and not in_ephemeral_loop():
+            configuration = client.Configuration.get_default_copy()
+            if self.pool_maxsize:
+                configuration.connection_pool_maxsize = self.pool_maxsize
+            self._async_api_client = ApiClient(configuration)
+            self._async_loop = loop
+
+        if self._async_api_client is not None and self._async_loop is loop:
+            yield self._async_api_client
+        else:
+            async with ApiClient() as api:
+                yield api
+
+    async def close(self):
+        """Close all pooled connections."""
+        if self._async_api_client is not None:
+            if self._async_loop is asyncio.get_running_loop():
+                await self._async_api_client.close()
+            self._async_api_client = None
+            self._async_loop = None
+        if self._sync_api_client is not None:
+            self._sync_api_client.close()
+            self._sync_api_client = None
+
+
+_api_client_pool: Optional[ApiClientPool] = None
+
+def get_api_client_pool() -> ApiClientPool:
+    """Get the process-wide Kubernetes API connection pool."""
+    global _api_client_pool
+    if _api_client_pool is None:
+        _api_client_pool = ApiClientPool()
+    return _api_client_pool
+
+
 class SecretClient:
     """Kubernetes Secret management client."""
 
@@ -145,7 +321,7 @@ class SecretClient:
     
     async def list_secrets(self, label_selector: Optional[str] = None):
         """List all secrets in namespace."""
-        async with ApiClient() as api:
+        async with get_api_client_pool().api_client() as api:
             v1 = client.CoreV1Api(api)
             secrets = await v1.list_namespaced_secret(
                 namespace=self.namespace,
@@ -169,7 +345,7 @@ class SecretClient:
         """Create a new secret."""
         validated_data = self.validate_and_encode_token(string_data)
         
-        async with ApiClient() as api:
+        async with get_api_client_pool().api_client() as api:
             v1 = client.CoreV1Api(api)
             
             secret = client.V1Secret(
@@ -195,7 +371,7 @@ class SecretClient:
     
     async def get_secret(self, name: str):
         """Get a specific secret."""
-        async with ApiClient() as api:
+        async with get_api_client_pool().api_client() as api:
             v1 = client.CoreV1Api(api)
             secret = await v1.read_namespaced_secret(
                 name=name, 
@@ -214,7 +390,7 @@ class SecretClient:
         """Update an existing secret."""
         validated_data = self.validate_and_encode_token(string_data)
         
-        async with ApiClient() as api:
+        async with get_api_client_pool().api_client() as api:
             v1 = client.CoreV1Api(api)
             
             existing_secret = await v1.read_namespaced_secret(
@@ -240,7 +416,7 @@ class SecretClient:
     
     async def delete_secret(self, name: str) -> bool:
         """Delete a secret."""
-        async with ApiClient() as api:
+        async with get_api_client_pool().api_client() as api:
             v1 = client.CoreV1Api(api)
             await v1.delete_namespaced_secret(
                 name=name,
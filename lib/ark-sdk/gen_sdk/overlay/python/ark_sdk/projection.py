@@ -0,0 +1,87 @@
+"""Fast conversions for resource reads that skip pydantic validation."""
+import copy
+import functools
+import typing
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T', bound=BaseModel)
+
+
+def project(obj: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """
+    Copy selected dotted JSON paths out of a resource dict.
+
+    project(query, ["metadata.name", "status.phase"]) returns
+    {"metadata": {"name": ...}, "status": {"phase": ...}}. Paths that
+    are not set on the object are left out.
+    """
+    result: Dict[str, Any] = {}
+    for path in fields:
+        keys = path.split(".")
+        value: Any = obj
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = result
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = copy.deepcopy(value)
+    return result
+
+
+def _unwrap(annotation: Any) -> Tuple[str, Any]:
+    """Reduce a field annotation to ("model" | "list" | "dict" | "plain", inner)."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _unwrap(args[0])
+        return "plain", None
+    if origin in (list, List):
+        return "list", typing.get_args(annotation)[0]
+    if origin in (dict, Dict):
+        return "dict", typing.get_args(annotation)[1]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "model", annotation
+    return "plain", None
+
+
+@functools.lru_cache(maxsize=None)
+def _field_plan(model_class: Type[BaseModel]) -> Tuple[Tuple[str, str, Any], ...]:
+    """Map each JSON key of a model to its attribute name and annotation, once per class."""
+    return tuple(
+        (info.alias or name, name, info.annotation)
+        for name, info in model_class.model_fields.items()
+    )
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    kind, inner = _unwrap(annotation)
+    if value is None or kind == "plain":
+        return value
+    if kind == "model" and isinstance(value, dict):
+        return construct_model(inner, value)
+    if kind == "list" and isinstance(value, list):
+        return [_construct_value(inner, item) for item in value]
+    if kind == "dict" and isinstance(value, dict):
+        return {key: _construct_value(inner, item) for key, item in value.items()}
+    return value
+
+
+def construct_model(model_class: Type[T], data: Dict[str, Any]) -> T:
+    """
+    Build a generated model from trusted data without validating it.
+
+    Nested models are constructed recursively so to_dict() keeps working.
+    Only use this for data that came from the API server, which has
+    already been validated against the CRD schema.
+    """
+    values = {}
+    for key, name, annotation in _field_plan(model_class):
+        if key in data:
+            values[name] = _construct_value(annotation, data[key])
+    return model_class.model_construct(**values)
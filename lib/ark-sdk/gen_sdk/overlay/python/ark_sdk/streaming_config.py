@@ -1,8 +1,16 @@
 """Streaming configuration from ConfigMap."""
 
-from typing import Optional
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import yaml
+from kubernetes_asyncio import client
+
+from ark_sdk.k8s import get_api_client_pool
+from ark_sdk.informer import wait_for_change
+
+logger = logging.getLogger(__name__)
 
 # ConfigMap name for streaming configuration
 STREAMING_CONFIG_NAME = "ark-config-streaming"
@@ -23,7 +31,7 @@ class ArkStreamingConfig:
     serviceRef: ServiceRef
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'ArkStreamingConfig':
+    def from_dict(cls, data: Dict[str, Any]) -> 'ArkStreamingConfig':
         """Create from dictionary."""
         enabled = str(data.get("enabled", "false")).lower() == "true"
         service_ref_data = yaml.safe_load(data.get("serviceRef", "{}"))
@@ -69,6 +77,9 @@ async def get_streaming_base_url(config: ArkStreamingConfig, namespace: str, k8s
     Raises:
         ValueError: If URL cannot be constructed
     """
+    if config is None:
+        raise ValueError("No streaming configuration provided")
+
     service_ns = config.serviceRef.namespace or namespace
 
     # Look up the service to resolve port
@@ -76,7 +87,11 @@ async def get_streaming_base_url(config: ArkStreamingConfig, namespace: str, k8s
         name=config.serviceRef.name,
         namespace=service_ns
     )
+    return _service_base_url(config, service_ns, service)
 
+
+def _service_base_url(config: ArkStreamingConfig, service_ns: str, service) -> str:
+    """Build the base URL for the streaming service from its Service object."""
     # Find the port - it should be a name
     port_number = None
     for svc_port in service.spec.ports:
@@ -88,4 +103,98 @@ async def get_streaming_base_url(config: ArkStreamingConfig, namespace: str, k8s
         raise ValueError(f"Port '{config.serviceRef.port}' not found in service {config.serviceRef.name}")
 
     # Return base URL
-    return f"http://{config.serviceRef.name}.{service_ns}.svc.cluster.local:{port_number}"
\ No newline at end of file
+    return f"http://{config.serviceRef.name}.{service_ns}.svc.cluster.local:{port_number}"
+
+
+class StreamingEndpointCache:
+    """
+    Resolved streaming configuration and base URL per namespace.
+
+    The first lookup for a namespace reads the ConfigMap and the Service it
+    points to; later lookups are served from memory. Each entry is dropped
+    as soon as a watch sees the ConfigMap or the Service change (or the
+    watch can no longer tell), so the next lookup resolves it again.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Optional[ArkStreamingConfig], Optional[str]]] = {}
+        self._watches: Dict[str, List[asyncio.Task[None]]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def resolve(self, namespace: str) -> Tuple[Optional[ArkStreamingConfig], Optional[str]]:
+        """Get the streaming configuration and, if streaming is enabled, the base URL.
+
+        Returns (None, None) when the ConfigMap doesn't exist. Errors are not
+        cached and are raised to the caller.
+        """
+        entry = self._entries.get(namespace)
+        if entry is not None:
+            return entry
+
+        async with self._locks.setdefault(namespace, asyncio.Lock()):
+            entry = self._entries.get(namespace)
+            if entry is not None:
+                return entry
+
+            async with get_api_client_pool().api_client() as api_client:
+                v1 = client.CoreV1Api(api_client)
+                # A field-selected list returns a resourceVersion to watch from even if the ConfigMap is missing
+                config_maps = await v1.list_namespaced_config_map(
+                    namespace=namespace,
+                    field_selector=f"metadata.name={STREAMING_CONFIG_NAME}"
+                )
+                sources = [("list_namespaced_config_map", namespace, STREAMING_CONFIG_NAME, config_maps.metadata.resource_version)]
+
+                config = ArkStreamingConfig.from_dict(config_maps.items[0].data or {}) if config_maps.items else None
+                base_url = None
+                if config and config.enabled:
+                    service_ns = config.serviceRef.namespace or namespace
+                    service = await v1.read_namespaced_service(
+                        name=config.serviceRef.name,
+                        namespace=service_ns
+                    )
+                    base_url = _service_base_url(config, service_ns, service)
+                    sources.append(("list_namespaced_service", service_ns, config.serviceRef.name, service.metadata.resource_version))
+
+            entry = (config, base_url)
+            self._entries[namespace] = entry
+            self._watches[namespace] = [
+                asyncio.create_task(self._invalidate_on_change(namespace, *source))
+                for source in sources
+            ]
+            return entry
+
+    async def _invalidate_on_change(self, namespace: str, method: str, object_ns: str, name: str, resource_version: str):
+        event = await wait_for_change(
+            client.CoreV1Api,
+            method,
+            resource_version,
+            namespace=object_ns,
+            field_selector=f"metadata.name={name}"
+        )
+        logger.info(f"Streaming endpoint for {namespace} invalidated by {event} on {name}")
+        self.invalidate(namespace)
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """Drop the cached endpoint for a namespace, or for all namespaces."""
+        namespaces = [namespace] if namespace is not None else list(self._entries)
+        try:
+            # A watch task invalidating its own entry is already finishing
+            current = asyncio.current_task()
+        except RuntimeError:
+            current = None
+        for ns in namespaces:
+            self._entries.pop(ns, None)
+            for task in self._watches.pop(ns, []):
+                if task is not current:
+                    task.cancel()
+
+
+_streaming_endpoint_cache: Optional[StreamingEndpointCache] = None
+
+def get_streaming_endpoint_cache() -> StreamingEndpointCache:
+    """Get the process-wide streaming endpoint cache."""
+    global _streaming_endpoint_cache
+    if _streaming_endpoint_cache is None:
+        _streaming_endpoint_cache = StreamingEndpointCache()
+    return _streaming_endpoint_cache
@@ -1,8 +1,11 @@
 """Tests for streaming configuration."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from ark_sdk.streaming_config import ArkStreamingConfig, ServiceRef, get_streaming_config, get_streaming_base_url, STREAMING_CONFIG_NAME
+from unittest.mock import AsyncMock, MagicMock, patch
+from ark_sdk.streaming_config import ArkStreamingConfig, ServiceRef, StreamingEndpointCache, get_streaming_config, get_streaming_base_url, STREAMING_CONFIG_NAME
 
 
 def test_from_dict_valid():
@@ -146,4 +149,89 @@ async def test_get_streaming_base_url_port_not_found():
     mock_client.read_namespaced_service.return_value = mock_service
 
     with pytest.raises(ValueError, match="Port 'nonexistent' not found"):
-        await get_streaming_base_url(config, "default", mock_client)
\ No newline at end of file
+        await get_streaming_base_url(config, "default", mock_client)
+
+
+@pytest.fixture
+def endpoint_cache_env():
+    """Patch the API client pool, CoreV1Api and the change watch for StreamingEndpointCache."""
+    mock_v1 = MagicMock()
+    config_maps = MagicMock()
+    config_maps.metadata.resource_version = "10"
+    config_map = MagicMock()
+    config_map.data = {"enabled": "true", "serviceRef": 'name: ark-broker\nport: "http"'}
+    config_maps.items = [config_map]
+    mock_v1.list_namespaced_config_map = AsyncMock(return_value=config_maps)
+
+    service = MagicMock()
+    port = MagicMock()
+    port.name = "http"
+    port.port = 8080
+    service.spec.ports = [port]
+    service.metadata.resource_version = "11"
+    mock_v1.read_namespaced_service = AsyncMock(return_value=service)
+
+    changed = asyncio.Event()
+
+    async def fake_wait_for_change(*args, **kwargs):
+        await changed.wait()
+        return "MODIFIED"
+
+    @asynccontextmanager
+    async def fake_api_client():
+        yield MagicMock()
+
+    with patch("ark_sdk.streaming_config.get_api_client_pool", return_value=MagicMock(api_client=fake_api_client)), \
+         patch("ark_sdk.streaming_config.client.CoreV1Api", return_value=mock_v1), \
+         patch("ark_sdk.streaming_config.wait_for_change", side_effect=fake_wait_for_change) as mock_wait:
+        yield mock_v1, changed, mock_wait
+
+
+@pytest.mark.asyncio
+async def test_endpoint_cache_resolves_once(endpoint_cache_env):
+    """Test repeated lookups are served from the cache."""
+    mock_v1, _, mock_wait = endpoint_cache_env
+    cache = StreamingEndpointCache()
+
+    first = await cache.resolve("default")
+    second = await cache.resolve("default")
+    # Let the watch tasks start
+    await asyncio.sleep(0)
+
+    assert first[1] == "http://ark-broker.default.svc.cluster.local:8080"
+    assert first == second
+    mock_v1.list_namespaced_config_map.assert_awaited_once()
+    mock_v1.read_namespaced_service.assert_awaited_once()
+    watched = [call.args[1] for call in mock_wait.call_args_list]
+    assert watched == ["list_namespaced_config_map", "list_namespaced_service"]
+    cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_endpoint_cache_invalidated_by_watch(endpoint_cache_env):
+    """Test a change to a watched object drops the cached endpoint."""
+    mock_v1, changed, _ = endpoint_cache_env
+    cache = StreamingEndpointCache()
+    await cache.resolve("default")
+
+    changed.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    await cache.resolve("default")
+
+    assert mock_v1.list_namespaced_config_map.await_count == 2
+    cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_endpoint_cache_missing_config(endpoint_cache_env):
+    """Test a missing ConfigMap is cached as not configured without reading a Service."""
+    mock_v1, _, _ = endpoint_cache_env
+    mock_v1.list_namespaced_config_map.return_value.items = []
+    cache = StreamingEndpointCache()
+
+    assert await cache.resolve("default") == (None, None)
+    assert await cache.resolve("default") == (None, None)
+    mock_v1.list_namespaced_config_map.assert_awaited_once()
+    mock_v1.read_namespaced_service.assert_not_called()
+    cache.invalidate()
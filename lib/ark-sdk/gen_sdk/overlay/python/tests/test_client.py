@@ -0,0 +1,112 @@
+"""Tests for the shared ARK client registry and connection pool."""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from ark_sdk import client as ark_client_module
+from ark_sdk.client import get_client, close_clients, V1_ALPHA1
+from ark_sdk.k8s import ApiClientPool, run_on_ephemeral_loop
+
+
+class TestClientRegistry(unittest.TestCase):
+    """Test cases for the namespace-keyed client registry."""
+
+    def setUp(self):
+        self.clients_patcher = patch.dict(ark_client_module._clients, clear=True)
+        self.clients_patcher.start()
+        self.versions_patcher = patch('ark_sdk.client.versions')
+        mock_versions = self.versions_patcher.start()
+        mock_versions.ARKClientV1alpha1.side_effect = lambda namespace: Mock(namespace=namespace)
+
+    def tearDown(self):
+        self.versions_patcher.stop()
+        self.clients_patcher.stop()
+
+    def test_get_client_reuses_instance_per_namespace(self):
+        """Test the same client view is returned for the same namespace."""
+        first = get_client("team-a", V1_ALPHA1)
+        second = get_client("team-a", V1_ALPHA1)
+        other = get_client("team-b", V1_ALPHA1)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(other.namespace, "team-b")
+
+    def test_get_client_unknown_version(self):
+        """Test an unknown version raises an error."""
+        with self.assertRaises(Exception) as context:
+            get_client("default", "v9")
+
+        self.assertIn("No client for v9", str(context.exception))
+
+    @patch('ark_sdk.client.get_api_client_pool')
+    def test_close_clients(self, mock_get_pool):
+        """Test closing drops cached clients and closes the pool."""
+        mock_get_pool.return_value.close = AsyncMock()
+        get_client("team-a", V1_ALPHA1)
+
+        asyncio.run(close_clients())
+
+        self.assertEqual(ark_client_module._clients, {})
+        mock_get_pool.return_value.close.assert_awaited_once()
+
+
+class TestApiClientPool(unittest.TestCase):
+    """Test cases for ApiClientPool."""
+
+    def test_pool_size_from_environment(self):
+        """Test the pool size can be configured through the environment."""
+        with patch.dict('os.environ', {'ARK_K8S_POOL_MAXSIZE': '64'}):
+            pool = ApiClientPool()
+
+        self.assertEqual(pool.pool_maxsize, 64)
+
+    @patch('ark_sdk.k8s.sync_client.ApiClient')
+    def test_sync_api_client_is_shared(self, mock_api_client):
+        """Test the sync ApiClient is created once and reused."""
+        pool = ApiClientPool(pool_maxsize=8)
+
+        first = pool.get_sync_api_client()
+        second = pool.get_sync_api_client()
+
+        self.assertIs(first, second)
+        mock_api_client.assert_called_once()
+        configuration = mock_api_client.call_args[0][0]
+        self.assertEqual(configuration.connection_pool_maxsize, 8)
+
+    @patch('ark_sdk.k8s.ApiClient')
+    def test_async_api_client_is_shared_on_same_loop(self, mock_api_client):
+        """Test the async ApiClient is reused across calls on the same loop."""
+        mock_api_client.return_value.close = AsyncMock()
+        pool = ApiClientPool()
+
+        async def use_pool():
+            async with pool.api_client() as first:
+                pass
+            async with pool.api_client() as second:
+                pass
+            await pool.close()
+            return first, second
+
+        first, second = asyncio.run(use_pool())
+
+        self.assertIs(first, second)
+        mock_api_client.assert_called_once()
+        mock_api_client.return_value.close.assert_awaited_once()
+
+    @patch('ark_sdk.k8s.ApiClient')
+    def test_ephemeral_loop_does_not_own_pool(self, mock_api_client):
+        """Test sync callers running on a throwaway loop don't populate the pool."""
+        pool = ApiClientPool()
+
+        async def use_pool():
+            async with pool.api_client():
+                pass
+
+        run_on_ephemeral_loop(use_pool())
+
+        self.assertIsNone(pool._async_api_client)
+
+
+if __name__ == '__main__':
+    unittest.main()
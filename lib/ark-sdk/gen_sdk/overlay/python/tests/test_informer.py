@@ -0,0 +1,327 @@
+"""Tests for the informer-backed read cache."""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from kubernetes_asyncio.client.rest import ApiException
+
+from ark_sdk.informer import Informer, InformerRegistry, _parse_label_selector, register_indexer, wait_for_change
+
+
+def make_obj(name, resource_version="1", labels=None):
+    return {
+        "metadata": {
+            "name": name,
+            "resourceVersion": resource_version,
+            "labels": labels or {},
+        }
+    }
+
+
+class FakeWatch:
+    """Watch replacement that replays a fixed list of events or raises."""
+
+    def __init__(self, rounds):
+        self.rounds = rounds
+
+    def __call__(self):
+        return self
+
+    def stream(self, func, **kwargs):
+        outcome = self.rounds.pop(0)
+
+        async def generate():
+            if isinstance(outcome, Exception):
+                raise outcome
+            for event in outcome:
+                yield event
+            # Keep the informer parked once all scripted events are delivered
+            if not self.rounds:
+                await asyncio.Event().wait()
+
+        return generate()
+
+    async def close(self):
+        pass
+
+
+class TestLabelSelector(unittest.TestCase):
+    """Test cases for local label selector parsing."""
+
+    def test_equality_terms(self):
+        self.assertEqual(
+            _parse_label_selector("app=web,tier!=db,env==prod,managed,!legacy"),
+            [
+                ("app", "=", "web"),
+                ("tier", "!=", "db"),
+                ("env", "=", "prod"),
+                ("managed", "exists", None),
+                ("legacy", "!", None),
+            ],
+        )
+
+    def test_set_based_selector_is_not_supported(self):
+        self.assertIsNone(_parse_label_selector("env in (prod,staging)"))
+
+
+class TestInformer(unittest.TestCase):
+    """Test cases for Informer store handling."""
+
+    def setUp(self):
+        self.informer = Informer("ark.mckinsey.com", "v1alpha1", "agents", "default")
+
+    def test_apply_and_list_with_selector(self):
+        self.informer.apply("ADDED", make_obj("a", labels={"team": "x"}))
+        self.informer.apply("ADDED", make_obj("b", labels={"team": "y"}))
+
+        self.assertEqual([o["metadata"]["name"] for o in self.informer.list("team=x")], ["a"])
+        self.assertEqual(len(self.informer.list()), 2)
+        self.assertIsNone(self.informer.list("team in (x)"))
+
+    def test_apply_ignores_stale_versions(self):
+        self.informer.apply("ADDED", make_obj("a", "5"))
+        self.informer.apply("MODIFIED", make_obj("a", "4"))
+
+        self.assertEqual(self.informer.get("a")["metadata"]["resourceVersion"], "5")
+
+    def test_replace_emits_differences(self):
+        events = []
+        self.informer.add_event_handler(lambda t, o: events.append((t, o["metadata"]["name"])))
+        self.informer.apply("ADDED", make_obj("keep", "1"))
+        self.informer.apply("ADDED", make_obj("change", "1"))
+        self.informer.apply("ADDED", make_obj("gone", "1"))
+        events.clear()
+
+        self.informer._replace([make_obj("keep", "1"), make_obj("change", "2"), make_obj("new", "3")])
+
+        self.assertEqual(
+            sorted(events),
+            [("ADDED", "new"), ("DELETED", "gone"), ("MODIFIED", "change")],
+        )
+        self.assertIsNone(self.informer.get("gone"))
+
+    def test_list_watch_and_relist_on_410(self):
+        list_results = [
+            {"metadata": {"resourceVersion": "10"}, "items": [make_obj("a", "10")]},
+            {"metadata": {"resourceVersion": "30"}, "items": [make_obj("b", "30")]},
+        ]
+        custom_api = MagicMock()
+        custom_api.list_namespaced_custom_object = AsyncMock(side_effect=list_results)
+        fake_watch = FakeWatch([
+            [{"type": "ADDED", "raw_object": make_obj("c", "11")}],
+            ApiException(status=410, reason="Gone"),
+            [],
+        ])
+
+        pool = MagicMock()
+        pool.api_client.return_value.__aenter__ = AsyncMock()
+        pool.api_client.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        async def run():
+            with patch("ark_sdk.informer.get_api_client_pool", return_value=pool), \
+                 patch("ark_sdk.informer.client.CustomObjectsApi", return_value=custom_api), \
+                 patch("ark_sdk.informer.watch.Watch", fake_watch):
+                self.informer.start()
+                self.assertTrue(await self.informer.wait_for_sync(timeout=1))
+                for _ in range(100):
+                    if custom_api.list_namespaced_custom_object.await_count == 2 and not fake_watch.rounds:
+                        break
+                    await asyncio.sleep(0.01)
+                await self.informer.stop()
+
+        asyncio.run(run())
+
+        self.assertEqual(custom_api.list_namespaced_custom_object.await_count, 2)
+        self.assertEqual(sorted(o["metadata"]["name"] for o in self.informer.list()), ["b"])
+        self.assertEqual(self.informer.resource_version, "30")
+
+
+class TestInformerIndexes(unittest.TestCase):
+    """Test cases for secondary indexes."""
+
+    def test_query_indexes_follow_changes(self):
+        informer = Informer("ark.mckinsey.com", "v1alpha1", "queries", "default")
+        query = make_obj("q1", "1")
+        query["spec"] = {"sessionId": "s1", "target": {"type": "agent", "name": "helper"}}
+        informer.apply("ADDED", query)
+
+        self.assertEqual([o["metadata"]["name"] for o in informer.by_index("sessionId", "s1")], ["q1"])
+        self.assertEqual(len(informer.by_index("target", "agent/helper")), 1)
+
+        moved = make_obj("q1", "2")
+        moved["spec"] = {"sessionId": "s2"}
+        informer.apply("MODIFIED", moved)
+
+        self.assertEqual(informer.by_index("sessionId", "s1"), [])
+        self.assertEqual(len(informer.by_index("sessionId", "s2")), 1)
+        self.assertEqual(informer.by_index("target", "agent/helper"), [])
+
+        informer.apply("DELETED", moved)
+        self.assertEqual(informer.by_index("sessionId", "s2"), [])
+
+    def test_agent_skill_tag_index(self):
+        informer = Informer("ark.mckinsey.com", "v1alpha1", "agents", "default")
+        agent = make_obj("researcher")
+        agent["metadata"]["annotations"] = {
+            "a2a.mckinsey.com/skills": '[{"name": "Search", "tags": ["search", "web"]}]'
+        }
+        informer.apply("ADDED", agent)
+
+        self.assertEqual(len(informer.by_index("skillTag", "web")), 1)
+        self.assertEqual(informer.by_index("skillTag", "general"), [])
+
+    def test_unknown_index(self):
+        informer = Informer("ark.mckinsey.com", "v1alpha1", "agents", "default")
+
+        with self.assertRaises(ValueError):
+            informer.by_index("missing", "key")
+
+    def test_register_indexer(self):
+        with patch.dict("ark_sdk.informer.INDEXERS", {}, clear=False):
+            register_indexer("models", "type", lambda obj: [obj.get("spec", {}).get("type", "")])
+            informer = Informer("ark.mckinsey.com", "v1alpha1", "models", "default")
+            model = make_obj("gpt")
+            model["spec"] = {"type": "openai"}
+            informer.apply("ADDED", model)
+
+            self.assertEqual(len(informer.by_index("type", "openai")), 1)
+
+    def test_core_events_informer(self):
+        with patch.dict("ark_sdk.informer.INDEXERS", {}, clear=False):
+            register_indexer("events", "name", lambda obj: [obj.get("involvedObject", {}).get("name", "")])
+            informer = Informer("", "v1", "events", "default")
+
+            response = MagicMock()
+            response.read = AsyncMock(return_value=b'{"metadata": {"resourceVersion": "5"}, "items": []}')
+            core_api = MagicMock()
+            core_api.list_namespaced_event = AsyncMock(return_value=response)
+
+            async def run():
+                with patch("ark_sdk.informer.client.CoreV1Api", return_value=core_api):
+                    await informer._list(MagicMock())
+
+            asyncio.run(run())
+
+            core_api.list_namespaced_event.assert_awaited_once_with(_preload_content=False, namespace="default")
+            self.assertEqual(informer.resource_version, "5")
+
+            for name, target in (("e1", "agent-a"), ("e2", "agent-b")):
+                event = make_obj(name)
+                event["involvedObject"] = {"name": target}
+                informer.apply("ADDED", event)
+
+            self.assertEqual(sorted(informer.index_keys("name")), ["agent-a", "agent-b"])
+
+
+class TestInformerRegistry(unittest.TestCase):
+    """Test cases for InformerRegistry."""
+
+    def test_disabled_registry_serves_nothing(self):
+        registry = InformerRegistry(enabled=False)
+
+        async def run():
+            return registry.get_synced("ark.mckinsey.com", "v1alpha1", "agents", "default")
+
+        self.assertIsNone(asyncio.run(run()))
+
+    def test_enabled_from_environment(self):
+        with patch.dict("os.environ", {"ARK_SDK_INFORMER_CACHE": "true"}):
+            self.assertTrue(InformerRegistry().enabled)
+
+    def test_get_synced_returns_informer_after_sync(self):
+        registry = InformerRegistry(enabled=True)
+
+        async def run():
+            with patch.object(Informer, "start"):
+                first = registry.get_synced("ark.mckinsey.com", "v1alpha1", "agents", "default")
+                informer = registry.get_informer("ark.mckinsey.com", "v1alpha1", "agents", "default")
+                informer._replace([make_obj("a")])
+                informer._synced.set()
+                second = registry.get_synced("ark.mckinsey.com", "v1alpha1", "agents", "default")
+                registry.observe("ark.mckinsey.com", "v1alpha1", "agents", "default", "ADDED", make_obj("b", "2"))
+                return first, second, informer
+
+        first, second, informer = asyncio.run(run())
+
+        self.assertIsNone(first)
+        self.assertIs(second, informer)
+        self.assertIsNotNone(informer.get("b"))
+
+    def test_released_informer_stops_without_read_cache(self):
+        registry = InformerRegistry(enabled=False)
+        key = ("ark.mckinsey.com", "v1alpha1", "agents", "default")
+
+        async def run():
+            with patch.object(Informer, "start"), patch.object(Informer, "stop", new_callable=AsyncMock) as stop:
+                first = registry.acquire(*key)
+                second = registry.acquire(*key)
+                await registry.release(*key)
+                stopped_early = stop.await_count
+                await registry.release(*key)
+                return first, second, stopped_early, stop.await_count
+
+        first, second, stopped_early, stopped = asyncio.run(run())
+
+        self.assertIs(first, second)
+        self.assertEqual(stopped_early, 0)
+        self.assertEqual(stopped, 1)
+        self.assertIsNot(asyncio.run(self._acquire(registry, key)), first)
+
+    def test_released_informer_kept_for_read_cache(self):
+        registry = InformerRegistry(enabled=True)
+        key = ("ark.mckinsey.com", "v1alpha1", "agents", "default")
+
+        async def run():
+            with patch.object(Informer, "start"), patch.object(Informer, "stop", new_callable=AsyncMock) as stop:
+                informer = registry.acquire(*key)
+                await registry.release(*key)
+                return informer, stop.await_count, registry.get_informer(*key)
+
+        informer, stopped, current = asyncio.run(run())
+
+        self.assertEqual(stopped, 0)
+        self.assertIs(current, informer)
+
+    @staticmethod
+    async def _acquire(registry, key):
+        with patch.object(Informer, "start"):
+            return registry.acquire(*key)
+
+
+class TestWaitForChange(unittest.TestCase):
+    """Test cases for single-object change watches."""
+
+    def test_skips_bookmarks_on_dedicated_client(self):
+        fake_watch = FakeWatch([[
+            {"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "12"}}},
+            {"type": "MODIFIED", "raw_object": make_obj("cfg", "13")},
+        ]])
+        api_client = MagicMock()
+        api_client.__aenter__ = AsyncMock(return_value=api_client)
+        api_client.__aexit__ = AsyncMock(return_value=False)
+        pool = MagicMock()
+
+        with patch("ark_sdk.informer.get_api_client_pool", return_value=pool), \
+             patch("ark_sdk.informer.client.ApiClient", return_value=api_client), \
+             patch("ark_sdk.informer.watch.Watch", fake_watch):
+            event = asyncio.run(wait_for_change(MagicMock(), "list_namespaced_config_map", "11", namespace="default"))
+
+        self.assertEqual(event, "MODIFIED")
+        api_client.__aexit__.assert_awaited_once()
+        pool.api_client.assert_not_called()
+
+    def test_watch_error_reported(self):
+        fake_watch = FakeWatch([ApiException(status=403, reason="Forbidden")])
+        api_client = MagicMock()
+        api_client.__aenter__ = AsyncMock(return_value=api_client)
+        api_client.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("ark_sdk.informer.client.ApiClient", return_value=api_client), \
+             patch("ark_sdk.informer.watch.Watch", fake_watch):
+            event = asyncio.run(wait_for_change(MagicMock(), "list_namespaced_service", "11", namespace="default"))
+
+        self.assertEqual(event, "ERROR")
+
+
+if __name__ == '__main__':
+    unittest.main()
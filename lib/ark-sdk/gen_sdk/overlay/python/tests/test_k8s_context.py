@@ -0,0 +1,105 @@
+"""Tests for the cached Kubernetes context provider."""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from kubernetes import config as kube_config
+
+from ark_sdk.k8s import ContextProvider, get_context, set_context_provider
+
+KUBECONFIG = """apiVersion: v1
+kind: Config
+current-context: dev
+contexts:
+- name: dev
+  context:
+    cluster: {cluster}
+    namespace: {namespace}
+    user: dev
+clusters:
+- name: {cluster}
+  cluster:
+    server: https://127.0.0.1:6443
+users:
+- name: dev
+  user: {{}}
+"""
+
+
+class TestContextProvider(unittest.TestCase):
+    """Test cases for ContextProvider."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ns_path = os.path.join(self.tmpdir.name, "namespace")
+        self.kubeconfig = os.path.join(self.tmpdir.name, "config")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, path, content, mtime):
+        with open(path, "w") as f:
+            f.write(content)
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_kubeconfig_is_parsed_once_while_unchanged(self):
+        """Test repeated calls are served from the cache."""
+        self.write(self.kubeconfig, KUBECONFIG.format(cluster="kind", namespace="team-a"), 1_000_000_000)
+        provider = ContextProvider(ns_path=self.ns_path, kubeconfig=self.kubeconfig)
+
+        with patch('ark_sdk.k8s.config.list_kube_config_contexts', wraps=kube_config.list_kube_config_contexts) as mock_list:
+            first = provider.get()
+            second = provider.get()
+
+        self.assertEqual(first, {'namespace': 'team-a', 'cluster': 'kind'})
+        self.assertEqual(first, second)
+        mock_list.assert_called_once()
+
+    def test_reloads_when_kubeconfig_changes(self):
+        """Test a modified kubeconfig is picked up on the next call."""
+        self.write(self.kubeconfig, KUBECONFIG.format(cluster="kind", namespace="team-a"), 1_000_000_000)
+        provider = ContextProvider(ns_path=self.ns_path, kubeconfig=self.kubeconfig)
+        provider.get()
+
+        self.write(self.kubeconfig, KUBECONFIG.format(cluster="kind", namespace="team-b"), 2_000_000_000)
+
+        self.assertEqual(provider.get()['namespace'], 'team-b')
+
+    def test_in_cluster_namespace_takes_precedence(self):
+        """Test the service account namespace file wins once it appears."""
+        self.write(self.kubeconfig, KUBECONFIG.format(cluster="kind", namespace="team-a"), 1_000_000_000)
+        provider = ContextProvider(ns_path=self.ns_path, kubeconfig=self.kubeconfig)
+        provider.get()
+
+        self.write(self.ns_path, "ark-system\n", 1_000_000_000)
+
+        self.assertEqual(provider.get(), {'namespace': 'ark-system', 'cluster': None})
+
+    def test_fallback_to_default(self):
+        """Test the default namespace is used without any configuration."""
+        provider = ContextProvider(ns_path=self.ns_path, kubeconfig=self.kubeconfig)
+
+        self.assertEqual(provider.get(), {'namespace': 'default', 'cluster': None})
+
+    def test_result_is_a_copy(self):
+        """Test callers can't modify the cached context."""
+        self.write(self.ns_path, "ark-system", 1_000_000_000)
+        provider = ContextProvider(ns_path=self.ns_path, kubeconfig=self.kubeconfig)
+
+        provider.get()['namespace'] = 'changed'
+
+        self.assertEqual(provider.get()['namespace'], 'ark-system')
+
+    def test_set_context_provider_switches_context(self):
+        """Test tests can swap the process-wide provider."""
+        self.write(self.ns_path, "ark-system", 1_000_000_000)
+        previous = set_context_provider(ContextProvider(ns_path=self.ns_path, kubeconfig=self.kubeconfig))
+        try:
+            self.assertEqual(get_context()['namespace'], 'ark-system')
+        finally:
+            set_context_provider(previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Tests for the lazy exports of the generated ark_sdk packages."""
+import json
+import subprocess
+import sys
+import unittest
+
+
+def _loaded_modules(code: str) -> list:
+    """Run code in a fresh interpreter and return the ark_sdk modules it loaded."""
+    script = f"{code}\nimport json, sys\nprint(json.dumps([m for m in sys.modules if m.startswith('ark_sdk.')]))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for importing ark_sdk without loading every model."""
+
+    def test_import_does_not_load_models(self):
+        loaded = _loaded_modules("import ark_sdk, ark_sdk.models")
+
+        self.assertEqual([m for m in loaded if m.startswith("ark_sdk.models.")], [])
+
+    def test_model_is_loaded_on_first_use(self):
+        loaded = _loaded_modules("import ark_sdk\nprint(ark_sdk.AgentV1alpha1.__name__)")
+
+        self.assertIn("ark_sdk.models.agent_v1alpha1", loaded)
+        self.assertNotIn("ark_sdk.models.query_v1alpha1", loaded)
+
+    def test_exports_match_models_package(self):
+        import ark_sdk
+        import ark_sdk.models
+
+        self.assertIs(ark_sdk.AgentV1alpha1, ark_sdk.models.AgentV1alpha1)
+        self.assertIn("AgentV1alpha1", dir(ark_sdk))
+
+    def test_unknown_attribute_raises(self):
+        import ark_sdk
+
+        with self.assertRaises(AttributeError):
+            ark_sdk.NotAModel
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for the raw and trusted read helpers."""
+import unittest
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ark_sdk.projection import construct_model, project
+
+
+class Tool(BaseModel):
+    name: str
+    tool_type: Optional[str] = Field(default=None, alias="type")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class Spec(BaseModel):
+    model_ref: Optional[Dict[str, str]] = Field(default=None, alias="modelRef")
+    tools: Optional[List[Tool]] = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class Resource(BaseModel):
+    api_version: Optional[str] = Field(default=None, alias="apiVersion")
+    spec: Optional[Spec] = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class TestProject(unittest.TestCase):
+    """Test cases for field projection."""
+
+    def test_selects_nested_paths(self):
+        obj = {"metadata": {"name": "q", "uid": "1"}, "status": {"phase": "done", "responses": []}}
+
+        self.assertEqual(
+            project(obj, ["metadata.name", "status.phase", "spec.input"]),
+            {"metadata": {"name": "q"}, "status": {"phase": "done"}},
+        )
+
+    def test_projection_is_a_copy(self):
+        obj = {"spec": {"tools": [{"name": "a"}]}}
+
+        projected = project(obj, ["spec.tools"])
+        projected["spec"]["tools"].append({"name": "b"})
+
+        self.assertEqual(len(obj["spec"]["tools"]), 1)
+
+
+class TestConstructModel(unittest.TestCase):
+    """Test cases for trusted model construction."""
+
+    def test_builds_nested_models_from_aliases(self):
+        data = {"apiVersion": "v1", "spec": {"modelRef": {"name": "m"}, "tools": [{"name": "t", "type": "http"}]}}
+
+        resource = construct_model(Resource, data)
+
+        self.assertEqual(resource.api_version, "v1")
+        self.assertIsInstance(resource.spec, Spec)
+        self.assertIsInstance(resource.spec.tools[0], Tool)
+        self.assertEqual(resource.spec.tools[0].tool_type, "http")
+        self.assertEqual(resource.model_dump(by_alias=True, exclude_none=True), Resource(**data).model_dump(by_alias=True, exclude_none=True))
+
+    def test_skips_validation(self):
+        resource = construct_model(Tool, {"name": 42})
+
+        self.assertEqual(resource.name, 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 """Tests for token validator."""
+import asyncio
+import time
 import unittest
 from unittest.mock import patch, Mock, AsyncMock, MagicMock
+import httpx
 from jose import jwt
 from jose.exceptions import JWTError, ExpiredSignatureError, JWTClaimsError
-from ark_sdk.auth.validator import TokenValidator
+from ark_sdk.auth.validator import TokenValidator, _max_age
 from ark_sdk.auth.config import AuthConfig
 from ark_sdk.auth.exceptions import (
     TokenValidationError,
@@ -13,7 +16,18 @@ from ark_sdk.auth.exceptions import (
 )
 
 
-class TestTokenValidator(unittest.TestCase):
+def _mock_jwks_client(mock_client_class, jwks=None, headers=None, side_effect=None):
+    """Make httpx.AsyncClient return the given JWKS."""
+    response = Mock()
+    response.json.return_value = jwks
+    response.headers = headers or {}
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=response, side_effect=side_effect)
+    mock_client_class.return_value.__aenter__.return_value = client
+    return client
+
+
+class TestTokenValidator(unittest.IsolatedAsyncioTestCase):
     """Test cases for TokenValidator class."""
 
     def setUp(self):
@@ -31,58 +45,107 @@ class TestTokenValidator(unittest.TestCase):
         self.assertEqual(self.validator.config, self.config)
         self.assertIsNone(self.validator._jwks_cache)
 
-    @patch('ark_sdk.auth.validator.requests.get')
-    def test_fetch_jwks_success(self, mock_get):
+    @patch('ark_sdk.auth.validator.httpx.AsyncClient')
+    async def test_fetch_jwks_success(self, mock_client_class):
         """Test successful JWKS fetching."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"keys": [{"kid": "test-key-id", "kty": "RSA"}]}
-        mock_get.return_value = mock_response
+        client = _mock_jwks_client(
+            mock_client_class, {"keys": [{"kid": "test-key-id", "kty": "RSA"}]}, {"cache-control": "public, max-age=600"}
+        )
         
-        result = self.validator._fetch_jwks()
+        result = await self.validator._fetch_jwks()
         
-        self.assertEqual(result, {"keys": [{"kid": "test-key-id", "kty": "RSA"}]})
-        mock_get.assert_called_once_with(self.config.jwks_url, timeout=10)
+        self.assertEqual(result, ({"keys": [{"kid": "test-key-id", "kty": "RSA"}]}, 600))
+        client.get.assert_called_once_with(self.config.jwks_url)
 
-    def test_fetch_jwks_no_url(self):
+    async def test_fetch_jwks_no_url(self):
         """Test JWKS fetching with no URL configured."""
         config = AuthConfig(jwks_url=None)
         validator = TokenValidator(config)
         
         with self.assertRaises(TokenValidationError) as context:
-            validator._fetch_jwks()
+            await validator._fetch_jwks()
         
         self.assertIn("JWKS URL not configured", str(context.exception))
 
-    @patch('ark_sdk.auth.validator.requests.get')
-    def test_get_jwks_caching(self, mock_get):
+    @patch('ark_sdk.auth.validator.httpx.AsyncClient')
+    async def test_get_jwks_caching(self, mock_client_class):
         """Test that JWKS is cached after first fetch."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"keys": [{"kid": "test-key-id"}]}
-        mock_get.return_value = mock_response
+        client = _mock_jwks_client(mock_client_class, {"keys": [{"kid": "test-key-id"}]})
         
-        # First call
-        result1 = self.validator._get_jwks()
-        # Second call
-        result2 = self.validator._get_jwks()
+        # Concurrent first calls share one fetch
+        result1, result2 = await asyncio.gather(self.validator._get_jwks(), self.validator._get_jwks())
         
         self.assertEqual(result1, result2)
         # Should only be called once due to caching
-        mock_get.assert_called_once()
+        client.get.assert_called_once()
+
+    @patch('ark_sdk.auth.validator.httpx.AsyncClient')
+    async def test_get_jwks_expires_with_max_age(self, mock_client_class):
+        """Test that JWKS is fetched again once its Cache-Control max-age has passed."""
+        client = _mock_jwks_client(mock_client_class, {"keys": []}, {"cache-control": "max-age=60"})
+        
+        await self.validator._get_jwks()
+        with patch('ark_sdk.auth.validator.time.monotonic', return_value=time.monotonic() + 61):
+            await self.validator._get_jwks()
+        
+        self.assertEqual(client.get.call_count, 2)
 
-    @patch('ark_sdk.auth.validator.requests.get')
-    def test_fetch_jwks_exception(self, mock_get):
+    @patch('ark_sdk.auth.validator.jwk.construct')
+    @patch('ark_sdk.auth.validator.jwt.get_unverified_header')
+    @patch('ark_sdk.auth.validator.httpx.AsyncClient')
+    async def test_unknown_kid_refreshes_jwks_rate_limited(self, mock_client_class, mock_header, mock_construct):
+        """Test that an unknown kid refreshes the JWKS, but not again within the minimum interval."""
+        client = _mock_jwks_client(mock_client_class, {"keys": [{"kid": "old-key"}]})
+        client.get.return_value.json.side_effect = [{"keys": [{"kid": "old-key"}]}, {"keys": [{"kid": "new-key"}]}]
+        mock_construct.return_value.to_pem.return_value = b"new-pem"
+        await self.validator._get_jwks()
+        
+        with patch('ark_sdk.auth.validator.time.monotonic', return_value=time.monotonic() + 31):
+            mock_header.return_value = {"kid": "new-key"}
+            self.assertEqual(await self.validator._get_signing_key("token"), "new-pem")
+            
+            mock_header.return_value = {"kid": "unknown-key"}
+            with self.assertRaises(TokenValidationError):
+                await self.validator._get_signing_key("token")
+        self.assertEqual(client.get.call_count, 2)
+
+    @patch('ark_sdk.auth.validator.httpx.AsyncClient')
+    async def test_fetch_jwks_exception(self, mock_client_class):
         """Test JWKS fetching with exception."""
-        import requests
-        mock_get.side_effect = requests.RequestException("Network error")
+        _mock_jwks_client(mock_client_class, side_effect=httpx.ConnectError("Network error"))
         
         with self.assertRaises(TokenValidationError) as context:
-            self.validator._fetch_jwks()
+            await self.validator._fetch_jwks()
         
         self.assertIn("Failed to fetch JWKS", str(context.exception))
 
+    def test_max_age(self):
+        """Test Cache-Control max-age parsing."""
+        self.assertEqual(_max_age("public, max-age=3600"), 3600)
+        self.assertEqual(_max_age("no-store"), 0)
+        self.assertIsNone(_max_age("public"))
+        self.assertIsNone(_max_age(None))
+
+    @patch('ark_sdk.auth.validator.jwt.decode')
+    @patch.object(TokenValidator, '_get_signing_key')
+    async def test_verified_token_cached_until_exp(self, mock_get_signing_key, mock_decode):
+        """Test that a verified token is not verified again before it expires."""
+        mock_get_signing_key.return_value = "test-key"
+        mock_decode.return_value = {"sub": "test-user", "exp": time.time() + 60}
+        
+        await self.validator.validate_token("test-token")
+        result = await self.validator.validate_token("test-token")
+        
+        self.assertEqual(result["sub"], "test-user")
+        mock_decode.assert_called_once()
+        
+        with patch('ark_sdk.auth.validator.time.time', return_value=time.time() + 61):
+            await self.validator.validate_token("test-token")
+        self.assertEqual(mock_decode.call_count, 2)
+
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_success(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_success(self, mock_get_signing_key, mock_decode):
         """Test successful token validation."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
@@ -91,7 +154,7 @@ class TestTokenValidator(unittest.TestCase):
         mock_decode.return_value = mock_payload
         
         # Test
-        result = self.validator.validate_token("test-token")
+        result = await self.validator.validate_token("test-token")
         
         # Verify
         self.assertEqual(result, mock_payload)
@@ -112,7 +175,7 @@ class TestTokenValidator(unittest.TestCase):
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_fallback_to_jwt_config(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_fallback_to_jwt_config(self, mock_get_signing_key, mock_decode):
         """Test token validation falls back to JWT config when OKTA is not set."""
         # Setup config without audience/issuer values
         config = AuthConfig(
@@ -130,7 +193,7 @@ class TestTokenValidator(unittest.TestCase):
         mock_decode.return_value = mock_payload
         
         # Test
-        result = validator.validate_token("test-token")
+        result = await validator.validate_token("test-token")
         
         # Verify JWT values are used as fallback
         mock_decode.assert_called_once_with(
@@ -149,7 +212,7 @@ class TestTokenValidator(unittest.TestCase):
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_no_audience_issuer(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_no_audience_issuer(self, mock_get_signing_key, mock_decode):
         """Test token validation when no audience/issuer is configured."""
         # Setup config without audience/issuer
         config = AuthConfig(
@@ -167,7 +230,7 @@ class TestTokenValidator(unittest.TestCase):
         mock_decode.return_value = mock_payload
         
         # Test
-        result = validator.validate_token("test-token")
+        result = await validator.validate_token("test-token")
         
         # Verify audience/issuer verification is disabled
         mock_decode.assert_called_once_with(
@@ -185,7 +248,7 @@ class TestTokenValidator(unittest.TestCase):
         )
 
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_no_jwks_url(self, mock_get_signing_key):
+    async def test_validate_token_no_jwks_url(self, mock_get_signing_key):
         """Test token validation with no JWKS URL configured."""
         config = AuthConfig(jwks_url=None)
         validator = TokenValidator(config)
@@ -193,80 +256,80 @@ class TestTokenValidator(unittest.TestCase):
         mock_get_signing_key.side_effect = TokenValidationError("JWKS URL not configured")
         
         with self.assertRaises(TokenValidationError) as context:
-            validator.validate_token("test-token")
+            await validator.validate_token("test-token")
         
         self.assertIn("JWKS URL not configured", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_expired_signature(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_expired_signature(self, mock_get_signing_key, mock_decode):
         """Test token validation with expired signature."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = ExpiredSignatureError("Token has expired")
         
         with self.assertRaises(ExpiredTokenError) as context:
-            self.validator.validate_token("expired-token")
+            await self.validator.validate_token("expired-token")
         
         self.assertIn("Token has expired", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_invalid_token(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_invalid_token(self, mock_get_signing_key, mock_decode):
         """Test token validation with invalid token."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = JWTError("Invalid token")
         
         with self.assertRaises(InvalidTokenError) as context:
-            self.validator.validate_token("invalid-token")
+            await self.validator.validate_token("invalid-token")
         
         self.assertIn("Invalid token", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_decode_error(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_decode_error(self, mock_get_signing_key, mock_decode):
         """Test token validation with JWT claims error."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = JWTClaimsError("Invalid claims")
         
         with self.assertRaises(InvalidTokenError) as context:
-            self.validator.validate_token("malformed-token")
+            await self.validator.validate_token("malformed-token")
         
         self.assertIn("Invalid token claims", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_general_exception(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_general_exception(self, mock_get_signing_key, mock_decode):
         """Test token validation with general exception."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = Exception("Unexpected error")
         
         with self.assertRaises(TokenValidationError) as context:
-            self.validator.validate_token("bad-token")
+            await self.validator.validate_token("bad-token")
         
         self.assertIn("Token validation failed", str(context.exception))
 
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_jwks_exception(self, mock_get_signing_key):
+    async def test_validate_token_jwks_exception(self, mock_get_signing_key):
         """Test token validation when JWKS fetching raises exception."""
         mock_get_signing_key.side_effect = TokenValidationError("Failed to fetch JWKS")
         
         with self.assertRaises(TokenValidationError) as context:
-            self.validator.validate_token("test-token")
+            await self.validator.validate_token("test-token")
         
         self.assertIn("Failed to fetch JWKS", str(context.exception))
 
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_signing_key_exception(self, mock_get_signing_key):
+    async def test_validate_token_signing_key_exception(self, mock_get_signing_key):
         """Test token validation when getting signing key raises exception."""
         # Setup mocks
         mock_get_signing_key.side_effect = TokenValidationError("Unable to find key")
         
         with self.assertRaises(TokenValidationError) as context:
-            self.validator.validate_token("test-token")
+            await self.validator.validate_token("test-token")
         
         self.assertIn("Unable to find key", str(context.exception))
 
@@ -101,3 +101,58 @@ def generate_secret_client_addition() -> str:
     return '''        # Add secret client
         from .k8s import SecretClient
         self.secrets = SecretClient(namespace)'''
+
+
+LAZY_IMPORT_RE = re.compile(r'^from\s+([\w.]+)\s+import\s+(\w+)(?:\s+as\s+(\w+))?\s*(?:#.*)?$')
+
+
+def generate_lazy_init(source: str) -> str:
+    """Rewrite a generated package __init__.py so its exports are imported on first use"""
+    kept_lines = []
+    import_lines = []
+    exports = {}
+    for line in source.splitlines():
+        match = LAZY_IMPORT_RE.match(line)
+        if match and match.group(1) != '__future__':
+            module, attr, alias = match.groups()
+            exports[alias or attr] = (module, attr)
+            import_lines.append(line)
+        else:
+            kept_lines.append(line)
+    
+    if not exports:
+        return source
+    
+    type_checking_imports = '\n'.join(f'    {line}' for line in import_lines)
+    lazy_exports = '\n'.join(
+        f'    "{name}": ("{module}", "{attr}"),' for name, (module, attr) in exports.items()
+    )
+    
+    return '\n'.join(kept_lines).rstrip() + f'''
+
+# Exports are imported on first attribute access, so importing the package
+# doesn't load every generated model module
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+{type_checking_imports}
+
+_LAZY_EXPORTS = {{
+{lazy_exports}
+}}
+
+
+def __getattr__(name):
+    try:
+        module, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}") from None
+    value = getattr(_importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+'''
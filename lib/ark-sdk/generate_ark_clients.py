@@ -16,7 +16,8 @@ from gen_sdk import extract_api_versions
 from gen_sdk.python_sdk import (
     generate_base_client,
     generate_versioned_client,
-    generate_yaml_routing
+    generate_yaml_routing,
+    generate_lazy_init
 )
 from gen_sdk.python_sdk_tests import (
     generate_test_base,
@@ -29,11 +30,18 @@ from gen_sdk.python_sdk_tests import (
 def main():
     """Main function to generate ARK clients from OpenAPI schema"""
     parser = argparse.ArgumentParser(description='Generate ARK Client Classes from OpenAPI Schema')
-    parser.add_argument('schema_path', help='Path to OpenAPI schema JSON file')
+    parser.add_argument('schema_path', help='Path to OpenAPI schema JSON file (or package __init__.py with -l)')
     parser.add_argument('-v', '--version', action='store_true', help='Generate version info to stdout')
     parser.add_argument('-t', '--test', action='store_true', help='Generate unittest tests for the generated clients')
+    parser.add_argument('-l', '--lazy-init', action='store_true', help='Rewrite a generated package __init__.py with lazy exports to stdout')
     
     args = parser.parse_args()
+    if args.lazy_init: # Handle -l flag - no schema needed
+        print(f"Generating lazy exports for {args.schema_path}...", file=sys.stderr)
+        with open(args.schema_path, 'r') as f:
+            print(generate_lazy_init(f.read()), end='')
+        return
+
     # Load OpenAPI schema
     print(f"Loading OpenAPI schema from {args.schema_path}...", file=sys.stderr)
     with open(args.schema_path, 'r') as f:
@@ -5,7 +5,8 @@ from fastapi import APIRouter
 from kubernetes_asyncio import client
 from kubernetes_asyncio.client.api_client import ApiClient
 
-from ..models.health import HealthResponse, ReadinessResponse
+from ..models.health import HealthResponse, ReadinessResponse, HTTPClientStatsResponse
+from ..utils.http_clients import get_http_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -38,3 +39,14 @@ async def readiness_check() -> ReadinessResponse:
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
         return ReadinessResponse(status="not ready", service="ark-api", error="An internal error occurred during readiness check.")
+
+
+@router.get("/health/http-clients", response_model=HTTPClientStatsResponse)
+async def http_client_stats() -> HTTPClientStatsResponse:
+    """
+    Reports the connection pool usage of the shared HTTP clients used for
+    broker, memory, proxy and streaming calls.
+
+    Returns: HTTPClientStatsResponse: Pool usage per upstream
+    """
+    return HTTPClientStatsResponse(pools=get_http_client_registry().stats())
@@ -1,22 +1,29 @@
 import asyncio
-import contextlib
+import copy
 import logging
 import os
 import threading
+from typing import Dict, Optional
 
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
-from ark_sdk.k8s import get_namespace, is_k8s
+from a2a.types import AgentCard
+from ark_sdk.client import V1_ALPHA1
+from ark_sdk.informer import Informer, get_informer_registry
+from ark_sdk.k8s import get_namespace
+from ark_sdk.models.agent_v1alpha1 import AgentV1alpha1
 from starlette.applications import Starlette
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from ....core.constants import GROUP
 from .execution import ARKAgentExecutor
-from .registry import get_registry
+from .registry import ark_to_agent_card
 
 logger = logging.getLogger(__name__)
 
-POLL_INTERVAL = 30 if is_k8s() else int(os.getenv('A2A_POLL_INTERVAL_SECONDS', 3))
+# Seconds to wait for the initial list of agents at startup
+A2A_SYNC_TIMEOUT = float(os.getenv('A2A_SYNC_TIMEOUT', '30.0'))
 
 
 class ProxyApp:
@@ -27,7 +34,8 @@ class ProxyApp:
     Architecture:
     - FastAPI mounts this ProxyApp at /agent (stable mount point)
     - ProxyApp holds a reference to a Starlette app containing all agent routes
-    - When agents change, we create a new Starlette app and atomically swap it
+    - When agents change, we create a new Starlette app over the agents'
+      sub-applications and atomically swap it
     
     Why this is necessary:
     - Starlette's routing wasn't designed for concurrent modification
@@ -83,116 +91,101 @@ class ProxyApp:
 
 
 class DynamicManager:
+    """Mounts one A2A sub-application per Agent, kept current by a watch on Agents.
+
+    A change to an Agent only rebuilds that agent's sub-application. Its request
+    handler, and with it the task store of its in-flight tasks, is kept until
+    the Agent is deleted. Changes arriving together are published as one
+    route swap.
+    """
+
     def __init__(self):
-        self.agents = {}
-        self.lock = threading.Lock()
+        self.agents: Dict[str, AgentCard] = {}
         self.app = ProxyApp()  # Use proxy instead of Starlette
-        self.registry = get_registry()
-        self._refresh_task = None
-        self._running = False
-
-    async def start_periodic_sync(self):
-        """Start the periodic registry sync task"""
-        if self._refresh_task is None:
-            self._running = True
-            self._refresh_task = asyncio.create_task(self._periodic_sync_loop())
-            logger.info(f"Started periodic registry sync task ({POLL_INTERVAL}s)")
-    
-    async def stop_periodic_sync(self):
-        """Stop the periodic registry sync task"""
-        self._running = False
-        if self._refresh_task:
-            self._refresh_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._refresh_task
-            self._refresh_task = None
-            logger.info("Stopped periodic registry sync task")
-    
-    async def _periodic_sync_loop(self):
-        """Periodically sync agents with registry every 30 seconds"""
-        while self._running:
-            try:
-                await self._sync_with_registry()
-            except Exception as e:
-                logger.error(f"Error during registry sync: {e}", exc_info=True)
-            
-            # Wait N seconds before next sync
-            try:
-                await asyncio.sleep(POLL_INTERVAL)
-            except asyncio.CancelledError:
-                break
-    
-    async def _sync_with_registry(self):
-        """Sync agents with registry and update routes if needed"""
-        try:
-            # Get current agents from registry
-            logger.debug("Fetching agents from registry...")
-            agent_cards = await self.registry.list_agents()
-            registry_agents = {card.name: card for card in agent_cards}
-            
-            # Check for changes
-            changes_detected = False
-            
-            with self.lock:
-                current_names = set(self.agents.keys())
-                registry_names = set(registry_agents.keys())
-                
-                # Find agents to remove
-                to_remove = current_names - registry_names
-                for name in to_remove:
-                    del self.agents[name]
-                    logger.info(f"Removed agent: {name}")
-                    changes_detected = True
-                
-                # Find agents to add or update
-                for name, card in registry_agents.items():
-                    if name not in self.agents or self.agents[name] != card:
-                        self.agents[name] = card
-                        logger.info(f"Added/Updated agent: {name}")
-                        changes_detected = True
-            
-            # Only update routes if changes were detected
-            if changes_detected:
-                logger.info("Agent changes detected, updating routes...")
-                self._update_routes()
-            else:
-                logger.debug("No agent changes detected, routes unchanged")
-                
-        except Exception as e:
-            logger.error(f"Failed to sync with registry: {e}", exc_info=True)
+        self.namespace = get_namespace()
+        self._handlers: Dict[str, DefaultRequestHandler] = {}
+        self._servers: Dict[str, ASGIApp] = {}
+        self._informer: Optional[Informer] = None
+        self._publish_pending = False
 
     async def initialize(self):
-        """Initialize the manager with agents from registry and start periodic sync"""
-        # Do initial sync
-        await self._sync_with_registry()
-        
-        # Start periodic sync task
-        await self.start_periodic_sync()
-    
+        """Start watching agents and mount the routes of those already present"""
+        informer = get_informer_registry().acquire(GROUP, V1_ALPHA1, "agents", self.namespace)
+        informer.add_event_handler(self._on_agent_change)
+        self._informer = informer
+        if informer.has_synced:
+            # Listed before the handler was added, so there are no events for these
+            for obj in informer.list() or []:
+                self._on_agent_change("ADDED", obj)
+        elif not await informer.wait_for_sync(A2A_SYNC_TIMEOUT):
+            logger.warning("Timed out listing agents, their A2A routes are added once the list completes")
+        self._publish_routes()
+
     async def shutdown(self):
-        """Shutdown the manager and stop periodic sync"""
-        await self.stop_periodic_sync()
+        """Stop following agent changes"""
+        if self._informer is not None:
+            self._informer.remove_event_handler(self._on_agent_change)
+            self._informer = None
+            await get_informer_registry().release(GROUP, V1_ALPHA1, "agents", self.namespace)
 
-    def _update_routes(self):
-        # Create a new Starlette app with all routes
-        new_app = Starlette()
-        
-        # Add routes for each agent
-        for name, agent_card in self.agents.items():
-            request_handler = DefaultRequestHandler(
-                agent_executor=ARKAgentExecutor(name, get_namespace()),
-                task_store=InMemoryTaskStore(),
-            )
+    def _on_agent_change(self, event_type: str, obj: dict):
+        """Add, update or remove the sub-application of one agent"""
+        name = obj["metadata"]["name"]
+        if event_type == "DELETED":
+            if self.agents.pop(name, None) is None:
+                return
+            # In-flight requests keep their reference to the removed app
+            del self._servers[name]
+            del self._handlers[name]
+            logger.info(f"Removed agent: {name}")
+        else:
+            try:
+                # The informer's objects are shared and the card conversion modifies skills
+                agent_card = ark_to_agent_card(AgentV1alpha1(**copy.deepcopy(obj)))
+            except Exception as e:
+                logger.warning(f"Unable to build agent card for {name}: {e}")
+                return
+            if self.agents.get(name) == agent_card:
+                # e.g. a status update, nothing the gateway serves changed
+                return
+
+            request_handler = self._handlers.get(name)
+            if request_handler is None:
+                request_handler = self._handlers[name] = DefaultRequestHandler(
+                    agent_executor=ARKAgentExecutor(name, self.namespace),
+                    task_store=InMemoryTaskStore(),
+                )
 
             server = A2AStarletteApplication(
                 agent_card=agent_card,
                 http_handler=request_handler
             )
+            self._servers[name] = server.build()
+            self.agents[name] = agent_card
+            logger.info(f"Added/Updated agent: {name}")
+
+        self._schedule_publish()
+
+    def _schedule_publish(self):
+        # A relist notifies every changed agent in one go, swap the routes once after it
+        if not self._publish_pending:
+            self._publish_pending = True
+            asyncio.get_running_loop().call_soon(self._flush_routes)
 
-            new_app.mount(f"/{name}/", server.build())
+    def _flush_routes(self):
+        # Already published if initialize() swapped the routes in the meantime
+        if self._publish_pending:
+            self._publish_routes()
+
+    def _publish_routes(self):
+        self._publish_pending = False
+
+        # Mount the existing sub-applications, only changed agents were rebuilt
+        new_app = Starlette()
+        for name, server in self._servers.items():
+            new_app.mount(f"/{name}/", server)
 
         # Atomically swap the entire app
         self.app.set_app(new_app)
-        
-        logger.info(f"Updated routes - Active agents: {list(self.agents.keys())}")
 
+        logger.info(f"Updated routes - Active agents: {list(self.agents.keys())}")
@@ -86,6 +86,11 @@ class AgentRegistry:
         agents = await self.list_agents()
         return [agent for agent in agents if any(capability in skill.name for skill in agent.skills)]
 
+    async def find_agents_by_skill_tag(self, tag: str) -> list[AgentCard]:
+        async with with_ark_client(self._namespace, V1_ALPHA1) as ark_client:
+            agents = await ark_client.agents.a_list_by_index("skillTag", tag)
+            return [ark_to_agent_card(a) for a in agents]
+
 @functools.lru_cache(maxsize=1)
 def get_registry():
     return AgentRegistry(get_namespace())
@@ -3,7 +3,7 @@ import logging
 import json
 import re
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Header, Query
 from typing import Optional
 from ark_sdk.models.agent_v1alpha1 import AgentV1alpha1
 
@@ -18,7 +18,10 @@ from ...models.agents import (
     ModelRef
 )
 from ...models.common import extract_availability_from_conditions
+from ...core.constants import GROUP
+from ...utils.resource_watch import watch_response
 from ...constants.annotations import A2A_SERVER_ADDRESS_ANNOTATION
+from ...utils.etag import ConditionalGet, collection_etag, resource_etag
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -103,22 +106,35 @@ def agent_to_detail_response(agent: dict) -> AgentDetailResponse:
 
 @router.get("", response_model=AgentListResponse)
 @handle_k8s_errors(operation="list", resource_type="agent")
-async def list_agents(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> AgentListResponse:
+async def list_agents(
+    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
+    watch: bool = Query(False, description="Stream changes as server-sent events instead of returning the list"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
+    conditional: ConditionalGet = Depends(),
+) -> AgentListResponse:
     """
     List all Agent CRs in a namespace.
 
     Args:
         namespace: The namespace to list agents from (defaults to current context)
+        watch: Stream added, modified and deleted agents as server-sent events
+        last_event_id: Event id to resume a watch stream from
         
     Returns:
         AgentListResponse: List of all agents in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        agents = await ark_client.agents.a_list()
+        if watch:
+            return await watch_response(GROUP, VERSION, "agents", ark_client.namespace, agent_to_response, last_event_id)
+
+        agents = await ark_client.agents.a_list(raw=True)
+        not_modified = conditional.not_modified(collection_etag(agents))
+        if not_modified:
+            return not_modified
         
         agent_list = []
         for agent in agents:
-            agent_list.append(agent_to_response(agent.to_dict()))
+            agent_list.append(agent_to_response(agent))
         
         return AgentListResponse(
             items=agent_list,
@@ -178,7 +194,7 @@ async def create_agent(body: AgentCreateRequest, namespace: Optional[str] = Quer
 
 @router.get("/{agent_name}", response_model=AgentDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="agent")
-async def get_agent(agent_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> AgentDetailResponse:
+async def get_agent(agent_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> AgentDetailResponse:
     """
     Get a specific Agent CR by name.
     
@@ -190,9 +206,12 @@ async def get_agent(agent_name: str, namespace: Optional[str] = Query(None, desc
         AgentDetailResponse: The agent details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        agent = await ark_client.agents.a_get(agent_name)
+        agent = await ark_client.agents.a_get(agent_name, raw=True)
+        not_modified = conditional.not_modified(resource_etag(agent))
+        if not_modified:
+            return not_modified
         
-        return agent_to_detail_response(agent.to_dict())
+        return agent_to_detail_response(agent)
 
 
 @router.put("/{agent_name}", response_model=AgentDetailResponse)
@@ -1,16 +1,24 @@
 """Broker API endpoints for real-time streaming of traces, messages, and chunks."""
+import asyncio
 import json
 import logging
 import os
-from typing import Optional
+from contextlib import aclosing
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlencode
 
 import httpx
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query
 from fastapi.responses import StreamingResponse, JSONResponse
 
 from ark_sdk.client import with_ark_client
+from ark_sdk.informer import wait_for_change
+from kubernetes_asyncio import client as k8s_client
 
+from ...core.constants import GROUP
+from ...utils.http_clients import BROKER, get_http_client
+from ...utils.sse_fanout import get_sse_fanout_hub
+from ...utils.streaming import SSE_HEARTBEAT_INTERVAL, SSERelay, sse_body
 from ...utils.memory_client import get_memory_service_address, get_all_memory_resources
 
 logger = logging.getLogger(__name__)
@@ -26,15 +34,81 @@ sse_headers = {
 }
 
 
+class BrokerUrlCache:
+    """
+    Resolved broker URLs by (namespace, memory name).
+
+    Each entry is kept until a watch on its Memory resource sees it change,
+    so broker calls don't have to list Memory resources on every request.
+    """
+
+    def __init__(self):
+        self._urls: Dict[Tuple[str, str], str] = {}
+        self._watches: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    def get(self, namespace: str, memory_name: str) -> Optional[str]:
+        """Get a cached broker URL."""
+        return self._urls.get((namespace, memory_name))
+
+    def put(self, namespace: str, memory_name: str, url: str, resource_version: Optional[str]):
+        """Cache a broker URL resolved from a Memory at the given resourceVersion."""
+        if not resource_version:
+            return
+        key = (namespace, memory_name)
+        self.invalidate(key)
+        self._urls[key] = url
+        self._watches[key] = asyncio.create_task(self._invalidate_on_change(key, resource_version))
+
+    async def _invalidate_on_change(self, key: Tuple[str, str], resource_version: str):
+        namespace, memory_name = key
+        await wait_for_change(
+            k8s_client.CustomObjectsApi,
+            "list_namespaced_custom_object",
+            resource_version,
+            group=GROUP,
+            version=VERSION,
+            namespace=namespace,
+            plural="memories",
+            field_selector=f"metadata.name={memory_name}",
+        )
+        self._urls.pop(key, None)
+        self._watches.pop(key, None)
+
+    def invalidate(self, key: Optional[Tuple[str, str]] = None):
+        """Drop one cached URL, or all of them."""
+        keys = [key] if key is not None else list(self._watches)
+        for k in keys:
+            self._urls.pop(k, None)
+            task = self._watches.pop(k, None)
+            if task is not None:
+                task.cancel()
+
+
+_broker_url_cache: Optional[BrokerUrlCache] = None
+
+def get_broker_url_cache() -> BrokerUrlCache:
+    """Get the process-wide broker URL cache."""
+    global _broker_url_cache
+    if _broker_url_cache is None:
+        _broker_url_cache = BrokerUrlCache()
+    return _broker_url_cache
+
+
 async def get_broker_url(memory_name: str) -> Optional[str]:
     """Get the broker URL from a Memory resource."""
     try:
         async with with_ark_client(None, VERSION) as client:
+            cache = get_broker_url_cache()
+            cached = cache.get(client.namespace, memory_name)
+            if cached:
+                return cached
             memory_dicts = await get_all_memory_resources(client, memory_name)
             if not memory_dicts:
                 logger.warning(f"No memory resource found with name: {memory_name}")
                 return None
-            return get_memory_service_address(memory_dicts[0])
+            url = get_memory_service_address(memory_dicts[0])
+            cache.put(client.namespace, memory_name, url, memory_dicts[0].get("metadata", {}).get("resourceVersion"))
+            return url
     except Exception as e:
         logger.error(f"Failed to get memory service address: {e}")
         return None
@@ -49,31 +123,66 @@ def format_error_response(response_text: str, status_code: int, reason_phrase: s
         return {'error': {'message': f'{status_code} {reason_phrase}', 'type': 'server_error'}}
 
 
-async def proxy_sse_stream(url: str):
-    """Proxy SSE stream from broker service."""
+async def proxy_sse_stream(url: str, heartbeat_interval: Optional[float] = SSE_HEARTBEAT_INTERVAL):
+    """Proxy SSE stream from broker service.
+
+    Broker chunks are relayed byte for byte; heartbeats and error events are
+    only injected between events.
+    """
+    relay = SSERelay(heartbeat_interval)
     timeout = httpx.Timeout(BROKER_CONNECT_TIMEOUT, read=None)
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream("GET", url) as response:
-                if response.status_code != 200:
-                    response_text = await response.aread()
-                    error = format_error_response(
-                        response_text.decode("utf-8"),
-                        response.status_code,
-                        response.reason_phrase
-                    )
-                    yield f"data: {json.dumps(error)}\n\n"
-                    return
-
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        yield line + "\n\n"
+        client = get_http_client(BROKER)
+        async with client.stream("GET", url, timeout=timeout) as response:
+            if response.status_code != 200:
+                response_text = await response.aread()
+                error = format_error_response(
+                    response_text.decode("utf-8"),
+                    response.status_code,
+                    response.reason_phrase
+                )
+                yield relay.error_event(error)
+                return
+
+            async with aclosing(relay.relay(sse_body(response))) as chunks:
+                async for chunk in chunks:
+                    yield chunk
     except httpx.ConnectError as e:
         logger.error(f"Failed to connect to broker at {url}: {e}")
-        yield f"data: {json.dumps({'error': {'message': 'Failed to connect to broker service', 'type': 'connection_error'}})}\n\n"
+        yield relay.error_event({'error': {'message': 'Failed to connect to broker service', 'type': 'connection_error'}})
     except Exception as e:
         logger.error(f"Error proxying SSE stream: {e}")
-        yield f"data: {json.dumps({'error': {'message': str(e), 'type': 'server_error'}})}\n\n"
+        yield relay.error_event({'error': {'message': str(e), 'type': 'server_error'}})
+
+
+def resume_params(params: dict, last_event_id: Optional[str]) -> dict:
+    """Translate the Last-Event-ID of a reconnecting SSE client into the broker cursor.
+
+    Broker events carry their sequence number as SSE id, so the stream resumes
+    after the last event the client received instead of replaying it from the start.
+    """
+    if not last_event_id or not last_event_id.strip().isdigit():
+        return params
+    resumed = {k: v for k, v in params.items() if k != "from-beginning"}
+    resumed["cursor"] = int(last_event_id.strip())
+    return resumed
+
+
+def shared_sse_response(memory: str, path: str, params: dict, url: str) -> StreamingResponse:
+    """Stream a broker SSE url; viewers of the same stream share one broker subscription.
+
+    Heartbeats are sent per viewer, not through the shared subscription.
+    """
+    events = get_sse_fanout_hub().subscribe(
+        (memory, path, tuple(sorted(params.items()))),
+        lambda: proxy_sse_stream(url, heartbeat_interval=None),
+        from_beginning="from-beginning" in params,
+    )
+    return StreamingResponse(
+        SSERelay().relay(events),
+        media_type="text/event-stream",
+        headers=sse_headers,
+    )
 
 
 async def proxy_broker_request(
@@ -81,6 +190,7 @@ async def proxy_broker_request(
     path: str,
     watch: bool = False,
     params: Optional[dict] = None,
+    last_event_id: Optional[str] = None,
 ):
     """Generic proxy for broker requests - handles both SSE streaming and JSON fetching."""
     broker_url = await get_broker_url(memory)
@@ -93,24 +203,20 @@ async def proxy_broker_request(
     query_params = {k: v for k, v in (params or {}).items() if v is not None}
 
     if watch:
+        query_params = resume_params(query_params, last_event_id)
         query_params["watch"] = "true"
         url = f"{broker_url}{path}"
         if query_params:
             url += f"?{urlencode(query_params)}"
         logger.info(f"Proxying SSE stream from {url}")
-        return StreamingResponse(
-            proxy_sse_stream(url),
-            media_type="text/event-stream",
-            headers=sse_headers,
-        )
+        return shared_sse_response(memory, path, query_params, url)
 
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{broker_url}{path}"
-            if query_params:
-                url += f"?{urlencode(query_params)}"
-            response = await client.get(url)
-            return JSONResponse(content=response.json(), status_code=response.status_code)
+        url = f"{broker_url}{path}"
+        if query_params:
+            url += f"?{urlencode(query_params)}"
+        response = await get_http_client(BROKER).get(url)
+        return JSONResponse(content=response.json(), status_code=response.status_code)
     except httpx.ConnectError as e:
         logger.error(f"Failed to connect to broker: {e}")
         return JSONResponse(
@@ -131,11 +237,13 @@ async def get_traces(
     memory: str = Query("default", description="Memory resource name"),
     limit: int = Query(100, description="Max traces to return"),
     cursor: Optional[int] = Query(None, description="Cursor for pagination"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
 ):
     """Get or stream OTEL traces from the broker."""
     return await proxy_broker_request(
         memory, "/traces", watch,
-        {"limit": limit, "cursor": cursor}
+        {"limit": limit, "cursor": cursor},
+        last_event_id,
     )
 
 
@@ -146,12 +254,13 @@ async def get_trace(
     from_beginning: bool = Query(False, alias="from-beginning", description="Include existing spans"),
     cursor: Optional[int] = Query(None, description="Cursor for pagination/streaming"),
     memory: str = Query("default", description="Memory resource name"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
 ):
     """Get or stream a specific trace from the broker."""
     params = {"cursor": cursor}
     if from_beginning:
         params["from-beginning"] = "true"
-    return await proxy_broker_request(memory, f"/traces/{trace_id}", watch, params)
+    return await proxy_broker_request(memory, f"/traces/{trace_id}", watch, params, last_event_id)
 
 
 @router.get("/messages")
@@ -162,11 +271,13 @@ async def get_messages(
     cursor: Optional[int] = Query(None, description="Cursor for pagination"),
     conversation_id: Optional[str] = Query(None, description="Filter by conversation ID"),
     query_id: Optional[str] = Query(None, description="Filter by query ID"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
 ):
     """Get or stream messages from the broker."""
     return await proxy_broker_request(
         memory, "/messages", watch,
-        {"limit": limit, "cursor": cursor, "conversation_id": conversation_id, "query_id": query_id}
+        {"limit": limit, "cursor": cursor, "conversation_id": conversation_id, "query_id": query_id},
+        last_event_id,
     )
 
 
@@ -176,11 +287,13 @@ async def get_events(
     memory: str = Query("default", description="Memory resource name"),
     limit: int = Query(100, description="Max events to return"),
     cursor: Optional[int] = Query(None, description="Cursor for pagination"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
 ):
     """Get or stream operation events from the broker."""
     return await proxy_broker_request(
         memory, "/events", watch,
-        {"limit": limit, "cursor": cursor}
+        {"limit": limit, "cursor": cursor},
+        last_event_id,
     )
 
 
@@ -192,12 +305,13 @@ async def get_events_by_query(
     cursor: Optional[int] = Query(None, description="Cursor for pagination/streaming"),
     memory: str = Query("default", description="Memory resource name"),
     limit: int = Query(100, description="Max events to return"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
 ):
     """Get or stream events for a specific query."""
     params = {"limit": limit, "cursor": cursor}
     if from_beginning:
         params["from-beginning"] = "true"
-    return await proxy_broker_request(memory, f"/events/{query_id}", watch, params)
+    return await proxy_broker_request(memory, f"/events/{query_id}", watch, params, last_event_id)
 
 
 @router.get("/chunks")
@@ -207,6 +321,7 @@ async def get_chunks(
     memory: str = Query("default", description="Memory resource name"),
     limit: int = Query(100, description="Max chunks to return"),
     cursor: Optional[int] = Query(None, description="Cursor for pagination"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
 ):
     """Get or stream LLM chunks from the broker."""
     if watch and query_id:
@@ -216,17 +331,15 @@ async def get_chunks(
                 content={"error": {"message": f"Memory service '{memory}' not available", "type": "service_unavailable"}},
                 status_code=503,
             )
-        url = f"{broker_url}/stream/{query_id}?from-beginning=true"
+        params = resume_params({"from-beginning": "true"}, last_event_id)
+        url = f"{broker_url}/stream/{query_id}?{urlencode(params)}"
         logger.info(f"Proxying chunks SSE stream from {url}")
-        return StreamingResponse(
-            proxy_sse_stream(url),
-            media_type="text/event-stream",
-            headers=sse_headers,
-        )
+        return shared_sse_response(memory, f"/stream/{query_id}", params, url)
 
     return await proxy_broker_request(
         memory, "/stream", watch,
-        {"limit": limit, "cursor": cursor}
+        {"limit": limit, "cursor": cursor},
+        last_event_id,
     )
 
 
@@ -239,9 +352,8 @@ async def proxy_broker_delete(memory: str, path: str):
             status_code=503,
         )
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(f"{broker_url}{path}")
-            return JSONResponse(content=response.json(), status_code=response.status_code)
+        response = await get_http_client(BROKER).delete(f"{broker_url}{path}")
+        return JSONResponse(content=response.json(), status_code=response.status_code)
     except httpx.ConnectError as e:
         logger.error(f"Failed to connect to broker: {e}")
         return JSONResponse(
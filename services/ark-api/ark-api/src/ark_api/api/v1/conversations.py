@@ -1,6 +1,6 @@
 """Conversations API endpoints."""
 import logging
-from typing import Optional
+from typing import List, Optional
 
 import httpx
 from fastapi import APIRouter, HTTPException, Query
@@ -8,8 +8,11 @@ from fastapi import APIRouter, HTTPException, Query
 from ark_sdk.client import with_ark_client
 
 from ...models.conversations import ConversationResponse, ConversationListResponse
+from ...utils.http_clients import MEMORY, get_http_client
 from ...utils.memory_client import (
-    get_memory_service_address,
+    MEMORY_DELETE_DEADLINE,
+    fan_out_to_memories,
+    memory_errors,
     fetch_memory_service_data,
     get_all_memory_resources
 )
@@ -24,51 +27,90 @@ router = APIRouter(
 VERSION = "v1alpha1"
 
 
+async def _delete_from_memories(memory_dicts: List[dict], path: str, database_error: str) -> int:
+    """
+    Send a DELETE to every memory service concurrently.
+
+    Returns the number of memory services that deleted the data. Raises 500 if a
+    memory reports a database error, 504 if no memory service confirmed the
+    deletion in time, and 503 if no memory service could be reached.
+    """
+    async def delete(memory_name: str, service_url: str):
+        return await get_http_client(MEMORY).delete(f"{service_url}{path}", timeout=MEMORY_DELETE_DEADLINE)
+
+    results = await fan_out_to_memories(memory_dicts, delete, deadline=MEMORY_DELETE_DEADLINE)
+
+    deleted_count = 0
+    failed_services = []
+    unconfirmed_services = []
+    for result in results:
+        if isinstance(result.error, (TimeoutError, httpx.ReadTimeout, httpx.WriteTimeout)):
+            # The request was sent, the memory service may still complete the deletion
+            logger.warning(f"Deletion of {path} from memory {result.memory_name} not confirmed: {result.error_message}")
+            unconfirmed_services.append(result.memory_name)
+        elif result.error is not None:
+            # Network errors don't stop processing: the other memory services are still deleted from
+            logger.error(f"Failed to delete {path} from memory {result.memory_name}: {result.error_message}")
+            failed_services.append(result.memory_name)
+        elif result.value.is_success:
+            # Any 2xx response indicates successful deletion
+            deleted_count += 1
+        elif result.value.status_code == httpx.codes.NOT_FOUND:
+            # Idempotent deletion: data not found in this memory service is acceptable
+            logger.debug(f"{path} not found in memory {result.memory_name}")
+        elif result.value.status_code == httpx.codes.INTERNAL_SERVER_ERROR:
+            # Database errors fail the request as they indicate backend problems
+            raise HTTPException(status_code=httpx.codes.INTERNAL_SERVER_ERROR, detail=database_error)
+
+    if memory_dicts and not deleted_count and unconfirmed_services:
+        raise HTTPException(
+            status_code=httpx.codes.GATEWAY_TIMEOUT,
+            detail=f"Deletion not confirmed in time, it may still complete on: {', '.join(unconfirmed_services)}"
+        )
+    if memory_dicts and not deleted_count and failed_services:
+        raise HTTPException(
+            status_code=httpx.codes.SERVICE_UNAVAILABLE,
+            detail=f"Could not reach any memory services: {', '.join(failed_services)}"
+        )
+    return deleted_count
+
+
 @router.get("", response_model=ConversationListResponse)
 @handle_k8s_errors(operation="list", resource_type="conversations")
 async def list_conversations(
     namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
     memory: Optional[str] = Query(None, description="Filter by memory name")
 ) -> ConversationListResponse:
-    """List all conversations in a namespace, optionally filtered by memory."""
+    """List all conversations in a namespace, optionally filtered by memory.
+
+    Memory services are queried concurrently; memories that fail or time out
+    are reported in `errors` next to the conversations of the others.
+    """
     async with with_ark_client(namespace, VERSION) as client:
         memory_dicts = await get_all_memory_resources(client, memory)
 
-        all_conversations = []
-
-        for memory_dict in memory_dicts:
-            memory_name = memory_dict.get("metadata", {}).get("name", "")
-
-            try:
-                service_url = get_memory_service_address(memory_dict)
+        async def fetch(memory_name: str, service_url: str):
+            return await fetch_memory_service_data(service_url, "/conversations", memory_name=memory_name)
 
-                data = await fetch_memory_service_data(
-                    service_url,
-                    "/conversations",
-                    memory_name=memory_name
-                )
+        results = await fan_out_to_memories(memory_dicts, fetch)
 
-                conversations = data.get("conversations", [])
-
-                # Handle null conversations (empty database)
-                if conversations is None:
-                    conversations = []
-
-                # Convert to our response format - only include actual data
-                for conversation_id in conversations:
-                    all_conversations.append(ConversationResponse(
-                        conversationId=conversation_id,
-                        memoryName=memory_name
-                    ))
-
-            except Exception as e:
-                logger.error(f"Failed to get conversations from memory {memory_name}: {e}")
-                # Continue processing other memories
+        all_conversations = []
+        for result in results:
+            if result.error is not None:
                 continue
+            # Handle null conversations (empty database)
+            conversations = result.value.get("conversations") or []
+            # Convert to our response format - only include actual data
+            for conversation_id in conversations:
+                all_conversations.append(ConversationResponse(
+                    conversationId=conversation_id,
+                    memoryName=result.memory_name
+                ))
 
         return ConversationListResponse(
             items=all_conversations,
-            total=len(all_conversations)
+            total=len(all_conversations),
+            errors=memory_errors(results)
         )
 
 
@@ -83,46 +125,11 @@ async def delete_conversation(
         # Process all memory services to ensure conversation is removed from all potential locations
         memory_dicts = await get_all_memory_resources(client)
 
-        deleted_count = 0
-        failed_services = []
-
-        for memory_dict in memory_dicts:
-            memory_name = memory_dict.get("metadata", {}).get("name", "")
-
-            try:
-                service_url = get_memory_service_address(memory_dict)
-
-                async with httpx.AsyncClient() as http_client:
-                    response = await http_client.delete(
-                        f"{service_url}/conversations/{conversation_id}",
-                        timeout=30.0
-                    )
-
-                    if response.is_success:
-                        # Any 2xx response indicates successful deletion
-                        deleted_count += 1
-                    elif response.status_code == httpx.codes.NOT_FOUND:
-                        # Idempotent deletion: conversation not found in this memory service is acceptable
-                        logger.debug(f"Conversation {conversation_id} not found in memory {memory_name}")
-                    elif response.status_code == httpx.codes.INTERNAL_SERVER_ERROR:
-                        # Database errors require immediate failure as they indicate backend problems
-                        raise HTTPException(
-                            status_code=httpx.codes.INTERNAL_SERVER_ERROR,
-                            detail=f"Failed to delete conversation {conversation_id} from database"
-                        )
-
-            except HTTPException:
-                raise
-            except Exception as e:
-                # Network errors don't stop processing: continue attempting other memory services
-                logger.error(f"Failed to delete conversation {conversation_id} from memory {memory_name}: {e}")
-                failed_services.append(memory_name)
-
-        if len(memory_dicts) > 0 and deleted_count == 0 and failed_services:
-            raise HTTPException(
-                status_code=httpx.codes.SERVICE_UNAVAILABLE,
-                detail=f"Could not reach any memory services: {', '.join(failed_services)}"
-            )
+        deleted_count = await _delete_from_memories(
+            memory_dicts,
+            f"/conversations/{conversation_id}",
+            f"Failed to delete conversation {conversation_id} from database"
+        )
 
         return {"message": f"Conversation {conversation_id} deleted successfully from {deleted_count} memory service(s)"}
 
@@ -137,43 +144,11 @@ async def delete_all_conversations(
         # Process all memory services to ensure complete cleanup across the namespace
         memory_dicts = await get_all_memory_resources(client)
 
-        deleted_count = 0
-        failed_services = []
-
-        for memory_dict in memory_dicts:
-            memory_name = memory_dict.get("metadata", {}).get("name", "")
-
-            try:
-                service_url = get_memory_service_address(memory_dict)
-
-                async with httpx.AsyncClient() as http_client:
-                    response = await http_client.delete(
-                        f"{service_url}/conversations",
-                        timeout=30.0
-                    )
-
-                    if response.is_success:
-                        # Any 2xx response indicates successful deletion
-                        deleted_count += 1
-                    elif response.status_code == httpx.codes.INTERNAL_SERVER_ERROR:
-                        # Database errors require immediate failure as they indicate backend problems
-                        raise HTTPException(
-                            status_code=httpx.codes.INTERNAL_SERVER_ERROR,
-                            detail="Failed to delete all conversations from database"
-                        )
-
-            except HTTPException:
-                raise
-            except Exception as e:
-                # Network errors don't stop processing: continue attempting other memory services
-                logger.error(f"Failed to delete all conversations from memory {memory_name}: {e}")
-                failed_services.append(memory_name)
-
-        if len(memory_dicts) > 0 and deleted_count == 0 and failed_services:
-            raise HTTPException(
-                status_code=httpx.codes.SERVICE_UNAVAILABLE,
-                detail=f"Could not reach any memory services: {', '.join(failed_services)}"
-            )
+        deleted_count = await _delete_from_memories(
+            memory_dicts,
+            "/conversations",
+            "Failed to delete all conversations from database"
+        )
 
         return {"message": f"All conversations deleted successfully from {deleted_count} memory service(s)"}
 
@@ -190,42 +165,10 @@ async def delete_query_messages(
         # Process all memory services to ensure query messages are removed from all potential locations
         memory_dicts = await get_all_memory_resources(client)
 
-        deleted_count = 0
-        failed_services = []
-
-        for memory_dict in memory_dicts:
-            memory_name = memory_dict.get("metadata", {}).get("name", "")
-
-            try:
-                service_url = get_memory_service_address(memory_dict)
-
-                async with httpx.AsyncClient() as http_client:
-                    response = await http_client.delete(
-                        f"{service_url}/conversations/{conversation_id}/queries/{query_id}/messages",
-                        timeout=30.0
-                    )
-
-                    if response.is_success:
-                        # Any 2xx response indicates successful deletion
-                        deleted_count += 1
-                    elif response.status_code == httpx.codes.INTERNAL_SERVER_ERROR:
-                        # Database errors require immediate failure as they indicate backend problems
-                        raise HTTPException(
-                            status_code=httpx.codes.INTERNAL_SERVER_ERROR,
-                            detail=f"Failed to delete query {query_id} messages from database"
-                        )
-
-            except HTTPException:
-                raise
-            except Exception as e:
-                # Network errors don't stop processing: continue attempting other memory services
-                logger.error(f"Failed to delete query {query_id} messages from conversation {conversation_id} in memory {memory_name}: {e}")
-                failed_services.append(memory_name)
-
-        if memory_dicts and not deleted_count and failed_services:
-            raise HTTPException(
-                status_code=httpx.codes.SERVICE_UNAVAILABLE,
-                detail=f"Could not reach any memory services: {', '.join(failed_services)}"
-            )
-
-        return {"message": f"Query {query_id} messages deleted successfully from {deleted_count} memory service(s)"}
\ No newline at end of file
+        deleted_count = await _delete_from_memories(
+            memory_dicts,
+            f"/conversations/{conversation_id}/queries/{query_id}/messages",
+            f"Failed to delete query {query_id} messages from database"
+        )
+
+        return {"message": f"Query {query_id} messages deleted successfully from {deleted_count} memory service(s)"}
@@ -1,6 +1,6 @@
 """API routes for Evaluation resources."""
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from ark_sdk.models.evaluation_v1alpha1 import EvaluationV1alpha1
 from ...core.constants import GROUP
 from ark_sdk.client import with_ark_client
@@ -19,6 +19,8 @@ from ...models.evaluations import (
     enhanced_evaluation_to_response,
     enhanced_evaluation_to_detail_response
 )
+from ...utils.resource_watch import watch_response
+from ...utils.etag import ConditionalGet, collection_etag, resource_etag
 from .exceptions import handle_k8s_errors
 
 router = APIRouter(
@@ -35,33 +37,50 @@ VERSION = "v1alpha1"
 async def list_evaluations(
     enhanced: bool = Query(False, description="Include enhanced metadata from annotations"),
     query_ref: str = Query(None, description="Filter evaluations by query reference name"),
-    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of evaluations to return, enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
+    watch: bool = Query(False, description="Stream changes as server-sent events instead of returning the list"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
+    conditional: ConditionalGet = Depends(),
 ) -> Union[EvaluationListResponse, EnhancedEvaluationListResponse]:
     """List all evaluations in a namespace."""
+    if query_ref and (limit or cursor):
+        raise HTTPException(status_code=400, detail="Pagination cannot be combined with the query_ref filter")
+    if watch and (query_ref or limit or cursor):
+        raise HTTPException(status_code=400, detail="Watch cannot be combined with filters or pagination")
+
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.evaluations.a_list()
+        if watch:
+            to_item = enhanced_evaluation_to_response if enhanced else evaluation_to_response
+            return await watch_response(GROUP, VERSION, "evaluations", ark_client.namespace, to_item, last_event_id)
+
+        next_cursor = None
+        if limit or cursor:
+            result, next_cursor = await ark_client.evaluations.a_list_page(limit=limit, continue_token=cursor, raw=True)
+        elif query_ref:
+            # Filter by query_ref using the queryRef index
+            result = await ark_client.evaluations.a_list_by_index("queryRef", query_ref, raw=True)
+        else:
+            result = await ark_client.evaluations.a_list(raw=True)
         
-        # Filter by query_ref if provided
-        if query_ref:
-            filtered_result = []
-            for item in result:
-                item_dict = item.to_dict()
-                # Check if this evaluation has a queryRef that matches
-                if (item_dict.get('spec', {}).get('config', {}).get('queryRef', {}).get('name') == query_ref):
-                    filtered_result.append(item)
-            result = filtered_result
+        not_modified = conditional.not_modified(collection_etag(result))
+        if not_modified:
+            return not_modified
         
         if enhanced:
-            evaluations = [enhanced_evaluation_to_response(item.to_dict()) for item in result]
+            evaluations = [enhanced_evaluation_to_response(item) for item in result]
             return EnhancedEvaluationListResponse(
                 items=evaluations,
-                count=len(evaluations)
+                count=len(evaluations),
+                cursor=next_cursor
             )
         else:
-            evaluations = [evaluation_to_response(item.to_dict()) for item in result]
+            evaluations = [evaluation_to_response(item) for item in result]
             return EvaluationListResponse(
                 items=evaluations,
-                count=len(evaluations)
+                count=len(evaluations),
+                cursor=next_cursor
             )
 
 
@@ -142,16 +161,20 @@ async def create_evaluation(
 async def get_evaluation(
     name: str,
     enhanced: bool = Query(False, description="Include enhanced metadata from annotations"),
-    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")
+    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
+    conditional: ConditionalGet = Depends(),
 ) -> Union[EvaluationDetailResponse, EnhancedEvaluationDetailResponse]:
     """Get details of a specific evaluation."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.evaluations.a_get(name)
+        result = await ark_client.evaluations.a_get(name, raw=True)
+        not_modified = conditional.not_modified(resource_etag(result))
+        if not_modified:
+            return not_modified
         
         if enhanced:
-            return enhanced_evaluation_to_detail_response(result.to_dict())
+            return enhanced_evaluation_to_detail_response(result)
         else:
-            return evaluation_to_detail_response(result.to_dict())
+            return evaluation_to_detail_response(result)
 
 
 @router.put("/{name}", response_model=EvaluationDetailResponse)
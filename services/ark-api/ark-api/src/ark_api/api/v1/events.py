@@ -1,14 +1,17 @@
 """Kubernetes events API endpoints."""
+import json
 import logging
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, HTTPException, Query
 from kubernetes_asyncio import client
 from kubernetes_asyncio.client.api_client import ApiClient
 from kubernetes_asyncio.client.rest import ApiException
+from ark_sdk.informer import get_informer_registry, register_indexer
 from ark_sdk.k8s import get_context
 
 from ...models.events import EventListResponse, EventResponse, event_to_response
+from ...utils.resource_watch import watch_response
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -16,34 +19,87 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/events", tags=["events"])
 
 
-def _matches_type_filter(event_dict: dict, type_filter: Optional[str]) -> bool:
-    """Check if event matches type filter."""
-    return not type_filter or event_dict.get("type") == type_filter
+def _involved_object_field(event: dict, field: str) -> List[str]:
+    value = (event.get("involvedObject") or {}).get(field)
+    return [value] if value else []
 
 
-def _matches_kind_filter(event_dict: dict, kind_filter: Optional[str]) -> bool:
-    """Check if event matches kind filter."""
-    if not kind_filter:
-        return True
-    involved_object = event_dict.get("involved_object", {})
-    return involved_object.get("kind") == kind_filter
+# Indexes of the events informer, used when the informer cache is enabled
+register_indexer("events", "type", lambda event: [event["type"]] if event.get("type") else [])
+register_indexer("events", "kind", lambda event: _involved_object_field(event, "kind"))
+register_indexer("events", "name", lambda event: [name.lower() for name in _involved_object_field(event, "name")])
+
+
+def _field_selector(type_filter: Optional[str], kind_filter: Optional[str]) -> Optional[str]:
+    """Build the field selector for the filters the API server can apply."""
+    selectors = []
+    if type_filter:
+        selectors.append(f"type={type_filter}")
+    if kind_filter:
+        selectors.append(f"involvedObject.kind={kind_filter}")
+    return ",".join(selectors) or None
 
 
-def _matches_name_filter(event_dict: dict, name_filter: Optional[str]) -> bool:
+def _matches_name_filter(event: dict, name_filter: Optional[str]) -> bool:
     """Check if event matches name filter."""
     if not name_filter:
         return True
-    involved_object = event_dict.get("involved_object", {})
-    object_name = involved_object.get("name", "").lower()
-    return name_filter.lower() in object_name
+    object_name = (event.get("involvedObject") or {}).get("name") or ""
+    return name_filter.lower() in object_name.lower()
+
+
+def _event_dict(event: dict) -> dict:
+    """Convert a raw event to the to_dict() layout expected by event_to_response."""
+    metadata = event.get("metadata") or {}
+    return {
+        "metadata": {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "uid": metadata.get("uid"),
+            "creation_timestamp": metadata.get("creationTimestamp"),
+        },
+        "involved_object": event.get("involvedObject") or {},
+        "source": event.get("source") or {},
+        "type": event.get("type"),
+        "reason": event.get("reason"),
+        "message": event.get("message"),
+        "count": event.get("count"),
+        "first_timestamp": event.get("firstTimestamp"),
+        "last_timestamp": event.get("lastTimestamp"),
+    }
+
+
+def _event_item(event: dict) -> EventResponse:
+    return event_to_response(_event_dict(event))
+
+
+async def _list_raw_events(v1: client.CoreV1Api, namespace: str, **kwargs) -> dict:
+    """List events as raw JSON, skipping model deserialization and to_dict()."""
+    response = await v1.list_namespaced_event(namespace=namespace, _preload_content=False, **kwargs)
+    return json.loads(await response.read())
+
 
+def _cached_events(informer, type_filter: Optional[str], kind_filter: Optional[str],
+                   name_filter: Optional[str]) -> List[dict]:
+    """Select events from the informer cache through its indexes."""
+    candidates = []
+    if type_filter:
+        candidates.append(informer.by_index("type", type_filter))
+    if kind_filter:
+        candidates.append(informer.by_index("kind", kind_filter))
+    if name_filter:
+        # Substring match over the distinct object names rather than every event
+        needle = name_filter.lower()
+        candidates.append([
+            event
+            for key in informer.index_keys("name") if needle in key
+            for event in informer.by_index("name", key)
+        ])
+    if not candidates:
+        return informer.list()
 
-def _should_include_event(event_dict: dict, type_filter: Optional[str], 
-                         kind_filter: Optional[str], name_filter: Optional[str]) -> bool:
-    """Check if event should be included based on all filters."""
-    return (_matches_type_filter(event_dict, type_filter) and
-            _matches_kind_filter(event_dict, kind_filter) and
-            _matches_name_filter(event_dict, name_filter))
+    names = set.intersection(*({event["metadata"]["name"] for event in events} for events in candidates))
+    return [event for event in min(candidates, key=len) if event["metadata"]["name"] in names]
 
 
 def _paginate_events(events: list, page_num: int, limit_num: int) -> tuple[list, int]:
@@ -55,6 +111,82 @@ def _paginate_events(events: list, page_num: int, limit_num: int) -> tuple[list,
     return paginated_events, total_count
 
 
+async def _list_events_page(
+    namespace: str,
+    type_filter: Optional[str],
+    kind_filter: Optional[str],
+    name_filter: Optional[str],
+    page_num: int,
+    limit_num: int
+) -> EventListResponse:
+    """List one page of events sorted newest first, with the total count."""
+    informer = get_informer_registry().get_synced("", "v1", "events", namespace)
+    if informer is not None:
+        events = _cached_events(informer, type_filter, kind_filter, name_filter)
+    else:
+        async with ApiClient() as api_client:
+            v1 = client.CoreV1Api(api_client)
+            result = await _list_raw_events(
+                v1, namespace, field_selector=_field_selector(type_filter, kind_filter)
+            )
+        events = [event for event in result.get("items") or [] if _matches_name_filter(event, name_filter)]
+
+    # Sort on the raw RFC 3339 timestamps and only convert the requested page
+    events.sort(key=lambda event: (event.get("metadata") or {}).get("creationTimestamp") or "", reverse=True)
+    paginated_events, total_count = _paginate_events(events, page_num, limit_num)
+
+    return EventListResponse(
+        items=[event_to_response(_event_dict(event)) for event in paginated_events],
+        total=total_count
+    )
+
+
+async def _list_events_cursor(
+    namespace: str,
+    type_filter: Optional[str],
+    kind_filter: Optional[str],
+    name_filter: Optional[str],
+    limit_num: int,
+    cursor: Optional[str]
+) -> EventListResponse:
+    """
+    List events with the API server's limit/continue pagination.
+
+    The continue token points after a whole chunk, so with a name filter the
+    page ends with the first chunk that has a match and may be shorter than
+    the limit. Chunks without a match are skipped.
+    """
+    events = []
+    remaining = None
+    async with ApiClient() as api_client:
+        v1 = client.CoreV1Api(api_client)
+        while True:
+            kwargs = {
+                "limit": limit_num,
+                "field_selector": _field_selector(type_filter, kind_filter),
+            }
+            if cursor:
+                kwargs["_continue"] = cursor
+            result = await _list_raw_events(v1, namespace, **kwargs)
+
+            events.extend(event for event in result.get("items") or [] if _matches_name_filter(event, name_filter))
+            metadata = result.get("metadata") or {}
+            cursor = metadata.get("continue") or None
+            remaining = metadata.get("remainingItemCount")
+            if events or not cursor:
+                break
+
+    total = len(events)
+    if remaining and not name_filter:
+        # The API server only knows the remaining count when it applies every filter
+        total += remaining
+    return EventListResponse(
+        items=[event_to_response(_event_dict(event)) for event in events],
+        total=total,
+        cursor=cursor
+    )
+
+
 @router.get("", response_model=EventListResponse)
 @handle_k8s_errors(operation="list", resource_type="event")
 async def list_events(
@@ -62,19 +194,31 @@ async def list_events(
     type_filter: Optional[str] = Query(None, alias="type", description="Filter by event type (Normal, Warning)"),
     kind_filter: Optional[str] = Query(None, alias="kind", description="Filter by involved object kind"),
     name_filter: Optional[str] = Query(None, alias="name", description="Filter by involved object name"),
-    limit: Optional[int] = Query(500, description="Maximum number of events to return"),
-    page: Optional[int] = Query(1, description="Page number for pagination (1-based)")
+    limit: Optional[int] = Query(500, ge=1, description="Maximum number of events to return"),
+    page: Optional[int] = Query(None, ge=1, description="Page number for pagination (1-based), sorted newest first"),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    watch: bool = Query(False, description="Stream changes as server-sent events instead of returning the list"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
 ) -> EventListResponse:
     """
-    List all Kubernetes events in a namespace with optional filtering.
+    List Kubernetes events in a namespace with optional filtering, or watch them.
+
+    Type and kind filters are applied by the API server. With `page`, events
+    are sorted newest first and counted; they are served from the informer
+    cache when it is enabled. Without `page`, events are returned in API
+    server order, one `limit`-sized page at a time, with a `cursor` for the
+    next page. With a name filter, pages may be shorter than `limit`.
 
     Args:
         namespace: The namespace to list events from
         type_filter: Filter by event type (Normal, Warning)
         kind_filter: Filter by involved object kind (Agent, Team, Query, etc.)
-        name_filter: Filter by involved object name
+        name_filter: Filter by involved object name (case-insensitive substring)
         limit: Maximum number of events to return (default: 500)
-        page: Page number for pagination (1-based, default: 1)
+        page: Page number for pagination (1-based)
+        cursor: Cursor returned by the previous page
+        watch: Stream added, modified and deleted events as server-sent events
+        last_event_id: Event id to resume a watch stream from
 
     Returns:
         EventListResponse: List of events in the namespace
@@ -82,34 +226,19 @@ async def list_events(
     if namespace is None:
         namespace = get_context()["namespace"]
 
-    async with ApiClient() as api_client:
-        v1 = client.CoreV1Api(api_client)
-        
-        try:
-            page_num = page or 1
-            limit_num = limit or 200
-                        
-            events = await v1.list_namespaced_event(namespace=namespace)
-                        
-            filtered_events = []
-            for event in events.items:
-                event_dict = event.to_dict()
-                
-                if _should_include_event(event_dict, type_filter, kind_filter, name_filter):
-                    filtered_events.append(event_to_response(event_dict))
-                        
-            filtered_events.sort(key=lambda x: x.creation_timestamp, reverse=True)
-            
-            paginated_events, total_count = _paginate_events(filtered_events, page_num, limit_num)
-                        
-            return EventListResponse(
-                items=paginated_events,
-                total=total_count
-            )
-            
-        except ApiException as e:
-            logger.error(f"Failed to list events: {e}")
-            raise
+    if watch:
+        if type_filter or kind_filter or name_filter or page or cursor:
+            raise HTTPException(status_code=400, detail="Watch cannot be combined with filters or pagination")
+        return await watch_response("", "v1", "events", namespace, _event_item, last_event_id)
+
+    limit_num = limit or 200
+    try:
+        if page is not None and not cursor:
+            return await _list_events_page(namespace, type_filter, kind_filter, name_filter, page, limit_num)
+        return await _list_events_cursor(namespace, type_filter, kind_filter, name_filter, limit_num, cursor)
+    except ApiException as e:
+        logger.error(f"Failed to list events: {e}")
+        raise
 
 
 @router.get("/{event_name}", response_model=EventResponse)
@@ -94,6 +94,10 @@ def handle_k8s_errors(
                 elif e.status == 422:
                     raise HTTPException(status_code=422, detail=_extract_error_detail(e))
                 
+                elif e.status == 410 and operation == "list":
+                    # The continue token behind a list cursor was compacted away
+                    raise HTTPException(status_code=410, detail="Cursor has expired, restart the list without a cursor")
+                
                 elif e.status == 403:
                     raise HTTPException(status_code=403, detail=_extract_error_detail(e))
                 
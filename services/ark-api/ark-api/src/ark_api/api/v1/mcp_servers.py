@@ -1,7 +1,7 @@
 """Kubernetes MCP servers API endpoints."""
 import logging
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from typing import Optional
 from ark_sdk.models.mcp_server_v1alpha1 import MCPServerV1alpha1
 from ark_sdk.models.mcp_server_v1alpha1_spec import MCPServerV1alpha1Spec
@@ -16,6 +16,7 @@ from ...models.mcp_servers import (
     MCPServerDetailResponse
 )
 from ...models.common import AvailabilityStatus, extract_availability_from_conditions
+from ...utils.etag import ConditionalGet, collection_etag, resource_etag
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -80,7 +81,7 @@ def mcp_server_to_detail_response(mcp_server: dict) -> MCPServerDetailResponse:
 
 @router.get("", response_model=MCPServerListResponse)
 @handle_k8s_errors(operation="list", resource_type="mcp server")
-async def list_mcp_servers(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> MCPServerListResponse:
+async def list_mcp_servers(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> MCPServerListResponse:
     """
     List all MCPServer CRs in a namespace.
     
@@ -91,11 +92,14 @@ async def list_mcp_servers(namespace: Optional[str] = Query(None, description="N
         MCPServerListResponse: List of all MCP servers in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        mcp_servers = await ark_client.mcpservers.a_list()
+        mcp_servers = await ark_client.mcpservers.a_list(raw=True)
+        not_modified = conditional.not_modified(collection_etag(mcp_servers))
+        if not_modified:
+            return not_modified
         
         mcp_server_list = []
         for mcp_server in mcp_servers:
-            mcp_server_list.append(mcp_server_to_response(mcp_server.to_dict()))
+            mcp_server_list.append(mcp_server_to_response(mcp_server))
         
         return MCPServerListResponse(
             items=mcp_server_list,
@@ -136,7 +140,7 @@ async def create_mcp_server(body: MCPServerCreateRequest, namespace: Optional[st
 
 @router.get("/{mcp_server_name}", response_model=MCPServerDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="mcp server")
-async def get_mcp_server(mcp_server_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> MCPServerDetailResponse:
+async def get_mcp_server(mcp_server_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> MCPServerDetailResponse:
     """
     Get a specific MCPServer CR by name.
     
@@ -148,9 +152,12 @@ async def get_mcp_server(mcp_server_name: str, namespace: Optional[str] = Query(
         MCPServerDetailResponse: The MCP server details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        mcp_server = await ark_client.mcpservers.a_get(mcp_server_name)
+        mcp_server = await ark_client.mcpservers.a_get(mcp_server_name, raw=True)
+        not_modified = conditional.not_modified(resource_etag(mcp_server))
+        if not_modified:
+            return not_modified
         
-        return mcp_server_to_detail_response(mcp_server.to_dict())
+        return mcp_server_to_detail_response(mcp_server)
 
 
 @router.put("/{mcp_server_name}", response_model=MCPServerDetailResponse, include_in_schema=False)
@@ -3,6 +3,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 from ark_sdk.models.memory_v1alpha1 import MemoryV1alpha1
 
 from ark_sdk.client import with_ark_client
@@ -14,11 +15,17 @@ from ...models.memories import (
     MemoryUpdateRequest,
     MemoryDetailResponse
 )
-from ...models.conversations import MemoryMessageResponse, MemoryMessageListResponse
+from ...models.conversations import MemoryErrorResponse, MemoryMessageResponse, MemoryMessageListResponse
 from ...utils.memory_client import (
+    MemoryCallResult,
     get_memory_service_address,
+    fan_out_to_memories,
     fetch_memory_service_data,
-    get_all_memory_resources
+    get_all_memory_resources,
+    iter_memory_messages,
+    memory_errors,
+    merge_by_sequence,
+    merge_streams_by_sequence
 )
 from .exceptions import handle_k8s_errors
 
@@ -162,6 +169,18 @@ async def get_memory_messages(name: str, conversation_id: str, namespace: Option
         )
 
 
+def memory_message_response(memory_name: str, msg_record: dict) -> MemoryMessageResponse:
+    """Convert a memory service message record to response format."""
+    return MemoryMessageResponse(
+        timestamp=msg_record.get("timestamp"),
+        memoryName=memory_name,
+        conversationId=msg_record.get("conversation_id"),
+        queryId=msg_record.get("query_id"),
+        message=msg_record.get("message"),
+        sequence=msg_record.get("sequence")
+    )
+
+
 # Add this as a separate router to avoid conflicts with existing prefix
 memory_messages_router = APIRouter(prefix="/memory-messages", tags=["memory-messages"])
 
@@ -174,55 +193,102 @@ async def list_memory_messages(
     conversation: Optional[str] = Query(None, description="Filter by conversation ID"),
     query: Optional[str] = Query(None, description="Filter by query ID")
 ) -> MemoryMessageListResponse:
-    """List all memory messages with context, optionally filtered."""
+    """List all memory messages with context, optionally filtered.
+
+    Memory services are queried concurrently; memories that fail or time out
+    are reported in `errors` next to the messages of the others.
+    """
     async with with_ark_client(namespace, VERSION) as client:
         memory_dicts = await get_all_memory_resources(client, memory)
         
-        all_messages = []
+        # Build query parameters
+        params = {}
+        if conversation:
+            params["conversation_id"] = conversation
+        if query:
+            params["query_id"] = query
         
-        for memory_dict in memory_dicts:
-            memory_name = memory_dict.get("metadata", {}).get("name", "")
-            
-            try:
-                service_url = get_memory_service_address(memory_dict)
-                
-                # Build query parameters
-                params = {}
-                if conversation:
-                    params["conversation_id"] = conversation
-                if query:
-                    params["query_id"] = query
-                
-                data = await fetch_memory_service_data(
-                    service_url,
-                    "/messages",
-                    params=params,
-                    memory_name=memory_name
-                )
-                
-                messages = data.get("messages", [])
-                
-                # Convert each database record to response format
-                for msg_record in messages:
-                    all_messages.append(MemoryMessageResponse(
-                        timestamp=msg_record.get("timestamp"),
-                        memoryName=memory_name,
-                        conversationId=msg_record.get("conversation_id"),
-                        queryId=msg_record.get("query_id"),
-                        message=msg_record.get("message"),
-                        sequence=msg_record.get("sequence")
-                    ))
-            
-            except Exception as e:
-                logger.error(f"Failed to get messages from memory {memory_name}: {e}")
-                # Continue processing other memories
-                continue
+        async def fetch(memory_name: str, service_url: str):
+            data = await fetch_memory_service_data(
+                service_url,
+                "/messages",
+                params=params,
+                memory_name=memory_name
+            )
+            # Convert each database record to response format
+            return [memory_message_response(memory_name, msg_record) for msg_record in data.get("messages") or []]
         
-        # Sort by sequence number descending (newest first) to maintain proper chronological order
+        results = await fan_out_to_memories(memory_dicts, fetch)
+        
+        # Order by sequence number descending (newest first) to maintain proper chronological order
         # This ensures messages appear in the correct order regardless of timestamp precision
-        all_messages.sort(key=lambda x: x.sequence or 0, reverse=True)
+        all_messages = merge_by_sequence(
+            (result.value for result in results if result.error is None),
+            key=lambda x: x.sequence or 0
+        )
         
         return MemoryMessageListResponse(
             items=all_messages,
-            total=len(all_messages)
-        )
\ No newline at end of file
+            total=len(all_messages),
+            errors=memory_errors(results)
+        )
+
+
+async def _export_memory(memory_dict: dict, params: dict, errors: list):
+    """Stream the messages of one memory, recording a failure instead of raising it."""
+    memory_name = memory_dict.get("metadata", {}).get("name", "")
+    try:
+        service_url = get_memory_service_address(memory_dict)
+        async for msg_record in iter_memory_messages(service_url, params, memory_name=memory_name):
+            yield memory_message_response(memory_name, msg_record)
+    except Exception as e:
+        logger.error(f"Failed to export messages from memory {memory_name}: {e}")
+        errors.append(MemoryErrorResponse(
+            memoryName=memory_name,
+            error=MemoryCallResult(memory_name, error=e).error_message
+        ))
+
+
+async def _export_lines(memory_dicts: list, params: dict):
+    errors = []
+    sources = [_export_memory(memory_dict, params, errors) for memory_dict in memory_dicts]
+    async for message in merge_streams_by_sequence(sources, key=lambda x: x.sequence or 0):
+        yield message.model_dump_json() + "\n"
+    # Memories that failed are reported after the messages of the others
+    for error in errors:
+        yield error.model_dump_json() + "\n"
+
+
+@memory_messages_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+@handle_k8s_errors(operation="export", resource_type="memory-messages")
+async def export_memory_messages(
+    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
+    memory: Optional[str] = Query(None, description="Filter by memory name"),
+    conversation: Optional[str] = Query(None, description="Filter by conversation ID"),
+    query: Optional[str] = Query(None, description="Filter by query ID")
+) -> StreamingResponse:
+    """Export memory messages as NDJSON, oldest first.
+
+    Each memory service is paged through with cursors and the pages are
+    merged by sequence while the response is written, so memory use does
+    not grow with the history size. Memories that fail are reported as
+    trailing `{"memoryName": ..., "error": ...}` lines.
+    """
+    async with with_ark_client(namespace, VERSION) as client:
+        memory_dicts = await get_all_memory_resources(client, memory)
+
+    params = {}
+    if conversation:
+        params["conversation_id"] = conversation
+    if query:
+        params["query_id"] = query
+
+    return StreamingResponse(
+        _export_lines(memory_dicts, params),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="memory-messages.ndjson"'}
+    )
@@ -1,7 +1,7 @@
 """Kubernetes models API endpoints."""
 import logging
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from typing import Optional
 
 from ark_sdk.client import with_ark_client
@@ -19,6 +19,7 @@ from ...models.models import (
     MODEL_TYPE_COMPLETIONS,
 )
 from ...models.common import extract_availability_from_conditions
+from ...utils.etag import ConditionalGet, collection_etag, resource_etag
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -102,7 +103,7 @@ def model_to_detail_response(model: dict) -> ModelDetailResponse:
 
 @router.get("", response_model=ModelListResponse)
 @handle_k8s_errors(operation="list", resource_type="model")
-async def list_models(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> ModelListResponse:
+async def list_models(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> ModelListResponse:
     """
     List all Model CRs in a namespace.
     
@@ -113,11 +114,14 @@ async def list_models(namespace: Optional[str] = Query(None, description="Namesp
         ModelListResponse: List of all models in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        models = await ark_client.models.a_list()
+        models = await ark_client.models.a_list(raw=True)
+        not_modified = conditional.not_modified(collection_etag(models))
+        if not_modified:
+            return not_modified
         
         model_list = []
         for model in models:
-            model_list.append(model_to_response(model.to_dict()))
+            model_list.append(model_to_response(model))
         
         return ModelListResponse(
             items=model_list,
@@ -204,7 +208,7 @@ async def create_model(body: ModelCreateRequest, namespace: Optional[str] = Quer
 
 @router.get("/{model_name}", response_model=ModelDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="model")
-async def get_model(model_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> ModelDetailResponse:
+async def get_model(model_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> ModelDetailResponse:
     """
     Get a specific Model CR by name.
     
@@ -216,9 +220,12 @@ async def get_model(model_name: str, namespace: Optional[str] = Query(None, desc
         ModelDetailResponse: The model details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        model = await ark_client.models.a_get(model_name)
+        model = await ark_client.models.a_get(model_name, raw=True)
+        not_modified = conditional.not_modified(resource_etag(model))
+        if not_modified:
+            return not_modified
         
-        return model_to_detail_response(model.to_dict())
+        return model_to_detail_response(model)
 
 
 @router.put("/{model_name}", response_model=ModelDetailResponse)
@@ -1,30 +1,38 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import time
 import uuid
+from contextlib import aclosing
 
 import httpx
 from ark_sdk import QueryV1alpha1Spec
 from ark_sdk.client import with_ark_client
 from ark_sdk.k8s import get_namespace
 from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
-from ark_sdk.streaming_config import get_streaming_base_url, get_streaming_config
+from ark_sdk.streaming_config import get_streaming_endpoint_cache
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse, StreamingResponse
-from kubernetes_asyncio import client as k8s_client
 from openai.types import Model
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 from pydantic import BaseModel, ValidationError
 
 from ...constants.annotations import STREAMING_ENABLED_ANNOTATION
 from ...models.queries import ArkOpenAICompletionsMetadata
+from ...utils.http_clients import STREAMING, get_http_client
 from ...utils.parse_duration import parse_duration_to_seconds
 from ...utils.query_targets import parse_model_to_query_target
 from ...utils.query_watch import watch_query_completion
-from ...utils.streaming import StreamingErrorResponse, create_single_chunk_sse_response
+from ...utils.streaming import (
+    SSE_HEARTBEAT_INTERVAL,
+    SSERelay,
+    StreamingErrorResponse,
+    create_single_chunk_sse_response,
+    sse_body,
+)
 
 router = APIRouter(prefix="/openai/v1", tags=["OpenAI"])
 logger = logging.getLogger(__name__)
@@ -32,6 +40,10 @@ logger = logging.getLogger(__name__)
 # Constants
 TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 BROKER_CONNECT_TIMEOUT = float(os.getenv('BROKER_CONNECT_TIMEOUT', '10.0'))
+# How long to hold the response status while waiting for the first streamed chunk
+STREAM_FIRST_CHUNK_TIMEOUT = float(os.getenv('STREAM_FIRST_CHUNK_TIMEOUT', '5.0'))
+# Upstream chunks buffered ahead of a slow client before reading from the broker pauses
+STREAM_PROXY_QUEUE_SIZE = int(os.getenv('STREAM_PROXY_QUEUE_SIZE', '64'))
 
 
 def _parse_timestamp(metadata: dict) -> int:
@@ -100,72 +112,153 @@ def process_request_metadata(
     return None
 
 
-# See https://github.com/mckinsey/agents-at-scale-ark/issues/415 for potential improvement:
-# Start streaming first, wait for the first chunk/response, and use the status code of that to respond with
-async def proxy_streaming_response(streaming_url: str):
-    """Proxy streaming chunks from memory service."""
-    timeout = httpx.Timeout(BROKER_CONNECT_TIMEOUT, read=None)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        async with client.stream("GET", streaming_url) as response:
-            if response.status_code != 200:
-                # Read error response with expected structure
-                # We control the error format, so read it directly and fail if invalid
-                try:
-                    response_text = await response.aread()
-                    response_json = json.loads(response_text.decode("utf-8"))
-
-                    # Expected structure: {"error": {"message": "...", "type": "...", "code": "..."}}
-                    if (
-                        not isinstance(response_json, dict)
-                        or "error" not in response_json
-                    ):
-                        raise ValueError("Response missing 'error' field")
-
-                    error_obj = response_json["error"]
-                    if not isinstance(error_obj, dict):
-                        raise ValueError("'error' field must be an object")
-
-                    if "message" not in error_obj or not isinstance(
-                        error_obj["message"], str
-                    ):
-                        raise ValueError("'error.message' field missing or invalid")
-
-                    if "type" not in error_obj or not isinstance(
-                        error_obj["type"], str
-                    ):
-                        raise ValueError("'error.type' field missing or invalid")
-
-                    # Use the error structure from response, with status code added
-                    error_data: StreamingErrorResponse = {
-                        "error": {
-                            "status": response.status_code,
-                            "message": error_obj["message"],
-                            "type": error_obj["type"],
-                            "code": error_obj.get("code", "server_error"),
-                        }
-                    }
-                except (json.JSONDecodeError, ValueError, KeyError) as e:
-                    # If we can't parse the expected structure, create a default error
-                    logger.warning(
-                        f"Failed to parse error response structure: {e}, using default error format"
-                    )
-                    error_data: StreamingErrorResponse = {
-                        "error": {
-                            "status": response.status_code,
-                            "message": f"{response.status_code} {response.reason_phrase}",
-                            "type": "server_error",
-                            "code": "server_error",
-                        }
-                    }
+async def _read_streaming_error(response: httpx.Response) -> StreamingErrorResponse:
+    """Build an error response from a non-200 streaming backend response."""
+    # Read error response with expected structure
+    # We control the error format, so read it directly and fail if invalid
+    try:
+        response_text = await response.aread()
+        response_json = json.loads(response_text.decode("utf-8"))
+
+        # Expected structure: {"error": {"message": "...", "type": "...", "code": "..."}}
+        if (
+            not isinstance(response_json, dict)
+            or "error" not in response_json
+        ):
+            raise ValueError("Response missing 'error' field")
+
+        error_obj = response_json["error"]
+        if not isinstance(error_obj, dict):
+            raise ValueError("'error' field must be an object")
+
+        if "message" not in error_obj or not isinstance(
+            error_obj["message"], str
+        ):
+            raise ValueError("'error.message' field missing or invalid")
+
+        if "type" not in error_obj or not isinstance(
+            error_obj["type"], str
+        ):
+            raise ValueError("'error.type' field missing or invalid")
+
+        # Use the error structure from response, with status code added
+        return {
+            "error": {
+                "status": response.status_code,
+                "message": error_obj["message"],
+                "type": error_obj["type"],
+                "code": error_obj.get("code", "server_error"),
+            }
+        }
+    except (json.JSONDecodeError, ValueError, KeyError) as e:
+        # If we can't parse the expected structure, create a default error
+        logger.warning(
+            f"Failed to parse error response structure: {e}, using default error format"
+        )
+        return {
+            "error": {
+                "status": response.status_code,
+                "message": f"{response.status_code} {response.reason_phrase}",
+                "type": "server_error",
+                "code": "server_error",
+            }
+        }
+
+
+class StreamingProxy:
+    """Proxy for a query's chunk stream, opened before the query exists.
+
+    The stream is requested with wait-for-query, so it can be opened while the
+    Query resource is still being created. Chunks are buffered until the
+    response is committed: the caller waits for the first chunk (or error) to
+    pick the response status, then relays the rest byte for byte with
+    keep-alive comments while the stream is idle.
+    """
 
+    def __init__(self, streaming_url: str):
+        self.streaming_url = streaming_url
+        # Items are raw SSE chunks, an error response, or None once the stream has ended
+        self._queue: asyncio.Queue = asyncio.Queue(STREAM_PROXY_QUEUE_SIZE)
+        self._task: asyncio.Task | None = None
+        self._first = None
+        self._has_first = False
+        self._error: dict | None = None
+
+    def start(self):
+        """Open the upstream stream in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._pump())
+
+    async def _pump(self):
+        try:
+            await self._read_upstream()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to stream from {self.streaming_url}: {e}")
+            await self._queue.put({
+                "error": {
+                    "status": 502,
+                    "message": f"Failed to connect to streaming backend: {e}",
+                    "type": "server_error",
+                    "code": "server_error",
+                }
+            })
+        # Not reached once cancelled: the queue is no longer read after aclose()
+        await self._queue.put(None)
+
+    async def _read_upstream(self):
+        # Waiting for queue space stops reading, so a slow client slows down the broker read
+        timeout = httpx.Timeout(BROKER_CONNECT_TIMEOUT, read=None)
+        client = get_http_client(STREAMING)
+        async with client.stream("GET", self.streaming_url, timeout=timeout) as response:
+            if response.status_code != 200:
+                await self._queue.put(await _read_streaming_error(response))
+                return
+            async for chunk in sse_body(response):
+                await self._queue.put(chunk)
+
+    async def wait_first(self, timeout: float):
+        """Wait for the first chunk, error or end of stream; returns None on timeout or end."""
+        if not self._has_first:
+            try:
+                self._first = await asyncio.wait_for(self._queue.get(), timeout)
+                self._has_first = True
+            except asyncio.TimeoutError:
+                return None
+        return self._first
+
+    async def _chunks(self):
+        """Upstream chunks until the end of the stream or an error response."""
+        item = self._first if self._has_first else await self._queue.get()
+        while item is not None:
+            if isinstance(item, dict):
+                self._error = item
+                return
+            yield item
+            item = await self._queue.get()
+
+    async def relay(self, heartbeat_interval: float = SSE_HEARTBEAT_INTERVAL):
+        """Yield upstream chunks unchanged, sending keep-alive comments while the stream is idle."""
+        sse = SSERelay(heartbeat_interval)
+        try:
+            async with aclosing(sse.relay(self._chunks())) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            if self._error is not None:
                 # Forward the error response as an SSE error event
-                yield f"data: {json.dumps(error_data)}\n\n"
-                return  # Streaming failed, exit generator
-            # Use aiter_lines() for line-by-line streaming without buffering
-            async for line in response.aiter_lines():
-                if line.strip():  # Skip empty lines
-                    # SSE format: each chunk is on its own line
-                    yield line + "\n\n"  # Add back SSE double newline separator
+                yield sse.error_event(self._error)
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        """Close the upstream stream."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
 
 
 @router.post("/chat/completions")
@@ -238,10 +331,6 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
         )
 
         async with with_ark_client(namespace, "v1alpha1") as ark_client:
-            # Create the query using QueryV1alpha1 object like queries API
-            await ark_client.queries.a_create(query_resource)
-            logger.info(f"Created query: {query_name}")
-
             # Extract timeout from query spec
             query_timeout_str = query_resource.spec.timeout
             timeout_seconds = parse_duration_to_seconds(query_timeout_str) or 300
@@ -249,6 +338,9 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
             # If the caller didn't request streaming, we can simply poll for
             # the response.
             if not request.stream:
+                # Create the query using QueryV1alpha1 object like queries API
+                await ark_client.queries.a_create(query_resource)
+                logger.info(f"Created query: {query_name}")
                 return await watch_query_completion(
                     ark_client, query_name, model, messages, timeout_seconds
                 )
@@ -261,12 +353,13 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
                 "Connection": "keep-alive",
             }
 
-            api = k8s_client.ApiClient()
-            v1 = k8s_client.CoreV1Api(api)
-            streaming_config = await get_streaming_config(v1, namespace)
+            # Resolved once per namespace and kept until the ConfigMap or Service changes
+            streaming_config, base_url = await get_streaming_endpoint_cache().resolve(namespace)
 
             # If no config or not enabled, fall back to polling
             if not streaming_config or not streaming_config.enabled:
+                await ark_client.queries.a_create(query_resource)
+                logger.info(f"Created query: {query_name}")
                 logger.info("No streaming backend configured, falling back to polling")
                 completion = await watch_query_completion(
                     ark_client, query_name, model, messages, timeout_seconds
@@ -276,14 +369,32 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
                     iter(sse_lines), media_type="text/event-stream", headers=sse_headers
                 )
 
-            # Streaming is enabled - get the base URL and construct full URL
-            base_url = await get_streaming_base_url(streaming_config, namespace, v1)
+            # Streaming is enabled - open the stream while the query is created,
+            # the broker holds it until the query exists (wait-for-query)
             streaming_url = f"{base_url}/stream/{query_name}?from-beginning=true&wait-for-query={timeout_seconds}"
+            proxy = StreamingProxy(streaming_url)
+            proxy.start()
+            try:
+                await ark_client.queries.a_create(query_resource)
+                logger.info(f"Created query: {query_name}")
+
+                # Hold the response status until the first chunk arrives, so
+                # backend errors can still be returned with their status code
+                first = await proxy.wait_first(STREAM_FIRST_CHUNK_TIMEOUT)
+            except BaseException:
+                await proxy.aclose()
+                raise
+
+            if isinstance(first, dict):
+                await proxy.aclose()
+                error = dict(first["error"])
+                status_code = error.pop("status", 500)
+                return JSONResponse(status_code=status_code, content={"error": error})
 
             # Proxy to the streaming endpoint
             logger.info(f"Streaming available for query: {query_name}")
             return StreamingResponse(
-                proxy_streaming_response(streaming_url),
+                proxy.relay(SSE_HEARTBEAT_INTERVAL),
                 media_type="text/event-stream",
                 headers=sse_headers,
             )
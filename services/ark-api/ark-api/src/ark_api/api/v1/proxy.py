@@ -8,6 +8,8 @@ from typing import List
 
 from ark_sdk.k8s import get_context
 
+from ...utils.http_clients import PROXY, get_http_client
+
 router = APIRouter(prefix="/proxy/services", tags=["proxy"])
 
 
@@ -53,25 +55,24 @@ async def _proxy_request_impl(
         target_url += "?" + "&".join(f"{k}={v}" for k, v in query_params.items())
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=dict(request.headers),
-                content=await request.body(),
-                params=query_params,
-            )
-
-            filtered_headers = {
-                k: v for k, v in response.headers.items()
-                if k.lower() not in ["transfer-encoding"]
-            }
-
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=filtered_headers,
-            )
+        response = await get_http_client(PROXY).request(
+            method=request.method,
+            url=target_url,
+            headers=dict(request.headers),
+            content=await request.body(),
+            params=query_params,
+        )
+
+        filtered_headers = {
+            k: v for k, v in response.headers.items()
+            if k.lower() not in ["transfer-encoding"]
+        }
+
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers=filtered_headers,
+        )
     except httpx.RequestError as e:
         raise HTTPException(
             status_code=502,
@@ -1,7 +1,7 @@
 """API routes for Query resources."""
 
 from datetime import datetime
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from typing import Optional
 from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
 from ark_sdk.models.query_v1alpha1_spec import QueryV1alpha1Spec
@@ -15,6 +15,9 @@ from ...models.queries import (
     QueryUpdateRequest,
     QueryDetailResponse
 )
+from ...core.constants import GROUP
+from ...utils.resource_watch import watch_response
+from ...utils.etag import ConditionalGet, collection_etag, resource_etag
 from .exceptions import handle_k8s_errors
 
 router = APIRouter(
@@ -26,6 +29,15 @@ router = APIRouter(
 VERSION = "v1alpha1"
 
 
+def _query_index_key(query: dict, index: str) -> Optional[str]:
+    """Get the value a query is indexed under for the given index."""
+    spec = query.get("spec") or {}
+    if index == "target":
+        target = spec.get("target") or {}
+        return f"{target.get('type')}/{target.get('name')}" if target else None
+    return spec.get(index)
+
+
 def query_to_response(query: dict) -> QueryResponse:
     """Convert a Kubernetes query object to response model."""
     creation_timestamp = None
@@ -84,16 +96,54 @@ def query_to_detail_response(query: dict) -> QueryDetailResponse:
 
 @router.get("", response_model=QueryListResponse)
 @handle_k8s_errors(operation="list", resource_type="query")
-async def list_queries(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> QueryListResponse:
-    """List all queries in a namespace."""
+async def list_queries(
+    session_id: Optional[str] = Query(None, description="Filter queries by session ID"),
+    conversation_id: Optional[str] = Query(None, description="Filter queries by conversation ID"),
+    target: Optional[str] = Query(None, description="Filter queries by target, formatted as type/name (e.g. agent/my-agent)"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of queries to return, enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
+    watch: bool = Query(False, description="Stream changes as server-sent events instead of returning the list"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
+    conditional: ConditionalGet = Depends(),
+) -> QueryListResponse:
+    """List all queries in a namespace, optionally filtered by session, conversation or target, paginated, or watched."""
+    filters = [("sessionId", session_id), ("conversationId", conversation_id), ("target", target)]
+    filters = [(index, key) for index, key in filters if key]
+    if filters and (limit or cursor):
+        raise HTTPException(status_code=400, detail="Pagination cannot be combined with session, conversation or target filters")
+    if watch and (filters or limit or cursor):
+        raise HTTPException(status_code=400, detail="Watch cannot be combined with filters or pagination")
+
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.queries.a_list()
+        if watch:
+            return await watch_response(GROUP, VERSION, "queries", ark_client.namespace, query_to_response, last_event_id)
+
+        next_cursor = None
+        if limit or cursor:
+            result, next_cursor = await ark_client.queries.a_list_page(limit=limit, continue_token=cursor, raw=True)
+        elif filters:
+            # Look up the first filter through its index, then narrow down by the others
+            index, key = filters[0]
+            result = await ark_client.queries.a_list_by_index(index, key, raw=True)
+            result = [
+                item for item in result
+                if all(_query_index_key(item, index) == key for index, key in filters[1:])
+            ]
+        else:
+            result = await ark_client.queries.a_list(raw=True)
+        
+        not_modified = conditional.not_modified(collection_etag(result))
+        if not_modified:
+            return not_modified
         
-        queries = [query_to_response(item.to_dict()) for item in result]
+        # Raw reads skip building pydantic models only to dump them again
+        queries = [query_to_response(item) for item in result]
         
         return QueryListResponse(
             items=queries,
-            count=len(queries)
+            count=len(queries),
+            cursor=next_cursor
         )
 
 
@@ -162,12 +212,15 @@ async def create_query(
 
 @router.get("/{query_name}", response_model=QueryDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="query")
-async def get_query(query_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> QueryDetailResponse:
+async def get_query(query_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> QueryDetailResponse:
     """Get a specific query."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.queries.a_get(query_name)
+        result = await ark_client.queries.a_get(query_name, raw=True)
+        not_modified = conditional.not_modified(resource_etag(result))
+        if not_modified:
+            return not_modified
         
-        return query_to_detail_response(result.to_dict())
+        return query_to_detail_response(result)
 
 
 @router.put("/{query_name}", response_model=QueryDetailResponse)
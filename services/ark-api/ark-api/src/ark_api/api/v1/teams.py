@@ -1,7 +1,7 @@
 """Kubernetes teams API endpoints."""
 import logging
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Header, Query
 from typing import Optional
 from ark_sdk.models.team_v1alpha1 import TeamV1alpha1
 
@@ -15,6 +15,9 @@ from ...models.teams import (
     TeamDetailResponse
 )
 from ...models.common import extract_availability_from_conditions
+from ...core.constants import GROUP
+from ...utils.resource_watch import watch_response
+from ...utils.etag import ConditionalGet, collection_etag, resource_etag
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -72,22 +75,35 @@ def team_to_detail_response(team: dict) -> TeamDetailResponse:
 
 @router.get("", response_model=TeamListResponse)
 @handle_k8s_errors(operation="list", resource_type="team")
-async def list_teams(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> TeamListResponse:
+async def list_teams(
+    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
+    watch: bool = Query(False, description="Stream changes as server-sent events instead of returning the list"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Resume an SSE stream after this event"),
+    conditional: ConditionalGet = Depends(),
+) -> TeamListResponse:
     """
     List all Team CRs in a namespace.
     
     Args:
         namespace: The namespace to list teams from
+        watch: Stream added, modified and deleted teams as server-sent events
+        last_event_id: Event id to resume a watch stream from
         
     Returns:
         TeamListResponse: List of all teams in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        teams = await ark_client.teams.a_list()
+        if watch:
+            return await watch_response(GROUP, VERSION, "teams", ark_client.namespace, team_to_response, last_event_id)
+
+        teams = await ark_client.teams.a_list(raw=True)
+        not_modified = conditional.not_modified(collection_etag(teams))
+        if not_modified:
+            return not_modified
         
         team_list = []
         for team in teams:
-            team_list.append(team_to_response(team.to_dict()))
+            team_list.append(team_to_response(team))
         
         return TeamListResponse(
             items=team_list,
@@ -149,7 +165,7 @@ async def create_team(body: TeamCreateRequest, namespace: Optional[str] = Query(
 
 @router.get("/{team_name}", response_model=TeamDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="team")
-async def get_team(team_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> TeamDetailResponse:
+async def get_team(team_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> TeamDetailResponse:
     """
     Get a specific Team CR by name.
     
@@ -161,9 +177,12 @@ async def get_team(team_name: str, namespace: Optional[str] = Query(None, descri
         TeamDetailResponse: The team details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        team = await ark_client.teams.a_get(team_name)
+        team = await ark_client.teams.a_get(team_name, raw=True)
+        not_modified = conditional.not_modified(resource_etag(team))
+        if not_modified:
+            return not_modified
         
-        return team_to_detail_response(team.to_dict())
+        return team_to_detail_response(team)
 
 
 @router.put("/{team_name}", response_model=TeamDetailResponse)
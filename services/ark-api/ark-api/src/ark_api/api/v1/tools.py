@@ -1,7 +1,7 @@
 """Kubernetes tools API endpoints."""
 import logging
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from typing import Optional
 from ark_sdk.models.tool_v1alpha1 import ToolV1alpha1
 from ark_sdk.models.tool_v1alpha1_spec import ToolV1alpha1Spec
@@ -15,6 +15,7 @@ from ...models.tools import (
     ToolUpdateRequest,
     ToolDetailResponse
 )
+from ...utils.etag import ConditionalGet, collection_etag, resource_etag
 from .exceptions import handle_k8s_errors
 
 logger = logging.getLogger(__name__)
@@ -59,7 +60,7 @@ def tool_to_detail_response(tool: dict) -> ToolDetailResponse:
 
 @router.get("", response_model=ToolListResponse)
 @handle_k8s_errors(operation="list", resource_type="tool")
-async def list_tools(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> ToolListResponse:
+async def list_tools(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> ToolListResponse:
     """
     List all Tool CRs in a namespace.
     
@@ -70,11 +71,14 @@ async def list_tools(namespace: Optional[str] = Query(None, description="Namespa
         ToolListResponse: List of all tools in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        tools = await ark_client.tools.a_list()
+        tools = await ark_client.tools.a_list(raw=True)
+        not_modified = conditional.not_modified(collection_etag(tools))
+        if not_modified:
+            return not_modified
         
         tool_list = []
         for tool in tools:
-            tool_list.append(tool_to_response(tool.to_dict()))
+            tool_list.append(tool_to_response(tool))
         
         return ToolListResponse(
             items=tool_list,
@@ -117,7 +121,7 @@ async def create_tool(body: ToolCreateRequest, namespace: Optional[str] = Query(
 
 @router.get("/{tool_name}", response_model=ToolDetailResponse)
 @handle_k8s_errors(operation="get", resource_type="tool")
-async def get_tool(tool_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> ToolDetailResponse:
+async def get_tool(tool_name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"), conditional: ConditionalGet = Depends()) -> ToolDetailResponse:
     """
     Get a specific Tool CR by name.
     
@@ -129,9 +133,12 @@ async def get_tool(tool_name: str, namespace: Optional[str] = Query(None, descri
         ToolDetailResponse: The tool details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        tool = await ark_client.tools.a_get(tool_name)
+        tool = await ark_client.tools.a_get(tool_name, raw=True)
+        not_modified = conditional.not_modified(resource_etag(tool))
+        if not_modified:
+            return not_modified
         
-        return tool_to_detail_response(tool.to_dict())
+        return tool_to_detail_response(tool)
 
 
 @router.put("/{tool_name}", response_model=ToolDetailResponse, include_in_schema=False)
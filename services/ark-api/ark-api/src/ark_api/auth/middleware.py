@@ -14,16 +14,17 @@ Note: JWKS URL is automatically derived from the issuer URL
 
 import logging
 import os
+from typing import Optional
 from fastapi import Request, APIRouter
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .config import is_route_authenticated
 from .constants import AuthMode, AuthHeader
 
 # Import from ark_sdk
 from ark_sdk.auth.exceptions import TokenValidationError
-from ark_sdk.auth.validator import TokenValidator
+from ark_sdk.auth.validator import get_token_validator
 from ark_sdk.auth.basic import BasicAuthValidator
 
 # Import API key service
@@ -35,7 +36,7 @@ __all__ = ['AuthMiddleware', 'TokenValidationError']
 logger = logging.getLogger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Middleware that automatically protects all routes except those in PUBLIC_ROUTES.
     Supports multiple authentication modes:
@@ -43,10 +44,14 @@ class AuthMiddleware(BaseHTTPMiddleware):
     - basic: API key basic auth only  
     - hybrid: Both OIDC/JWT and basic auth
     - open: No authentication (development)
+    
+    Implemented as raw ASGI middleware: once a request is authenticated the
+    app talks to the server directly, so streaming responses are not copied
+    through an extra task and memory stream.
     """
     
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         # API keys are always stored in current context namespace for security
         self.api_key_service = APIKeyService()
         
@@ -87,7 +92,26 @@ class AuthMiddleware(BaseHTTPMiddleware):
         
         logger.info(f"Authentication middleware initialized with mode: {auth_mode or 'open (default)'}")
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # API key data set on request.state is kept in the scope for the route handlers
+        error_response = await self.authenticate(Request(scope))
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
+    
+    async def authenticate(self, request: Request) -> Optional[JSONResponse]:
+        """
+        Authenticate a request.
+        
+        Returns:
+            None if the request may proceed, or the error response to send
+        """
         # Get the path from the request
         path = request.url.path
         
@@ -104,14 +128,12 @@ class AuthMiddleware(BaseHTTPMiddleware):
         
         if auth_disabled:
             logger.debug("Authentication disabled")
-            response = await call_next(request)
-            return response
+            return None
         
         # Check if this route should be authenticated
         if not is_route_authenticated(path):
             logger.debug(f"Route {path} is public, skipping authentication")
-            response = await call_next(request)
-            return response
+            return None
         
         # Route requires authentication
         auth_header = request.headers.get("Authorization")
@@ -132,9 +154,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 if not token:
                     auth_error = "Missing token"
                 else:
-                    # Validate JWT token using ark_sdk validator
-                    validator = TokenValidator()
-                    await validator.validate_token(token)
+                    # Validate JWT token using the shared ark_sdk validator, which caches the JWKS
+                    await get_token_validator().validate_token(token)
                     auth_success = True
                     logger.debug("JWT authentication successful")
                     
@@ -191,8 +212,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             )
         
         # Authentication successful, continue to the next middleware/route handler
-        response = await call_next(request)
-        return response
+        return None
 
 
 def add_auth_to_routes(router: APIRouter) -> None:
@@ -9,8 +9,8 @@ def get_current_context() -> dict:
     """
     Get the current Kubernetes context.
 
-    Directly calls ark-sdk's get_context() for fresh detection.
-    No caching to ensure each request gets accurate context.
+    Calls ark-sdk's get_context(), which caches the context and reloads it
+    when the namespace file or kubeconfig changes.
 
     Returns:
         dict: Context with 'namespace' and 'cluster' keys
@@ -0,0 +1,95 @@
+"""Sampled access logging with request timing, as raw ASGI middleware."""
+import logging
+import os
+import random
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Fraction of requests logged, besides server errors and slow requests which always are
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv('ACCESS_LOG_SAMPLE_RATE', '0.1'))
+# Maximum sampled access log lines per second
+ACCESS_LOG_MAX_PER_SECOND = int(os.getenv('ACCESS_LOG_MAX_PER_SECOND', '20'))
+# Seconds after which a request is logged regardless of sampling
+ACCESS_LOG_SLOW_REQUEST = float(os.getenv('ACCESS_LOG_SLOW_REQUEST', '2.0'))
+
+
+class RequestLoggingMiddleware:
+    """
+    Logs requests with their status, time to first byte and duration.
+
+    Server errors and requests slower than ACCESS_LOG_SLOW_REQUEST are always
+    logged; other requests are sampled at ACCESS_LOG_SAMPLE_RATE, up to
+    ACCESS_LOG_MAX_PER_SECOND lines a second. Streaming responses are logged
+    once, when the stream ends.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = ACCESS_LOG_SAMPLE_RATE,
+        max_per_second: int = ACCESS_LOG_MAX_PER_SECOND,
+        slow_request: float = ACCESS_LOG_SLOW_REQUEST,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self.slow_request = slow_request
+        self._window = 0
+        self._window_count = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status: Optional[int] = None
+        first_byte: Optional[float] = None
+
+        async def send_with_status(message: Message):
+            nonlocal status, first_byte
+            # Only the first message is inspected; body chunks pass straight through
+            if status is None and message["type"] == "http.response.start":
+                status = message["status"]
+                first_byte = time.perf_counter() - start
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            if self._should_log(status, duration):
+                self._log(scope, status, first_byte, duration)
+
+    def _should_log(self, status: Optional[int], duration: float) -> bool:
+        if status is None or status >= 500 or duration >= self.slow_request:
+            return True
+        if random.random() >= self.sample_rate:
+            return False
+        window = int(time.monotonic())
+        if window != self._window:
+            self._window = window
+            self._window_count = 0
+        if self._window_count >= self.max_per_second:
+            return False
+        self._window_count += 1
+        return True
+
+    def _log(self, scope: Scope, status: Optional[int], first_byte: Optional[float], duration: float):
+        session_id = None
+        for name, value in scope.get("headers") or []:
+            if name == b"x-session-id":
+                session_id = value.decode("latin-1")
+                break
+        session_info = f"session={session_id}" if session_id else "no-session"
+        query = scope.get("query_string", b"").decode("latin-1")
+        path = f"{scope['path']}?{query}" if query else scope["path"]
+        first_byte_info = f"{first_byte:.3f}s" if first_byte is not None else "-"
+        logger.info(
+            f"{scope['method']} {path} - {session_info} - Status: {status or 500} - "
+            f"First byte: {first_byte_info} - Time: {duration:.3f}s"
+        )
@@ -1,16 +1,14 @@
 import os
-import time
 from contextlib import asynccontextmanager
 from importlib.metadata import version, PackageNotFoundError
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from kubernetes_asyncio import client
 from dotenv import load_dotenv
 from typing import Dict, Any
-from opentelemetry import baggage, propagate, trace
+from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
@@ -21,11 +19,20 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from .api import router
 from .core.config import setup_logging
 from .auth.middleware import AuthMiddleware
+from .core.request_logging import RequestLoggingMiddleware
 from .auth.constants import AuthMode
 from .auth.config import get_public_routes
-from .openapi.security import add_security_to_openapi
+from .openapi.schema import OpenAPIDocumentCache
 from .api.v1.a2a_gateway import get_a2a_manager
+from .api.v1.broker import get_broker_url_cache
 from ark_sdk.k8s import init_k8s
+from ark_sdk.client import close_clients
+from .utils.query_watch import get_query_completion_hub
+from .utils.http_clients import get_http_client_registry
+from .utils.sse_fanout import get_sse_fanout_hub
+from .utils.resource_watch import get_resource_watch_hub
+from .utils.etag import etag_matches
+from .services.api_keys import get_api_key_cache, get_last_used_recorder
 
 # Load environment variables from .env file
 load_dotenv()
@@ -67,20 +74,6 @@ def setup_telemetry():
     logger.info(f"Telemetry initialized for {service_name} -> {otel_endpoint}")
 
 
-def extract_session_context(request: Request):
-    """Extract OTEL context and session ID from request headers"""
-    # Extract OTEL trace context from headers
-    ctx = propagate.extract(request.headers)
-    
-    # Extract session ID from custom header
-    session_id = request.headers.get("x-session-id")
-    if session_id:
-        # Add session to baggage
-        ctx = baggage.set_baggage("session.id", session_id, context=ctx)
-    
-    return ctx, session_id
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
@@ -105,8 +98,21 @@ async def lifespan(app: FastAPI):
     # Shutdown A2A manager
     await a2a_manager.shutdown()
     
-    # Close all kubernetes async clients
-    await client.ApiClient().close()
+    # Stop the shared query completion and broker URL watches, and the shared broker streams
+    await get_query_completion_hub().close()
+    get_broker_url_cache().invalidate()
+    await get_sse_fanout_hub().close()
+    await get_resource_watch_hub().close()
+    
+    # Write the pending API key last-used timestamps and stop the API key secret watches
+    await get_last_used_recorder().close()
+    await get_api_key_cache().close()
+    
+    # Close the pooled HTTP clients of broker, memory and proxied services
+    await get_http_client_registry().aclose()
+    
+    # Close the shared kubernetes connection pool
+    await close_clients()
 
 
 app = FastAPI(
@@ -139,6 +145,8 @@ async def custom_swagger_ui_html(request: Request):
         title=app.title + " - Swagger UI",
     )
 
+openapi_documents = OpenAPIDocumentCache(app.openapi)
+
 # Custom OpenAPI spec that respects standard HTTP forwarding headers
 # Uses X-Forwarded-Prefix, X-Forwarded-Host, and X-Forwarded-Proto headers
 # set by dashboard middleware and ingress routes to determine the external server URL
@@ -146,30 +154,25 @@ async def custom_swagger_ui_html(request: Request):
 # without hardcoding deployment paths
 @app.get("/openapi.json", include_in_schema=False)
 async def custom_openapi(request: Request):
-    # Get the default OpenAPI spec
-    openapi_schema = app.openapi()
-    
     # Inject auth security schemes based on AUTH_MODE so that generated SDKs include auth
     auth_mode = os.getenv("AUTH_MODE", "").lower() or AuthMode.OPEN
-    openapi_schema = add_security_to_openapi(
-        openapi_schema,
-        auth_mode=auth_mode,
-        public_routes=get_public_routes(),
-    )
     
     # Check if we have X-Forwarded-Prefix header indicating external path prefix
     forwarded_prefix = request.headers.get("x-forwarded-prefix", "")
     
+    server_url = None
     if forwarded_prefix:
         # Construct the external server URL using standard forwarding headers
         host = request.headers.get("x-forwarded-host") or request.headers.get("host", "localhost:8000")
         protocol = request.headers.get("x-forwarded-proto", "http")
+        # Set as the servers of the spec for correct Swagger UI "Try it out" functionality
         server_url = f"{protocol}://{host}{forwarded_prefix}"
-        
-        # Update the servers in the OpenAPI spec for correct Swagger UI "Try it out" functionality
-        openapi_schema["servers"] = [{"url": server_url, "description": "Current server"}]
     
-    return openapi_schema
+    # The schema is built and serialised once per variant, then served as bytes
+    body, etag = openapi_documents.get(auth_mode, get_public_routes(), server_url)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 # Configure CORS
 cors_origins = os.getenv("CORS_ORIGINS", "").strip()
@@ -196,30 +199,8 @@ app.include_router(router)
 # Add global authentication middleware (protects all routes by default except PUBLIC_ROUTES)
 app.add_middleware(AuthMiddleware)
 
-
-@app.middleware("http")
-async def session_aware_middleware(request: Request, call_next):
-    """Middleware for session tracking and request timing with OTEL context"""
-    start_time = time.time()
-    
-    # Extract OTEL context and session ID
-    otel_ctx, session_id = extract_session_context(request)
-    
-    # Add session info to logs
-    session_info = f"session={session_id}" if session_id else "no-session"
-    logger.info(
-        f"Request: {request.method} {request.url.path} - {session_info} - Query: {dict(request.query_params)}"
-    )
-    
-    # Process request with OTEL context
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    logger.info(
-        f"Response: {request.method} {request.url.path} - {session_info} - Status: {response.status_code} - Time: {process_time:.3f}s"
-    )
-    
-    return response
+# Sampled access logging with session and timing, outermost so it also times authentication
+app.add_middleware(RequestLoggingMiddleware)
 
 
 # Custom exception handler for validation errors
@@ -4,6 +4,12 @@ from typing import List, Optional
 from pydantic import BaseModel
 
 
+class MemoryErrorResponse(BaseModel):
+    """A memory service that could not be queried."""
+    memoryName: str
+    error: str
+
+
 class ConversationResponse(BaseModel):
     """Response model for a conversation."""
     conversationId: str
@@ -17,6 +23,7 @@ class ConversationListResponse(BaseModel):
     """Response model for listing conversations."""
     items: List[ConversationResponse]
     total: Optional[int] = None
+    errors: Optional[List[MemoryErrorResponse]] = None
 
 
 class MemoryMessageResponse(BaseModel):
@@ -33,3 +40,4 @@ class MemoryMessageListResponse(BaseModel):
     """Response model for listing memory messages."""
     items: List[MemoryMessageResponse]
     total: Optional[int] = None
+    errors: Optional[List[MemoryErrorResponse]] = None
@@ -131,12 +131,14 @@ class EvaluationListResponse(BaseModel):
     """Response for listing evaluations."""
     items: List[EvaluationResponse]
     count: int
+    cursor: Optional[str] = None  # Pass back as ?cursor= to fetch the next page
 
 
 class EnhancedEvaluationListResponse(BaseModel):
     """Enhanced response for listing evaluations with metadata."""
     items: List[EnhancedEvaluationResponse]
     count: int
+    cursor: Optional[str] = None  # Pass back as ?cursor= to fetch the next page
 
 
 class EvaluationCreateRequest(BaseModel):
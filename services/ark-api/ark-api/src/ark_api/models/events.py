@@ -28,6 +28,7 @@ class EventListResponse(BaseModel):
     """Response model for listing events."""
     items: List[EventResponse]
     total: int
+    cursor: Optional[str] = None  # Pass back as ?cursor= to fetch the next page
 
 
 def event_to_response(event_dict: Dict[str, Any]) -> EventResponse:
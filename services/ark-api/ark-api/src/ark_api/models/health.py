@@ -1,5 +1,5 @@
 """Health check response models."""
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 
 
@@ -14,3 +14,19 @@ class ReadinessResponse(BaseModel):
     status: str = Field(..., description="Readiness status", example="ready")
     service: str = Field(..., description="Service name", example="ark-api")
     error: Optional[str] = Field(None, description="Error message if not ready", example="Connection refused")
+
+
+class HTTPPoolStats(BaseModel):
+    """Connection pool usage of one upstream HTTP client."""
+    max_connections: int = Field(..., description="Maximum number of connections of the pool")
+    requests: int = Field(..., description="Requests sent since the client was created")
+    in_flight: int = Field(..., description="Requests currently holding a connection")
+    peak_in_flight: int = Field(..., description="Highest number of concurrent requests")
+    saturated: int = Field(..., description="Requests that started while every connection was in use")
+    connections: int = Field(..., description="Open connections")
+    idle_connections: int = Field(..., description="Open connections available for reuse")
+
+
+class HTTPClientStatsResponse(BaseModel):
+    """Connection pool usage per upstream service."""
+    pools: Dict[str, HTTPPoolStats] = Field(default_factory=dict, description="Pool usage keyed by upstream")
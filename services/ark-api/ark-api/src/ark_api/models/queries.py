@@ -89,6 +89,7 @@ class QueryListResponse(BaseModel):
     """Response for listing queries."""
     items: List[QueryResponse]
     count: int
+    cursor: Optional[str] = None  # Pass back as ?cursor= to fetch the next page
 
 
 class QueryCreateRequest(BaseModel):
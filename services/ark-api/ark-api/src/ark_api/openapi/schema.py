@@ -0,0 +1,44 @@
+"""OpenAPI document served from serialised bytes, built once per variant."""
+import copy
+import hashlib
+import json
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set, Tuple
+
+from .security import add_security_to_openapi
+
+# Server URL variants kept, since they come from request headers
+MAX_OPENAPI_VARIANTS = 16
+
+
+class OpenAPIDocumentCache:
+    """
+    The app's OpenAPI document as JSON bytes with an ETag.
+
+    A variant is built on first request for each auth mode, set of public
+    routes and external server URL, and then served without rebuilding or
+    re-serialising the schema.
+    """
+
+    def __init__(self, build_schema: Callable[[], Dict[str, Any]]):
+        self._build_schema = build_schema
+        self._documents: Dict[Tuple[str, FrozenSet[str], Optional[str]], Tuple[bytes, str]] = {}
+
+    def get(self, auth_mode: str, public_routes: Set[str], server_url: Optional[str] = None) -> Tuple[bytes, str]:
+        """Get the JSON body and ETag of the document."""
+        key = (auth_mode, frozenset(public_routes), server_url)
+        document = self._documents.get(key)
+        if document is None:
+            # The app caches its schema; each variant gets its own copy to modify
+            schema = add_security_to_openapi(copy.deepcopy(self._build_schema()), auth_mode, public_routes)
+            if server_url:
+                schema["servers"] = [{"url": server_url, "description": "Current server"}]
+            body = json.dumps(schema, separators=(",", ":")).encode("utf-8")
+            document = (body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+            if len(self._documents) >= MAX_OPENAPI_VARIANTS:
+                self._documents.pop(next(iter(self._documents)))
+            self._documents[key] = document
+        return document
+
+    def clear(self):
+        """Drop the built documents, e.g. after routes change."""
+        self._documents.clear()
@@ -1,16 +1,25 @@
 """API key management service."""
 
+import asyncio
+import hashlib
+import hmac
+import os
 import secrets
+import time
 import bcrypt
 import base64
 import json
 import logging
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional, Tuple, Dict, Any
-from kubernetes_asyncio import client
+from kubernetes_asyncio import client, watch
 from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.rest import ApiException
 
+from ark_sdk.informer import RETRY_BACKOFF_SECONDS, WATCH_TIMEOUT_SECONDS
 from ark_sdk.k8s import get_context
 
 from ..models.auth import (
@@ -35,6 +44,25 @@ API_KEY_ANNOTATION = ARK_PREFIX + "api-key-metadata"  # JSON annotation with all
 PUBLIC_KEY_TOKEN_LENGTH = 32  # bytes for public key token generation
 SECRET_KEY_TOKEN_LENGTH = 48  # bytes for secret key token generation
 
+# Threads running bcrypt, which would otherwise block the event loop for each check
+API_KEY_BCRYPT_THREADS = int(os.getenv('API_KEY_BCRYPT_THREADS', '4'))
+# Seconds a verified API key is trusted before its Secret is read again
+API_KEY_CACHE_TTL = float(os.getenv('API_KEY_CACHE_TTL', '300.0'))
+# Verified API keys kept in the cache
+API_KEY_CACHE_SIZE = int(os.getenv('API_KEY_CACHE_SIZE', '256'))
+# Seconds between batched writes of last-used timestamps
+API_KEY_LAST_USED_FLUSH_INTERVAL = float(os.getenv('API_KEY_LAST_USED_FLUSH_INTERVAL', '60.0'))
+
+_bcrypt_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_bcrypt_executor() -> ThreadPoolExecutor:
+    """Get the thread pool bcrypt runs on."""
+    global _bcrypt_executor
+    if _bcrypt_executor is None:
+        _bcrypt_executor = ThreadPoolExecutor(max_workers=API_KEY_BCRYPT_THREADS, thread_name_prefix="bcrypt")
+    return _bcrypt_executor
+
 
 class APIKeyService:
     """Service for managing API keys stored as Kubernetes secrets."""
@@ -86,6 +114,11 @@ class APIKeyService:
             logger.error(f"Error verifying secret key: {e}")
             return False
     
+    async def _run_bcrypt(self, func, *args):
+        """Run a bcrypt hash or check on the bcrypt thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_bcrypt_executor(), func, *args)
+    
     def _secret_name_from_public_key(self, public_key: str) -> str:
         """Generate a Kubernetes secret name from a public key.
         
@@ -215,7 +248,7 @@ class APIKeyService:
         """
         # Generate key pair
         public_key, secret_key = self._generate_key_pair()
-        secret_key_hash = self._hash_secret_key(secret_key)
+        secret_key_hash = await self._run_bcrypt(self._hash_secret_key, secret_key)
         
         # Prepare metadata
         now = datetime.now(timezone.utc)
@@ -327,6 +360,57 @@ class APIKeyService:
             count=len(api_keys)
         )
     
+    def _api_key_data_from_secret(self, secret, public_key: str) -> Optional[Dict[str, Any]]:
+        """Get the data of a usable API key from its secret.
+        
+        Args:
+            secret: The Kubernetes secret of the API key
+            public_key: The public key the secret was looked up by
+            
+        Returns:
+            Dictionary with API key data or None if the key can't be used
+        """
+        # Check if it's an API key secret
+        if secret.type != API_KEY_TYPE:
+            return None
+        
+        # Parse data
+        data = secret.data or {}
+        annotations = secret.metadata.annotations or {}
+        
+        stored_public_key = base64.b64decode(data.get("public_key", "")).decode('utf-8') if data.get("public_key") else ""
+        secret_key_hash = base64.b64decode(data.get("secret_key_hash", "")).decode('utf-8') if data.get("secret_key_hash") else ""
+        is_active = base64.b64decode(data.get("is_active", "")).decode('utf-8') == "true" if data.get("is_active") else True
+        
+        # Parse JSON annotation
+        api_key_json = annotations.get(API_KEY_ANNOTATION, "{}")
+        metadata = self._parse_api_key_annotation(api_key_json)
+        
+        # Verify public key matches
+        if stored_public_key != public_key:
+            return None
+        
+        # Check if key is active (not soft-deleted)
+        deleted_at = metadata["deleted_at"]
+        if not is_active or deleted_at is not None:
+            return None
+        
+        # Check expiration
+        expires_at = metadata["expires_at"]
+        if expires_at and expires_at < datetime.now(timezone.utc):
+            return None
+        
+        return {
+            "id": str(secret.metadata.uid),
+            "name": metadata["name"],
+            "public_key": public_key,
+            "secret_key_hash": secret_key_hash,
+            "is_active": is_active,
+            "expires_at": expires_at,
+            "secret_name": secret.metadata.name,
+            "resource_version": secret.metadata.resource_version
+        }
+    
     async def get_api_key_by_public_key(self, public_key: str) -> Optional[Dict[str, Any]]:
         """Get API key data by public key for authentication.
         
@@ -346,45 +430,7 @@ class APIKeyService:
                     namespace=self.namespace
                 )
             
-            # Check if it's an API key secret
-            if secret.type != API_KEY_TYPE:
-                return None
-            
-            # Parse data
-            data = secret.data or {}
-            annotations = secret.metadata.annotations or {}
-            
-            stored_public_key = base64.b64decode(data.get("public_key", "")).decode('utf-8') if data.get("public_key") else ""
-            secret_key_hash = base64.b64decode(data.get("secret_key_hash", "")).decode('utf-8') if data.get("secret_key_hash") else ""
-            is_active = base64.b64decode(data.get("is_active", "")).decode('utf-8') == "true" if data.get("is_active") else True
-            
-            # Parse JSON annotation
-            api_key_json = annotations.get(API_KEY_ANNOTATION, "{}")
-            metadata = self._parse_api_key_annotation(api_key_json)
-            
-            # Verify public key matches
-            if stored_public_key != public_key:
-                return None
-            
-            # Check if key is active (not soft-deleted)
-            deleted_at = metadata["deleted_at"]
-            if not is_active or deleted_at is not None:
-                return None
-            
-            # Check expiration
-            expires_at = metadata["expires_at"]
-            if expires_at and expires_at < datetime.now(timezone.utc):
-                return None
-            
-            return {
-                "id": str(secret.metadata.uid),
-                "name": metadata["name"],
-                "public_key": public_key,
-                "secret_key_hash": secret_key_hash,
-                "is_active": is_active,
-                "expires_at": expires_at,
-                "secret_name": secret_name
-            }
+            return self._api_key_data_from_secret(secret, public_key)
             
         except client.rest.ApiException as e:
             if e.status == 404:
@@ -405,24 +451,31 @@ class APIKeyService:
         Returns:
             API key data if valid, None otherwise
         """
-        api_key_data = await self.get_api_key_by_public_key(public_key)
-        if not api_key_data:
-            return None
-        
-        # Verify secret key
-        if not self._verify_secret_key(secret_key, api_key_data["secret_key_hash"]):
-            return None
+        cache = get_api_key_cache()
+        api_key_data = cache.get(public_key, secret_key)
+        if api_key_data is None:
+            api_key_data = await self.get_api_key_by_public_key(public_key)
+            if not api_key_data:
+                return None
+            
+            # Verify secret key
+            if not await self._run_bcrypt(self._verify_secret_key, secret_key, api_key_data["secret_key_hash"]):
+                return None
+            
+            cache.put(public_key, secret_key, api_key_data, self.namespace)
         
-        # Update last used timestamp
-        await self._update_last_used(api_key_data["secret_name"])
+        # Written to the secret with the next batch, not on the request path
+        get_last_used_recorder().record(public_key, api_key_data["secret_name"], datetime.now(timezone.utc))
         
         return api_key_data
     
-    async def _update_last_used(self, secret_name: str) -> None:
+    async def _update_last_used(self, secret_name: str, last_used_at: datetime, public_key: str) -> None:
         """Update the last used timestamp for an API key.
         
         Args:
             secret_name: The Kubernetes secret name
+            last_used_at: When the key was last used
+            public_key: The public key, whose cache entry is kept across this change
         """
         try:
             now = datetime.now(timezone.utc)
@@ -446,7 +499,7 @@ class APIKeyService:
                     name=metadata["name"],
                     created_at=metadata["created_at"] or now,
                     expires_at=metadata["expires_at"],
-                    last_used_at=now,
+                    last_used_at=last_used_at,
                     deleted_at=metadata["deleted_at"]
                 )
                 
@@ -457,11 +510,14 @@ class APIKeyService:
                 secret.metadata.annotations[API_KEY_ANNOTATION] = updated_json
                 
                 # Patch the secret
-                await v1.patch_namespaced_secret(
+                patched = await v1.patch_namespaced_secret(
                     name=secret_name,
                     namespace=self.namespace,
                     body=secret
                 )
+            
+            # The patch changes the secret's resourceVersion, which would drop the cached key
+            get_api_key_cache().refresh(public_key, self._api_key_data_from_secret(patched, public_key))
                 
         except Exception as e:
             logger.error(f"Error updating last used timestamp for {secret_name}: {e}")
@@ -521,6 +577,7 @@ class APIKeyService:
                     body=secret
                 )
             
+            get_api_key_cache().invalidate(public_key)
             logger.info(f"Soft deleted API key {public_key}")
             return True
             
@@ -532,3 +589,242 @@ class APIKeyService:
         except Exception as e:
             logger.error(f"Error deleting API key {public_key}: {e}")
             return False
+
+
+class APIKeyCache:
+    """
+    Verified API keys by public key.
+
+    An entry holds the key data and a digest of the secret key that matched
+    its bcrypt hash, so repeated requests skip both the secret read and
+    bcrypt. Entries expire after API_KEY_CACHE_TTL, and are dropped as soon
+    as a single watch over the API key secrets sees the key's secret change.
+    """
+
+    def __init__(self, ttl: float = API_KEY_CACHE_TTL, size: int = API_KEY_CACHE_SIZE):
+        self._ttl = ttl
+        self._size = size
+        self._entries: "OrderedDict[str, Tuple[bytes, Dict[str, Any], float]]" = OrderedDict()
+        # Public key of each cached secret, to look up watch events
+        self._public_keys: Dict[str, str] = {}
+        # Entries dropped by a watch event, with its resourceVersion, for refresh()
+        self._evicted: "OrderedDict[str, Tuple[Tuple[bytes, Dict[str, Any], float], str]]" = OrderedDict()
+        self._watch: Optional[asyncio.Task] = None
+        # Set once the API server refuses the watch; entries then only expire
+        self._watch_forbidden = False
+
+    @staticmethod
+    def _digest(secret_key: str) -> bytes:
+        return hashlib.sha256(secret_key.encode('utf-8')).digest()
+
+    def get(self, public_key: str, secret_key: str) -> Optional[Dict[str, Any]]:
+        """Get the data of a cached key if the secret key matches."""
+        entry = self._entries.get(public_key)
+        if entry is None:
+            return None
+        digest, api_key_data, deadline = entry
+        expires_at = api_key_data.get("expires_at")
+        if time.monotonic() >= deadline or (expires_at and expires_at < datetime.now(timezone.utc)):
+            self.invalidate(public_key)
+            return None
+        if not hmac.compare_digest(digest, self._digest(secret_key)):
+            return None
+        self._entries.move_to_end(public_key)
+        return api_key_data
+
+    def put(self, public_key: str, secret_key: str, api_key_data: Dict[str, Any], namespace: str):
+        """Cache a key whose secret key was verified."""
+        if self._size <= 0 or not api_key_data.get("resource_version"):
+            return
+        self._store(public_key, (self._digest(secret_key), api_key_data, time.monotonic() + self._ttl))
+        while len(self._entries) > self._size:
+            self.invalidate(next(iter(self._entries)))
+        if (self._watch is None or self._watch.done()) and not self._watch_forbidden:
+            self._watch = asyncio.create_task(self._watch_secrets(namespace))
+
+    def refresh(self, public_key: str, api_key_data: Optional[Dict[str, Any]]):
+        """
+        Keep a cached key across a change made by this process, if it is still usable.
+
+        The watch event of the change may arrive before or after this call;
+        either way the entry is kept at the new resourceVersion.
+        """
+        entry = self._entries.get(public_key)
+        if entry is None:
+            evicted = self._evicted.pop(public_key, None)
+            if evicted is None or api_key_data is None or evicted[1] != api_key_data.get("resource_version"):
+                return
+            entry = evicted[0]
+        digest, cached, deadline = entry
+        if api_key_data is None or api_key_data["secret_key_hash"] != cached["secret_key_hash"]:
+            self.invalidate(public_key)
+            return
+        self._store(public_key, (digest, api_key_data, deadline))
+
+    def _store(self, public_key: str, entry: Tuple[bytes, Dict[str, Any], float]):
+        self.invalidate(public_key)
+        self._entries[public_key] = entry
+        self._public_keys[entry[1]["secret_name"]] = public_key
+
+    def _on_secret_change(self, secret_name: str, resource_version: str):
+        """Drop the entry of a secret that changed after it was cached."""
+        public_key = self._public_keys.get(secret_name)
+        if public_key is None:
+            return
+        entry = self._entries[public_key]
+        if not _changed_after(resource_version, entry[1]["resource_version"]):
+            # An older event, or the change refresh() already applied
+            return
+        self.invalidate(public_key)
+        self._evicted[public_key] = (entry, resource_version)
+        while len(self._evicted) > self._size:
+            self._evicted.popitem(last=False)
+
+    async def _watch_secrets(self, namespace: str):
+        """Follow the API key secrets while keys are cached, relisting after a gap."""
+        label_selector = f"{API_KEY_TYPE}=true"
+        resource_version = None
+        # A dedicated client, so the long-lived watch does not hold a pooled connection
+        async with ApiClient() as api:
+            v1 = client.CoreV1Api(api)
+            while self._entries:
+                try:
+                    if resource_version is None:
+                        # Changes made before the watch starts are caught by comparing versions
+                        secrets = await v1.list_namespaced_secret(namespace=namespace, label_selector=label_selector)
+                        current = {secret.metadata.name: secret.metadata.resource_version for secret in secrets.items}
+                        for secret_name in list(self._public_keys):
+                            if secret_name not in current:
+                                self.invalidate(self._public_keys[secret_name])
+                            else:
+                                self._on_secret_change(secret_name, current[secret_name])
+                        resource_version = secrets.metadata.resource_version
+                    w = watch.Watch()
+                    try:
+                        async for event in w.stream(
+                            v1.list_namespaced_secret,
+                            namespace=namespace,
+                            label_selector=label_selector,
+                            resource_version=resource_version,
+                            allow_watch_bookmarks=True,
+                            timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                        ):
+                            metadata = event["raw_object"].get("metadata", {})
+                            resource_version = metadata.get("resourceVersion", resource_version)
+                            if event["type"] != "BOOKMARK":
+                                self._on_secret_change(metadata.get("name"), resource_version)
+                    finally:
+                        await w.close()
+                except asyncio.CancelledError:
+                    raise
+                except ApiException as e:
+                    if e.status != 403:
+                        # e.g. 410 Gone once the resourceVersion is compacted
+                        logger.info(f"API key secret watch stopped, relisting: {e}")
+                        resource_version = None
+                        await asyncio.sleep(RETRY_BACKOFF_SECONDS)
+                        continue
+                    # Retrying does not help; grant list and watch on secrets to the service account
+                    logger.warning(
+                        f"Not allowed to watch API key secrets, cached keys are kept for up to {self._ttl}s: {e.reason}"
+                    )
+                    self._watch_forbidden = True
+                    return
+                except Exception as e:
+                    logger.info(f"API key secret watch stopped, relisting: {e}")
+                    resource_version = None
+                    await asyncio.sleep(RETRY_BACKOFF_SECONDS)
+
+    def invalidate(self, public_key: Optional[str] = None):
+        """Drop one cached key, or all of them."""
+        keys = [public_key] if public_key is not None else list(self._entries)
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._public_keys.pop(entry[1]["secret_name"], None)
+        if public_key is None:
+            self._evicted.clear()
+
+    async def close(self):
+        """Drop all cached keys and stop the watch."""
+        self.invalidate()
+        if self._watch is not None:
+            self._watch.cancel()
+            try:
+                await self._watch
+            except asyncio.CancelledError:
+                pass
+            self._watch = None
+
+
+def _changed_after(resource_version: str, cached_version: str) -> bool:
+    """Whether a watched resourceVersion is newer than the cached one."""
+    # resourceVersions are opaque, only compare them when both are numeric
+    if resource_version.isdigit() and cached_version.isdigit():
+        return int(resource_version) > int(cached_version)
+    return resource_version != cached_version
+
+
+class LastUsedRecorder:
+    """
+    Coalesces API key last-used timestamps.
+
+    Requests only note the time in memory; the latest time of each key is
+    written to its secret every API_KEY_LAST_USED_FLUSH_INTERVAL seconds.
+    """
+
+    def __init__(self, interval: float = API_KEY_LAST_USED_FLUSH_INTERVAL):
+        self._interval = interval
+        self._pending: Dict[str, Tuple[str, datetime]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, public_key: str, secret_name: str, used_at: datetime):
+        """Note that a key was used."""
+        self._pending[secret_name] = (public_key, used_at)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.flush()
+
+    async def flush(self):
+        """Write the pending timestamps."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        service = APIKeyService()
+        for secret_name, (public_key, used_at) in pending.items():
+            await service._update_last_used(secret_name, used_at, public_key)
+
+    async def close(self):
+        """Stop the periodic writes and write what is pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+_api_key_cache: Optional[APIKeyCache] = None
+_last_used_recorder: Optional[LastUsedRecorder] = None
+
+
+def get_api_key_cache() -> APIKeyCache:
+    """Get the process-wide verified API key cache."""
+    global _api_key_cache
+    if _api_key_cache is None:
+        _api_key_cache = APIKeyCache()
+    return _api_key_cache
+
+
+def get_last_used_recorder() -> LastUsedRecorder:
+    """Get the process-wide API key last-used recorder."""
+    global _last_used_recorder
+    if _last_used_recorder is None:
+        _last_used_recorder = LastUsedRecorder()
+    return _last_used_recorder
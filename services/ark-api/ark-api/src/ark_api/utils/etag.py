@@ -0,0 +1,66 @@
+"""Conditional GETs with ETags derived from Kubernetes resourceVersions."""
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import Header, Response
+
+
+def resource_etag(resource: dict) -> Optional[str]:
+    """Strong ETag of a Kubernetes object, from its resourceVersion."""
+    resource_version = (resource.get("metadata") or {}).get("resourceVersion")
+    return f'"{resource_version}"' if resource_version else None
+
+
+def collection_etag(resources: Iterable[dict]) -> Optional[str]:
+    """
+    Strong ETag of a list, from the names and resourceVersions of its items.
+
+    The resourceVersion of a list response is the revision the whole cluster
+    was read at, so it changes with unrelated writes; the item versions only
+    change when a listed item does.
+    """
+    digest = hashlib.sha256()
+    for resource in resources:
+        metadata = resource.get("metadata") or {}
+        resource_version = metadata.get("resourceVersion")
+        if not resource_version:
+            return None
+        digest.update(f"{metadata.get('name')}={resource_version};".encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, using weak comparison."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ConditionalGet:
+    """Dependency answering If-None-Match with 304 Not Modified."""
+
+    def __init__(
+        self,
+        response: Response,
+        if_none_match: Optional[str] = Header(None, alias="If-None-Match", description="Return 304 if the ETag still matches"),
+    ):
+        self.response = response
+        self.if_none_match = if_none_match
+
+    def not_modified(self, etag: Optional[str]) -> Optional[Response]:
+        """
+        Set the ETag of the response.
+
+        Returns a 304 response to send instead of the body when the client's
+        copy is current, so the resource doesn't have to be converted.
+        """
+        if not etag:
+            return None
+        self.response.headers["ETag"] = etag
+        if etag_matches(self.if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return None
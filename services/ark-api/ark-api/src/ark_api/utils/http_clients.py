@@ -0,0 +1,214 @@
+"""Shared HTTP clients for calls to in-cluster services.
+
+One pooled httpx.AsyncClient is kept per upstream (broker, memory, proxy,
+streaming), so requests reuse keep-alive connections instead of opening a
+new connection per call. Pool settings can be set for all upstreams
+(e.g. HTTP_MAX_CONNECTIONS) or for one upstream (e.g. HTTP_BROKER_MAX_CONNECTIONS).
+The broker and streaming pools have no connection limit unless one is set
+for them, since each SSE stream they relay holds a connection while open.
+"""
+import logging
+import os
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+BROKER = "broker"
+MEMORY = "memory"
+PROXY = "proxy"
+STREAMING = "streaming"
+
+# Upstreams relaying long-lived SSE streams, unbounded unless HTTP_<UPSTREAM>_MAX_CONNECTIONS is set
+STREAM_UPSTREAMS = (BROKER, STREAMING)
+
+HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', '100'))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', '20'))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '30.0'))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '10.0'))
+HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '30.0'))
+HTTP2_ENABLED = os.getenv('HTTP2_ENABLED', 'false').lower() == 'true'
+
+
+def _setting(upstream: str, name: str, default):
+    """Read a per-upstream override of a pool setting, e.g. HTTP_BROKER_TIMEOUT."""
+    value = os.getenv(f"HTTP_{upstream.upper()}_{name}")
+    if value is None:
+        return default
+    if isinstance(default, bool):
+        return value.lower() == 'true'
+    return type(default)(value)
+
+
+def _max_connections(upstream: str) -> Optional[int]:
+    if upstream in STREAM_UPSTREAMS:
+        value = os.getenv(f"HTTP_{upstream.upper()}_MAX_CONNECTIONS")
+        return int(value) if value else None
+    return _setting(upstream, "MAX_CONNECTIONS", HTTP_MAX_CONNECTIONS)
+
+
+class _RejectCookies(DefaultCookiePolicy):
+    """Cookie policy keeping no cookies, so the shared clients carry no state between callers."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class PoolStats:
+    """Request counters of one upstream connection pool."""
+
+    def __init__(self, upstream: str, max_connections: Optional[int]):
+        self.upstream = upstream
+        self.max_connections = max_connections
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        # Requests started while every connection of the pool was in use
+        self.saturated = 0
+
+    def request_started(self):
+        if self.max_connections is not None and self.in_flight >= self.max_connections:
+            self.saturated += 1
+            logger.debug(f"HTTP pool for {self.upstream} is saturated ({self.in_flight} requests in flight)")
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def request_finished(self):
+        self.in_flight -= 1
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """Response body that reports when its connection is released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class _MeteredTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport counting the requests holding a pool connection."""
+
+    def __init__(self, stats: PoolStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.request_started()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self.stats.request_finished()
+            raise
+        response.stream = _MeteredStream(response.stream, self.stats.request_finished)
+        return response
+
+    def connection_counts(self) -> Dict[str, int]:
+        connections = list(getattr(self._pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {"connections": len(connections), "idle_connections": idle}
+
+
+class HTTPClientRegistry:
+    """Process-wide pooled HTTP clients, one per upstream."""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, _MeteredTransport] = {}
+
+    def get(self, upstream: str) -> httpx.AsyncClient:
+        """Return the shared client of an upstream, creating it on first use."""
+        client = self._clients.get(upstream)
+        if client is None or client.is_closed:
+            client = self._create(upstream)
+            self._clients[upstream] = client
+        return client
+
+    def _create(self, upstream: str) -> httpx.AsyncClient:
+        max_connections = _max_connections(upstream)
+        max_keepalive_connections = _setting(upstream, "MAX_KEEPALIVE_CONNECTIONS", HTTP_MAX_KEEPALIVE_CONNECTIONS)
+        if max_connections is not None:
+            max_keepalive_connections = min(max_keepalive_connections, max_connections)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=_setting(upstream, "KEEPALIVE_EXPIRY", HTTP_KEEPALIVE_EXPIRY),
+        )
+        timeout = httpx.Timeout(
+            _setting(upstream, "TIMEOUT", HTTP_TIMEOUT),
+            connect=_setting(upstream, "CONNECT_TIMEOUT", HTTP_CONNECT_TIMEOUT),
+        )
+        http2 = _setting(upstream, "HTTP2", HTTP2_ENABLED)
+        if http2 and not _http2_available():
+            logger.warning(f"HTTP/2 requested for {upstream} but the 'h2' package is not installed, using HTTP/1.1")
+            http2 = False
+
+        transport = _MeteredTransport(PoolStats(upstream, max_connections), limits=limits, http2=http2)
+        self._transports[upstream] = transport
+        logger.info(f"Created HTTP client for {upstream} (max_connections={max_connections}, http2={http2})")
+        # The proxy forwards user requests, a cookie set for one caller must not reach another
+        return httpx.AsyncClient(transport=transport, timeout=timeout, cookies=CookieJar(policy=_RejectCookies()))
+
+    def stats(self) -> Dict[str, dict]:
+        """Pool usage per upstream."""
+        result = {}
+        for upstream, transport in self._transports.items():
+            stats = transport.stats
+            result[upstream] = {
+                "max_connections": stats.max_connections,
+                "requests": stats.requests,
+                "in_flight": stats.in_flight,
+                "peak_in_flight": stats.peak_in_flight,
+                "saturated": stats.saturated,
+                **transport.connection_counts(),
+            }
+        return result
+
+    async def aclose(self):
+        """Close every client; later calls to get() open new ones."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._transports.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+
+
+_registry: Optional[HTTPClientRegistry] = None
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Get the process-wide HTTP client registry."""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry()
+    return _registry
+
+
+def get_http_client(upstream: str) -> httpx.AsyncClient:
+    """Get the shared HTTP client of an upstream."""
+    return get_http_client_registry().get(upstream)
@@ -1,11 +1,26 @@
 """Shared memory service client utilities."""
+import asyncio
+import heapq
 import logging
-from typing import Optional, Dict, Any
+import os
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
 import httpx
 from fastapi import HTTPException
 
+from .http_clients import MEMORY, get_http_client
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of memory services called at the same time by aggregating endpoints
+MEMORY_FANOUT_CONCURRENCY = int(os.getenv('MEMORY_FANOUT_CONCURRENCY', '8'))
+# Time a single memory service gets to answer before it is reported as failed
+MEMORY_REQUEST_DEADLINE = float(os.getenv('MEMORY_REQUEST_DEADLINE', '10.0'))
+# Time a memory service gets to delete conversation data, which can take longer than a read
+MEMORY_DELETE_DEADLINE = float(os.getenv('MEMORY_DELETE_DEADLINE', '30.0'))
+# Messages requested per page when streaming an export from a memory service
+MEMORY_EXPORT_PAGE_SIZE = int(os.getenv('MEMORY_EXPORT_PAGE_SIZE', '500'))
+
 
 def get_memory_service_address(memory_dict: Dict[str, Any]) -> str:
     """
@@ -57,21 +72,21 @@ async def fetch_memory_service_data(
     url = f"{service_url}{endpoint}"
     
     try:
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.get(url, params=params, timeout=30.0)
-            
-            if response.status_code == 404:
-                raise HTTPException(
-                    status_code=404, 
-                    detail=f"Resource not found in memory service {memory_name}"
-                )
-            elif not response.is_success:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Memory service {memory_name} error: {response.text}"
-                )
-            
-            return response.json()
+        http_client = get_http_client(MEMORY)
+        response = await http_client.get(url, params=params, timeout=30.0)
+        
+        if response.status_code == 404:
+            raise HTTPException(
+                status_code=404, 
+                detail=f"Resource not found in memory service {memory_name}"
+            )
+        elif not response.is_success:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Memory service {memory_name} error: {response.text}"
+            )
+        
+        return response.json()
             
     except httpx.RequestError as e:
         logger.error(f"Error connecting to memory service {memory_name}: {e}")
@@ -92,12 +107,157 @@ async def get_all_memory_resources(client, memory_filter: Optional[str] = None):
     Returns:
         List of memory resource dictionaries
     """
-    memories = await client.memories.a_list()
-    
     if memory_filter:
-        memories = [
-            m for m in memories 
-            if m.to_dict().get("metadata", {}).get("name") == memory_filter
-        ]
+        memories = await client.memories.a_list_by_index("name", memory_filter)
+    else:
+        memories = await client.memories.a_list()
+    
+    return [memory.to_dict() for memory in memories]
+
+
+@dataclass
+class MemoryCallResult:
+    """Outcome of a call to one memory service."""
+    memory_name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def error_message(self) -> Optional[str]:
+        if self.error is None:
+            return None
+        if isinstance(self.error, HTTPException):
+            return str(self.error.detail)
+        return str(self.error) or type(self.error).__name__
+
+
+async def fan_out_to_memories(
+    memory_dicts: List[Dict[str, Any]],
+    call: Callable[[str, str], Awaitable[Any]],
+    concurrency: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> List[MemoryCallResult]:
+    """
+    Call every memory service concurrently.
+    
+    Args:
+        memory_dicts: Memory resource dictionaries
+        call: Coroutine function called with (memory_name, service_url)
+        concurrency: Maximum number of calls in flight (defaults to MEMORY_FANOUT_CONCURRENCY)
+        deadline: Seconds each call may take (defaults to MEMORY_REQUEST_DEADLINE)
+        
+    Returns:
+        One result per memory, in the order of memory_dicts; failures are
+        returned as errors instead of being raised
+    """
+    semaphore = asyncio.Semaphore(concurrency or MEMORY_FANOUT_CONCURRENCY)
+    deadline = deadline or MEMORY_REQUEST_DEADLINE
+
+    async def run(memory_dict: Dict[str, Any]) -> MemoryCallResult:
+        memory_name = memory_dict.get("metadata", {}).get("name", "")
+        try:
+            service_url = get_memory_service_address(memory_dict)
+            async with semaphore:
+                value = await asyncio.wait_for(call(memory_name, service_url), deadline)
+            return MemoryCallResult(memory_name, value=value)
+        except asyncio.TimeoutError:
+            error = TimeoutError(f"Memory service {memory_name} did not respond within {deadline}s")
+            logger.error(str(error))
+            return MemoryCallResult(memory_name, error=error)
+        except Exception as e:
+            logger.error(f"Call to memory {memory_name} failed: {e}")
+            return MemoryCallResult(memory_name, error=e)
+
+    return list(await asyncio.gather(*(run(memory_dict) for memory_dict in memory_dicts)))
+
+
+def memory_errors(results: List[MemoryCallResult]) -> Optional[List[Dict[str, str]]]:
+    """Per-memory errors of a fan-out, or None when every memory service answered."""
+    errors = [
+        {"memoryName": result.memory_name, "error": result.error_message}
+        for result in results if result.error is not None
+    ]
+    return errors or None
+
+
+def merge_by_sequence(sources: Iterable[List[Any]], key: Callable[[Any], int]) -> List[Any]:
+    """
+    Merge per-memory lists into one list ordered by descending sequence.
+    
+    Memory services return their messages in sequence order, so the lists
+    are k-way merged instead of concatenated and sorted again.
+    """
+    ordered = []
+    for items in sources:
+        if len(items) > 1 and key(items[0]) < key(items[-1]):
+            items = items[::-1]
+        if any(key(items[i]) < key(items[i + 1]) for i in range(len(items) - 1)):
+            items = sorted(items, key=key, reverse=True)
+        ordered.append(items)
+    return list(heapq.merge(*ordered, key=key, reverse=True))
+
+
+async def iter_memory_messages(
+    service_url: str,
+    params: Optional[Dict[str, str]] = None,
+    memory_name: str = "unknown",
+    page_size: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Page through the messages of a memory service in ascending sequence order.
     
-    return [memory.to_dict() for memory in memories]
\ No newline at end of file
+    Only one page is held at a time, so the history can be of any size.
+    
+    Args:
+        service_url: Base URL of the memory service
+        params: Optional filters (conversation_id, query_id)
+        memory_name: Memory name for error reporting
+        page_size: Messages per request (defaults to MEMORY_EXPORT_PAGE_SIZE)
+        
+    Raises:
+        HTTPException: For various HTTP errors
+    """
+    page_params = dict(params or {})
+    page_params["limit"] = str(page_size or MEMORY_EXPORT_PAGE_SIZE)
+    
+    while True:
+        data = await fetch_memory_service_data(service_url, "/messages", params=page_params, memory_name=memory_name)
+        for record in data.get("items") or data.get("messages") or []:
+            yield record
+        
+        next_cursor = data.get("nextCursor")
+        if not data.get("hasMore") or next_cursor is None:
+            return
+        page_params["cursor"] = str(next_cursor)
+
+
+async def merge_streams_by_sequence(
+    sources: List[AsyncIterator[Any]],
+    key: Callable[[Any], int]
+) -> AsyncIterator[Any]:
+    """
+    Lazily merge async streams that are each in ascending sequence order.
+    
+    Holds one pending item per stream; the streams are closed when the
+    merge is closed before they are exhausted.
+    """
+    heap = []
+    
+    async def advance(index: int):
+        try:
+            item = await sources[index].__anext__()
+        except StopAsyncIteration:
+            return
+        heapq.heappush(heap, (key(item), index, item))
+    
+    try:
+        await asyncio.gather(*(advance(index) for index in range(len(sources))))
+        while heap:
+            _, index, item = heapq.heappop(heap)
+            yield item
+            await advance(index)
+    finally:
+        for source in sources:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -1,17 +1,33 @@
 """Query polling utilities for waiting on query completion."""
 
+import asyncio
 import logging
 import time
+from typing import Dict, List, Optional, Set
+
+from ark_sdk.k8s import get_api_client_pool
 from fastapi import HTTPException
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
 from openai.types.completion_usage import CompletionUsage
 from kubernetes_asyncio import client, watch
+from kubernetes_asyncio.client.rest import ApiException
 
 from ark_api.core.constants import GROUP
 
 logger = logging.getLogger(__name__)
 
+# Server-side timeout for each hub watch request before it is resumed
+WATCH_TIMEOUT_SECONDS = 300
+
+# How long a namespace watch is kept open after its last awaiter is gone
+IDLE_TIMEOUT_SECONDS = 60
+
+# Delay before restarting a namespace watch after an unexpected failure
+RETRY_BACKOFF_SECONDS = 5
+
+TERMINAL_PHASES = ("done", "error")
+
 
 def _create_chat_completion_response(query_name: str, model: str, content: str, messages: list, query_status: dict = None) -> ChatCompletion:
     """Create OpenAI-compatible chat completion response."""
@@ -75,46 +91,266 @@ def _get_error_detail(status: dict) -> dict:
     }
 
 
+class _NamespaceWatch:
+    """
+    A single watch on the queries of one namespace, shared by all awaiters.
+
+    The watch starts from the collection resourceVersion and resumes from the
+    last seen one when it expires. After a 410 Gone it restarts from a fresh
+    resourceVersion and re-reads every pending query, since events may have
+    been missed in between.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.resource_version: Optional[str] = None
+        self._awaiters: Dict[str, Set[asyncio.Future]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+
+    @property
+    def pending(self) -> int:
+        """Number of in-process awaiters."""
+        return sum(len(futures) for futures in self._awaiters.values())
+
+    def start(self):
+        """Start the watch loop if it isn't running."""
+        if self._task is None or self._task.done():
+            self._ready.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the watch loop and fail any remaining awaiters."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for futures in self._awaiters.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        self._awaiters.clear()
+
+    def add(self, name: str) -> asyncio.Future:
+        """Register an awaiter for a query reaching a terminal phase."""
+        future = asyncio.get_running_loop().create_future()
+        self._awaiters.setdefault(name, set()).add(future)
+        return future
+
+    def remove(self, name: str, future: asyncio.Future):
+        """Drop an awaiter, e.g. after it timed out."""
+        futures = self._awaiters.get(name)
+        if futures is not None:
+            futures.discard(future)
+            if not futures:
+                del self._awaiters[name]
+
+    def dispatch(self, event_type: str, obj: dict):
+        """Resolve the awaiters of a query once it is terminal or deleted."""
+        name = (obj.get("metadata") or {}).get("name")
+        if name not in self._awaiters:
+            return
+        phase = (obj.get("status") or {}).get("phase")
+        if event_type != "DELETED" and phase not in TERMINAL_PHASES:
+            return
+        for future in self._awaiters.pop(name):
+            if future.done():
+                continue
+            if event_type == "DELETED":
+                future.set_exception(HTTPException(status_code=500, detail=f"Query {name} was deleted"))
+            else:
+                future.set_result(obj)
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """Wait until the watch has a starting resourceVersion."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _get(self, custom_api: client.CustomObjectsApi, name: str) -> Optional[dict]:
+        try:
+            return await custom_api.get_namespaced_custom_object(
+                group=GROUP, version="v1alpha1", namespace=self.namespace, plural="queries", name=name
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+
+    async def recheck(self, custom_api: client.CustomObjectsApi, names: List[str]):
+        """Read the current state of queries whose events may have been missed."""
+        results = await asyncio.gather(*(self._get(custom_api, name) for name in names), return_exceptions=True)
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to re-read query {name}: {result}")
+            elif result is None:
+                self.dispatch("DELETED", {"metadata": {"name": name}})
+            else:
+                self.dispatch("MODIFIED", result)
+
+    async def _sync(self, custom_api: client.CustomObjectsApi):
+        """Get a starting resourceVersion without listing every query."""
+        result = await custom_api.list_namespaced_custom_object(
+            group=GROUP, version="v1alpha1", namespace=self.namespace, plural="queries", limit=1
+        )
+        self.resource_version = result.get("metadata", {}).get("resourceVersion")
+        self._ready.set()
+
+    async def _watch(self, custom_api: client.CustomObjectsApi):
+        w = watch.Watch()
+        try:
+            async for event in w.stream(
+                custom_api.list_namespaced_custom_object,
+                group=GROUP,
+                version="v1alpha1",
+                namespace=self.namespace,
+                plural="queries",
+                resource_version=self.resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            ):
+                obj = event["raw_object"]
+                if event["type"] != "BOOKMARK":
+                    self.dispatch(event["type"], obj)
+                self.resource_version = obj.get("metadata", {}).get("resourceVersion", self.resource_version)
+        finally:
+            await w.close()
+
+    async def _run(self):
+        resync = True
+        while True:
+            try:
+                async with get_api_client_pool().api_client() as api_client:
+                    custom_api = client.CustomObjectsApi(api_client)
+                    if resync:
+                        had_version = self.resource_version is not None
+                        await self._sync(custom_api)
+                        resync = False
+                        if had_version and self._awaiters:
+                            await self.recheck(custom_api, list(self._awaiters))
+                    await self._watch(custom_api)
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                resync = True
+                if e.status == 410:
+                    logger.info(f"Query watch in {self.namespace} expired, resyncing")
+                    continue
+                logger.warning(f"Query watch in {self.namespace} failed: {e}")
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS)
+            except Exception as e:
+                resync = True
+                logger.warning(f"Query watch in {self.namespace} failed: {e}")
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS)
+
+
+class QueryCompletionHub:
+    """
+    Process-wide multiplexer for waiting on query completion.
+
+    Keeps one watch per namespace and fans terminal phase transitions out to
+    in-process awaiters keyed by query name, so N concurrent completions cost
+    one upstream stream instead of N. Namespace watches are closed once they
+    have had no awaiters for IDLE_TIMEOUT_SECONDS.
+    """
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+        self.idle_timeout = idle_timeout
+        self._watches: Dict[str, _NamespaceWatch] = {}
+        self._idle_handles: Dict[str, asyncio.TimerHandle] = {}
+        # Stops of idle namespace watches still running
+        self._stopping: Set[asyncio.Task] = set()
+
+    def _get_watch(self, namespace: str) -> _NamespaceWatch:
+        handle = self._idle_handles.pop(namespace, None)
+        if handle is not None:
+            handle.cancel()
+        ns_watch = self._watches.get(namespace)
+        if ns_watch is None:
+            ns_watch = self._watches[namespace] = _NamespaceWatch(namespace)
+        ns_watch.start()
+        return ns_watch
+
+    def _release(self, namespace: str, ns_watch: _NamespaceWatch):
+        if ns_watch.pending or namespace in self._idle_handles:
+            return
+        self._idle_handles[namespace] = asyncio.get_running_loop().call_later(
+            self.idle_timeout, self._close_idle, namespace
+        )
+
+    def _close_idle(self, namespace: str):
+        self._idle_handles.pop(namespace, None)
+        ns_watch = self._watches.get(namespace)
+        if ns_watch is not None and not ns_watch.pending:
+            del self._watches[namespace]
+            task = asyncio.ensure_future(ns_watch.stop())
+            self._stopping.add(task)
+            task.add_done_callback(self._stopping.discard)
+
+    async def wait_for_completion(self, namespace: str, name: str, timeout_seconds: float) -> dict:
+        """
+        Wait for a query to reach the done or error phase, returning the query object.
+
+        Raises asyncio.TimeoutError if it doesn't finish in time.
+        """
+        ns_watch = self._get_watch(namespace)
+        future = ns_watch.add(name)
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_seconds
+            # The query may have finished before the awaiter was registered
+            if await ns_watch.wait_ready(timeout_seconds):
+                async with get_api_client_pool().api_client() as api_client:
+                    await ns_watch.recheck(client.CustomObjectsApi(api_client), [name])
+            return await asyncio.wait_for(future, max(deadline - loop.time(), 0))
+        finally:
+            ns_watch.remove(name, future)
+            self._release(namespace, ns_watch)
+
+    async def close(self):
+        """Stop all namespace watches."""
+        for handle in self._idle_handles.values():
+            handle.cancel()
+        self._idle_handles.clear()
+        watches = list(self._watches.values())
+        self._watches.clear()
+        for ns_watch in watches:
+            await ns_watch.stop()
+        if self._stopping:
+            await asyncio.gather(*self._stopping, return_exceptions=True)
+
+
+_query_completion_hub: Optional[QueryCompletionHub] = None
+
+def get_query_completion_hub() -> QueryCompletionHub:
+    """Get the process-wide query completion hub."""
+    global _query_completion_hub
+    if _query_completion_hub is None:
+        _query_completion_hub = QueryCompletionHub()
+    return _query_completion_hub
+
+
 async def watch_query_completion(ark_client, query_name: str, model: str, messages: list, timeout_seconds: int) -> ChatCompletion:
-    """Watch for query completion using Kubernetes watch API and return chat completion response."""
+    """Wait for query completion through the shared watch hub and return chat completion response."""
     namespace = ark_client.namespace
 
-    api_client = client.ApiClient()
-    custom_api = client.CustomObjectsApi(api_client)
-    w = watch.Watch()
-
     try:
-        async for event in w.stream(
-            custom_api.list_namespaced_custom_object,
-            group=GROUP,
-            version="v1alpha1",
-            namespace=namespace,
-            plural="queries",
-            field_selector=f"metadata.name={query_name}",
-            timeout_seconds=timeout_seconds
-        ):
-            event_type = event['type']
-            query_obj = event['object']
-
-            status = query_obj.get("status", {})
-            phase = status.get("phase", "pending")
-
-            if phase == "done":
-                response = status.get("response")
-                if not response:
-                    w.stop()
-                    raise HTTPException(status_code=500, detail="No response received")
-
-                content = response.get("content", "")
-                w.stop()
-                return _create_chat_completion_response(query_name, model, content, messages, status)
-
-            elif phase == "error":
-                error_detail = _get_error_detail(status)
-                w.stop()
-                raise HTTPException(status_code=500, detail=error_detail)
-
+        query_obj = await get_query_completion_hub().wait_for_completion(namespace, query_name, timeout_seconds)
+    except asyncio.TimeoutError:
         raise HTTPException(status_code=504, detail=f"Query {query_name} timed out after {timeout_seconds} seconds")
 
-    finally:
-        await api_client.close()
\ No newline at end of file
+    status = query_obj.get("status", {})
+    if status.get("phase") == "error":
+        raise HTTPException(status_code=500, detail=_get_error_detail(status))
+
+    response = status.get("response")
+    if not response:
+        raise HTTPException(status_code=500, detail="No response received")
+
+    content = response.get("content", "")
+    return _create_chat_completion_response(query_name, model, content, messages, status)
@@ -0,0 +1,285 @@
+"""Live change streams of Kubernetes resources over SSE.
+
+All viewers of a (resource, namespace) share one informer watch, so ark-api
+receives each change once however many clients are connected. Each stream
+starts with a SYNC event carrying the full list, followed by deltas:
+
+- ADDED: the new list item
+- MODIFIED: a JSON merge patch (RFC 7386) against the previous item
+- DELETED: the name of the removed item
+
+The watch is released when its last viewer disconnects. Event ids are
+resourceVersions. Periodic bookmark events carry the latest
+one, so a client reconnecting with Last-Event-ID only receives what it
+missed, or a new SYNC if that is no longer buffered.
+"""
+import asyncio
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ark_sdk.informer import get_informer_registry
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Changes kept per stream for clients resuming with Last-Event-ID
+RESOURCE_WATCH_REPLAY_SIZE = int(os.getenv('RESOURCE_WATCH_REPLAY_SIZE', '512'))
+# Events buffered per client before it is disconnected as too slow
+RESOURCE_WATCH_QUEUE_SIZE = int(os.getenv('RESOURCE_WATCH_QUEUE_SIZE', '1024'))
+# Seconds between bookmark events on an idle stream
+RESOURCE_WATCH_BOOKMARK_INTERVAL = float(os.getenv('RESOURCE_WATCH_BOOKMARK_INTERVAL', '15.0'))
+# Seconds to wait for the initial list of a new watch
+RESOURCE_WATCH_SYNC_TIMEOUT = float(os.getenv('RESOURCE_WATCH_SYNC_TIMEOUT', '30.0'))
+# Seconds a response may take to start its stream before an unused watch is released
+RESOURCE_WATCH_START_TIMEOUT = float(os.getenv('RESOURCE_WATCH_START_TIMEOUT', '10.0'))
+
+ToItem = Callable[[dict], Any]
+
+sse_headers = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+}
+
+
+def merge_patch(old: dict, new: dict) -> dict:
+    """Compute the JSON merge patch (RFC 7386) that turns old into new."""
+    patch = {}
+    for key in old.keys() - new.keys():
+        patch[key] = None
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+        elif old[key] != value:
+            if isinstance(value, dict) and isinstance(old[key], dict):
+                patch[key] = merge_patch(old[key], value)
+            else:
+                patch[key] = value
+    return patch
+
+
+def _format_event(event_id: Optional[str], event_type: str, payload: dict) -> bytes:
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(payload, separators=(',', ':'), default=str)}")
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+class _ResourceTopic:
+    """List items of one watched collection and the changes made to them."""
+
+    def __init__(self, key: Tuple[str, str, str, str, ToItem], informer, to_item: ToItem):
+        self.key = key
+        self.informer = informer
+        self.to_item = to_item
+        # Client streams that have started and not ended yet
+        self.users = 0
+        self.items: Dict[str, dict] = {}
+        self.replay: Deque[Tuple[str, bytes]] = deque(maxlen=RESOURCE_WATCH_REPLAY_SIZE)
+        self.subscribers: Set[asyncio.Queue] = set()
+        # Id of the latest change; a client at this position has missed nothing
+        self.position: Optional[str] = informer.resource_version
+        for obj in informer.list() or []:
+            item = self._item(obj)
+            if item is not None:
+                self.items[obj["metadata"]["name"]] = item
+        informer.add_event_handler(self._on_change)
+
+    def _item(self, obj: dict) -> Optional[dict]:
+        try:
+            item = self.to_item(obj)
+        except Exception as e:
+            logger.warning(f"Skipping {self.informer.plural} item in watch stream: {e}")
+            return None
+        if isinstance(item, BaseModel):
+            # Absent fields and nulls mean the same in a merge patch
+            return item.model_dump(mode="json", exclude_none=True)
+        return item
+
+    def _on_change(self, event_type: str, obj: dict):
+        metadata = obj.get("metadata") or {}
+        name = metadata.get("name")
+        if event_type == "DELETED":
+            if self.items.pop(name, None) is None:
+                return
+            payload = {"type": "DELETED", "name": name}
+        else:
+            item = self._item(obj)
+            if item is None:
+                return
+            old = self.items.get(name)
+            self.items[name] = item
+            if old is None:
+                event_type = "ADDED"
+                payload = {"type": "ADDED", "name": name, "object": item}
+            else:
+                patch = merge_patch(old, item)
+                if not patch:
+                    # The change is not visible in the list item (e.g. managedFields)
+                    return
+                event_type = "MODIFIED"
+                payload = {"type": "MODIFIED", "name": name, "patch": patch}
+
+        event_id = metadata.get("resourceVersion") or self.position
+        self.position = event_id
+        event = _format_event(event_id, event_type, payload)
+        self.replay.append((event_id, event))
+        for queue in list(self.subscribers):
+            if queue.full():
+                # Too slow: end the stream, the client resumes from its last event id
+                logger.warning(f"Disconnecting slow {self.informer.plural} watch client")
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+                self.subscribers.discard(queue)
+            else:
+                queue.put_nowait(event)
+
+    def sync_event(self) -> bytes:
+        return _format_event(self.position, "SYNC", {"type": "SYNC", "items": list(self.items.values())})
+
+    def bookmark_event(self) -> bytes:
+        return _format_event(self.position, "BOOKMARK", {"type": "BOOKMARK", "resourceVersion": self.position})
+
+    def backlog(self, last_event_id: Optional[str]) -> List[bytes]:
+        """Events a client resuming from last_event_id needs before live changes."""
+        if last_event_id and last_event_id == self.position:
+            return []
+        if last_event_id:
+            ids = [event_id for event_id, _ in self.replay]
+            if last_event_id in ids:
+                return [event for _, event in list(self.replay)[ids.index(last_event_id) + 1:]]
+        return [self.sync_event()]
+
+
+class ResourceWatchHub:
+    """Shares one informer watch per (resource, namespace) between SSE clients."""
+
+    def __init__(self):
+        self._topics: Dict[Tuple[str, str, str, str, ToItem], _ResourceTopic] = {}
+        self._releases: Set[asyncio.Task] = set()
+
+    async def _topic(self, group: str, version: str, plural: str, namespace: str, to_item: ToItem) -> _ResourceTopic:
+        key = (group, version, plural, namespace, to_item)
+        topic = self._topics.get(key)
+        if topic is None:
+            registry = get_informer_registry()
+            informer = registry.acquire(group, version, plural, namespace)
+            if not await informer.wait_for_sync(RESOURCE_WATCH_SYNC_TIMEOUT):
+                await registry.release(group, version, plural, namespace)
+                raise HTTPException(status_code=503, detail=f"Timed out listing {plural} in namespace {namespace}")
+            # Another client may have created the topic while this one waited
+            topic = self._topics.get(key)
+            if topic is None:
+                topic = self._topics[key] = _ResourceTopic(key, informer, to_item)
+            else:
+                await registry.release(group, version, plural, namespace)
+        # A stream that never starts (the client left before the response
+        # body) never takes a reference, so check for that later
+        asyncio.get_running_loop().call_later(RESOURCE_WATCH_START_TIMEOUT, self._release_unstarted, topic)
+        return topic
+
+    def _drop_if_unused(self, topic: _ResourceTopic) -> bool:
+        """Stop following a topic's informer if no client stream uses it."""
+        if topic.users > 0 or self._topics.get(topic.key) is not topic:
+            return False
+        del self._topics[topic.key]
+        topic.informer.remove_event_handler(topic._on_change)
+        return True
+
+    def _release_unstarted(self, topic: _ResourceTopic):
+        if self._drop_if_unused(topic):
+            task = asyncio.ensure_future(get_informer_registry().release(*topic.key[:4]))
+            self._releases.add(task)
+            task.add_done_callback(self._releases.discard)
+
+    async def _stream(self, topic: _ResourceTopic, last_event_id: Optional[str]) -> AsyncIterator[bytes]:
+        if self._topics.get(topic.key) is not topic:
+            # Released while the response was starting
+            topic = await self._topic(*topic.key)
+        topic.users += 1
+        queue: asyncio.Queue = asyncio.Queue(RESOURCE_WATCH_QUEUE_SIZE)
+        backlog = topic.backlog(last_event_id)
+        topic.subscribers.add(queue)
+        try:
+            for event in backlog:
+                yield event
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), RESOURCE_WATCH_BOOKMARK_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield topic.bookmark_event()
+                    continue
+                if event is None:
+                    return
+                yield event
+        finally:
+            topic.subscribers.discard(queue)
+            topic.users -= 1
+            if self._drop_if_unused(topic):
+                await get_informer_registry().release(*topic.key[:4])
+
+    async def watch(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: str,
+        to_item: ToItem,
+        last_event_id: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """Open the change stream of a collection, resuming after last_event_id if possible."""
+        topic = await self._topic(group, version, plural, namespace, to_item)
+        return self._stream(topic, last_event_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of watched collections and their clients."""
+        return {
+            "streams": len(self._topics),
+            "subscribers": sum(len(topic.subscribers) for topic in self._topics.values()),
+        }
+
+    async def close(self):
+        """End every client stream."""
+        topics = list(self._topics.values())
+        self._topics.clear()
+        for topic in topics:
+            topic.informer.remove_event_handler(topic._on_change)
+            await get_informer_registry().release(*topic.key[:4])
+            for queue in list(topic.subscribers):
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+            topic.subscribers.clear()
+        if self._releases:
+            await asyncio.wait(self._releases)
+
+
+_hub: Optional[ResourceWatchHub] = None
+
+
+def get_resource_watch_hub() -> ResourceWatchHub:
+    """Get the process-wide resource watch hub."""
+    global _hub
+    if _hub is None:
+        _hub = ResourceWatchHub()
+    return _hub
+
+
+async def watch_response(
+    group: str,
+    version: str,
+    plural: str,
+    namespace: str,
+    to_item: ToItem,
+    last_event_id: Optional[str] = None,
+) -> StreamingResponse:
+    """SSE response streaming the changes of a collection as list items."""
+    events = await get_resource_watch_hub().watch(group, version, plural, namespace, to_item, last_event_id)
+    return StreamingResponse(events, media_type="text/event-stream", headers=sse_headers)
@@ -0,0 +1,212 @@
+"""In-process fan-out of upstream SSE streams.
+
+Viewers of the same stream (e.g. one trace watched from many dashboard tabs)
+share a single upstream subscription. The upstream is split into events,
+the most recent ones are kept in a bounded replay buffer for late joiners,
+and each subscriber reads from its own bounded queue. A subscriber asking for
+the stream from its beginning only shares it while the replay buffer still
+holds every event; otherwise it gets its own upstream subscription.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+from collections import deque
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Events kept for subscribers joining a stream that is already open
+SSE_FANOUT_REPLAY_SIZE = int(os.getenv('SSE_FANOUT_REPLAY_SIZE', '256'))
+# Events buffered per subscriber before the slow-consumer policy applies
+SSE_FANOUT_QUEUE_SIZE = int(os.getenv('SSE_FANOUT_QUEUE_SIZE', '1024'))
+# What to do with a subscriber whose queue is full: "disconnect" or "drop-oldest"
+SSE_FANOUT_SLOW_CONSUMER = os.getenv('SSE_FANOUT_SLOW_CONSUMER', 'disconnect').lower()
+
+_EVENT_BOUNDARY = re.compile(rb"\r?\n\r?\n")
+
+
+def _is_comment(event: bytes) -> bool:
+    return all(line.startswith(b":") for line in event.splitlines() if line)
+
+
+class _Subscriber:
+    """Queue of events for one consumer of a topic."""
+
+    def __init__(self, maxsize: int, policy: str):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+
+    def put(self, event: bytes):
+        if self.closed:
+            return
+        if not self.queue.full():
+            self.queue.put_nowait(event)
+        elif self.policy == "drop-oldest":
+            self.queue.get_nowait()
+            self.queue.put_nowait(event)
+            self.dropped += 1
+        else:
+            logger.warning("Disconnecting slow SSE subscriber")
+            self._drain()
+            error = {"error": {"message": "Subscriber too slow, reconnect to resume", "type": "slow_consumer"}}
+            self.queue.put_nowait(f"data: {json.dumps(error)}\n\n".encode("utf-8"))
+            self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    def _drain(self):
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+
+class _Topic:
+    """One upstream stream and its subscribers."""
+
+    def __init__(self, hub: "SSEFanoutHub", key: Hashable, open_stream: Callable[[], AsyncIterator[bytes]]):
+        self.hub = hub
+        self.key = key
+        self.open_stream = open_stream
+        self.replay: deque = deque(maxlen=SSE_FANOUT_REPLAY_SIZE)
+        # Whether the replay buffer still starts at the first event of the stream
+        self.replay_complete = True
+        self.subscribers: Set[_Subscriber] = set()
+        self.closed = False
+        self._partial = b""
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def add(self) -> _Subscriber:
+        subscriber = _Subscriber(SSE_FANOUT_QUEUE_SIZE, SSE_FANOUT_SLOW_CONSUMER)
+        for event in self.replay:
+            subscriber.put(event)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def remove(self, subscriber: _Subscriber):
+        self.subscribers.discard(subscriber)
+        if not self.subscribers and not self.closed:
+            # Last viewer left: close the upstream subscription
+            self.closed = True
+            self.hub._discard(self)
+            if self._task is not None:
+                self._task.cancel()
+
+    def _publish(self, event: bytes, replay: bool = True):
+        if replay and not _is_comment(event):
+            if len(self.replay) == self.replay.maxlen:
+                self.replay_complete = False
+            self.replay.append(event)
+        for subscriber in list(self.subscribers):
+            subscriber.put(event)
+
+    def _feed(self, chunk: bytes):
+        data = self._partial + chunk
+        start = 0
+        for match in _EVENT_BOUNDARY.finditer(data):
+            self._publish(data[start:match.end()])
+            start = match.end()
+        self._partial = data[start:]
+
+    async def _run(self):
+        try:
+            async with aclosing(self.open_stream()) as chunks:
+                async for chunk in chunks:
+                    self._feed(chunk)
+            if self._partial:
+                self._publish(self._partial, replay=False)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"SSE fan-out upstream {self.key} failed: {e}")
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.hub._discard(self)
+            for subscriber in list(self.subscribers):
+                subscriber.close()
+
+
+class SSEFanoutHub:
+    """Shares one upstream SSE stream between all subscribers of the same key."""
+
+    def __init__(self):
+        self._topics: Dict[Hashable, _Topic] = {}
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        open_stream: Callable[[], AsyncIterator[bytes]],
+        from_beginning: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Yield the events of the stream for key, opening it with open_stream if needed.
+
+        A subscriber joining an open stream first receives the buffered events.
+        Set from_beginning when the subscriber needs every event of the stream,
+        e.g. a completion's chunks; it then joins an open stream only if none
+        of its events have left the replay buffer.
+        """
+        topic = self._topics.get(key)
+        if topic is not None and from_beginning and not topic.replay_complete:
+            # The start of the stream is gone from the replay: read it from the upstream
+            topic = _Topic(self, key, open_stream)
+            topic.start()
+        elif topic is None:
+            topic = _Topic(self, key, open_stream)
+            self._topics[key] = topic
+            topic.start()
+        subscriber = topic.add()
+        try:
+            while True:
+                event = await subscriber.queue.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            topic.remove(subscriber)
+
+    def _discard(self, topic: _Topic):
+        if self._topics.get(topic.key) is topic:
+            del self._topics[topic.key]
+
+    def stats(self) -> Dict[str, int]:
+        """Number of open upstream streams and their subscribers."""
+        return {
+            "streams": len(self._topics),
+            "subscribers": sum(len(topic.subscribers) for topic in self._topics.values()),
+        }
+
+    async def close(self):
+        """Close every upstream stream and end all subscriptions."""
+        topics = list(self._topics.values())
+        self._topics.clear()
+        for topic in topics:
+            topic.closed = True
+            if topic._task is not None:
+                topic._task.cancel()
+        tasks = [topic._task for topic in topics if topic._task is not None]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_hub: Optional[SSEFanoutHub] = None
+
+
+def get_sse_fanout_hub() -> SSEFanoutHub:
+    """Get the process-wide SSE fan-out hub."""
+    global _hub
+    if _hub is None:
+        _hub = SSEFanoutHub()
+    return _hub
@@ -1,6 +1,11 @@
 """Streaming utilities for converting responses to SSE format."""
 
-from typing import TypedDict
+import asyncio
+import json
+import os
+from typing import AsyncIterator, Optional, TypedDict
+
+import httpx
 
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta
@@ -60,4 +65,122 @@ def create_single_chunk_sse_response(completion: ChatCompletion) -> list[str]:
     return [
         f"data: {chunk.model_dump_json()}\n\n",
         "data: [DONE]\n\n"
-    ]
\ No newline at end of file
+    ]
+
+
+# Interval of SSE keep-alive comments sent while a relayed stream is idle (0 disables them)
+SSE_HEARTBEAT_INTERVAL = float(os.getenv('SSE_HEARTBEAT_INTERVAL', '15.0'))
+
+SSE_HEARTBEAT = b": keep-alive\n\n"
+
+
+def sse_body(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Iterate over an upstream SSE body as received.
+
+    Raw chunks are forwarded as-is; a compressed body has to be decoded first.
+    """
+    if "content-encoding" in response.headers:
+        return response.aiter_bytes()
+    return response.aiter_raw()
+
+
+class SSERelay:
+    """Byte-level relay for a Server-Sent Events stream.
+
+    Upstream chunks are forwarded unchanged, without splitting them into
+    lines. Only the last bytes of each chunk are looked at, to know whether
+    the stream is between two events; heartbeat comments and error events
+    are only injected there, so they never land in the middle of an event.
+    When the consumer stops iterating (e.g. the client disconnected), the
+    pending upstream read is cancelled and the upstream iterator closed.
+    """
+
+    def __init__(self, heartbeat_interval: Optional[float] = SSE_HEARTBEAT_INTERVAL):
+        self.heartbeat_interval = heartbeat_interval or None
+        self._tail = b"\n\n"
+
+    @property
+    def at_boundary(self) -> bool:
+        """Whether everything forwarded so far ends with a complete event."""
+        return self._tail.endswith(b"\n\n") or self._tail.endswith(b"\r\n\r\n")
+
+    def _track(self, chunk: bytes):
+        self._tail = (self._tail + chunk[-4:])[-4:]
+
+    def error_event(self, error: dict) -> bytes:
+        """Encode an error as an SSE event, terminating any partial event first."""
+        event = f"data: {json.dumps(error)}\n\n".encode("utf-8")
+        if not self.at_boundary:
+            event = b"\n\n" + event
+        self._tail = b"\n\n"
+        return event
+
+    async def relay(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Yield upstream chunks unchanged, with heartbeats while the upstream is idle."""
+        iterator = chunks.__aiter__()
+        if self.heartbeat_interval is None:
+            # Nothing to send while idle, so the upstream is read directly
+            try:
+                while True:
+                    try:
+                        chunk = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    if chunk:
+                        self._track(chunk)
+                        yield chunk
+            finally:
+                await self._close(iterator)
+
+        # One reader task for the whole stream, a few chunks ahead of the
+        # consumer; buffered chunks are taken without waiting, so a busy
+        # stream costs no task per chunk
+        queue: asyncio.Queue = asyncio.Queue(8)
+        reader = asyncio.ensure_future(self._read(iterator, queue))
+        try:
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), self.heartbeat_interval)
+                    except asyncio.TimeoutError:
+                        if self.at_boundary:
+                            yield SSE_HEARTBEAT
+                        continue
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                self._track(item)
+                yield item
+        finally:
+            # Let the cancelled read finish before closing the upstream iterator
+            reader.cancel()
+            await asyncio.wait({reader})
+            await self._close(iterator)
+
+    @staticmethod
+    async def _read(iterator: AsyncIterator[bytes], queue: asyncio.Queue):
+        """Move upstream chunks to the queue, then None or the upstream error."""
+        try:
+            while True:
+                try:
+                    chunk = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                if chunk:
+                    await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    @staticmethod
+    async def _close(iterator: AsyncIterator[bytes]):
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception:
+                pass
@@ -0,0 +1,118 @@
+"""Tests for the A2A gateway route manager."""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from ark_api.api.v1.a2agw import manager
+from ark_api.api.v1.a2agw.manager import DynamicManager
+
+
+class FakeInformer:
+    """Synced informer whose changes are applied by the test."""
+
+    has_synced = True
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.handlers = []
+
+    async def wait_for_sync(self, timeout=None):
+        return True
+
+    def list(self):
+        return list(self.objects)
+
+    def add_event_handler(self, handler):
+        self.handlers.append(handler)
+
+    def remove_event_handler(self, handler):
+        self.handlers.remove(handler)
+
+    def apply(self, event_type, obj):
+        for handler in self.handlers:
+            handler(event_type, obj)
+
+
+def make_agent(name, description="", phase="ready"):
+    return {"metadata": {"name": name}, "spec": {"description": description}, "status": {"phase": phase}}
+
+
+def to_card(agent):
+    return {"name": agent["metadata"]["name"], "description": agent["spec"]["description"]}
+
+
+class TestDynamicManager(unittest.IsolatedAsyncioTestCase):
+    """Test cases for watch-driven A2A route updates."""
+
+    async def asyncSetUp(self):
+        self.informer = FakeInformer([make_agent("a"), make_agent("b")])
+        self.registry = registry = Mock()
+        registry.acquire.return_value = self.informer
+        registry.release = AsyncMock()
+        self.a2a_app = Mock(side_effect=lambda agent_card, http_handler: Mock(agent_card=agent_card))
+        patches = [
+            patch.object(manager, "get_informer_registry", return_value=registry),
+            patch.object(manager, "get_namespace", return_value="default"),
+            patch.object(manager, "AgentV1alpha1", side_effect=lambda **agent: agent),
+            patch.object(manager, "ark_to_agent_card", side_effect=to_card),
+            patch.object(manager, "DefaultRequestHandler", side_effect=lambda **kwargs: Mock()),
+            patch.object(manager, "A2AStarletteApplication", self.a2a_app),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        self.manager = DynamicManager()
+        self.manager.app.set_app = Mock(wraps=self.manager.app.set_app)
+        await self.manager.initialize()
+
+    async def _published(self):
+        # Route swaps are scheduled on the event loop
+        await asyncio.sleep(0)
+        return self.manager.app.set_app.call_count
+
+    async def test_initialize_mounts_existing_agents(self):
+        self.assertEqual(set(self.manager.agents), {"a", "b"})
+        self.assertEqual(self.a2a_app.call_count, 2)
+        self.assertEqual(await self._published(), 1)
+
+    async def test_update_rebuilds_only_changed_agent(self):
+        servers = dict(self.manager._servers)
+        handlers = dict(self.manager._handlers)
+
+        self.informer.apply("MODIFIED", make_agent("a", description="new"))
+
+        self.assertEqual(self.a2a_app.call_count, 3)
+        self.assertEqual(self.manager.agents["a"]["description"], "new")
+        self.assertIsNot(self.manager._servers["a"], servers["a"])
+        self.assertIs(self.manager._servers["b"], servers["b"])
+        # The task store of in-flight tasks survives the update
+        self.assertIs(self.manager._handlers["a"], handlers["a"])
+        self.assertEqual(await self._published(), 2)
+
+    async def test_unchanged_card_keeps_routes(self):
+        self.informer.apply("MODIFIED", make_agent("a", phase="error"))
+
+        self.assertEqual(self.a2a_app.call_count, 2)
+        self.assertEqual(await self._published(), 1)
+
+    async def test_add_and_delete(self):
+        self.informer.apply("ADDED", make_agent("c"))
+        self.informer.apply("DELETED", make_agent("a"))
+
+        self.assertEqual(set(self.manager.agents), {"b", "c"})
+        self.assertEqual(set(self.manager._handlers), {"b", "c"})
+        # Both changes are published with one swap
+        self.assertEqual(await self._published(), 2)
+
+    async def test_shutdown_stops_following_changes(self):
+        await self.manager.shutdown()
+
+        self.informer.apply("ADDED", make_agent("c"))
+
+        self.assertNotIn("c", self.manager.agents)
+        self.registry.release.assert_awaited_once_with("ark.mckinsey.com", "v1alpha1", "agents", "default")
+
+
+if __name__ == "__main__":
+    unittest.main()
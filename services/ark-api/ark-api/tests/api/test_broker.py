@@ -1,3 +1,4 @@
+import asyncio
 import os
 import json
 import unittest
@@ -37,8 +38,8 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(result, {"error": {"message": "404 Not Found", "type": "server_error"}})
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_traces_success(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_traces_success(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -47,7 +48,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/traces")
 
@@ -66,13 +67,13 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(data["error"]["type"], "service_unavailable")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_traces_connection_error(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_traces_connection_error(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(side_effect=httpx.ConnectError("Connection failed"))
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/traces")
 
@@ -82,13 +83,13 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(data["error"]["type"], "connection_error")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_traces_generic_error(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_traces_generic_error(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(side_effect=Exception("Generic error"))
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/traces")
 
@@ -103,7 +104,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: test\n\n"
+            yield b"data: test\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -113,8 +114,8 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(response.headers["content-type"], "text/event-stream; charset=utf-8")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_trace_success(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_trace_success(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -123,7 +124,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/traces/123")
 
@@ -136,7 +137,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: span1\n\n"
+            yield b"data: span1\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -144,6 +145,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.headers["content-type"], "text/event-stream; charset=utf-8")
+        self.assertEqual(response.text, "data: span1\n\n")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
     @patch('ark_api.api.v1.broker.proxy_sse_stream')
@@ -151,7 +153,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: span1\n\n"
+            yield b"data: span1\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -163,8 +165,38 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertIn("from-beginning=true", call_args)
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_messages_success(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.proxy_sse_stream')
+    def test_get_trace_watch_resumes_from_last_event_id(self, mock_proxy_sse, mock_get_broker_url):
+        mock_get_broker_url.return_value = "http://broker:8080"
+
+        async def mock_stream():
+            yield b"id: 43\ndata: span2\n\n"
+
+        mock_proxy_sse.return_value = mock_stream()
+
+        response = self.client.get(
+            "/v1/broker/traces/123?watch=true&from-beginning=true",
+            headers={"Last-Event-ID": "42"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "id: 43\ndata: span2\n\n")
+        call_args = mock_proxy_sse.call_args[0][0]
+        self.assertIn("cursor=42", call_args)
+        self.assertNotIn("from-beginning", call_args)
+
+    def test_resume_params(self):
+        from ark_api.api.v1.broker import resume_params
+
+        params = {"cursor": None, "from-beginning": "true"}
+
+        self.assertEqual(resume_params(params, None), params)
+        self.assertEqual(resume_params(params, "not-a-cursor"), params)
+        self.assertEqual(resume_params(params, "42"), {"cursor": 42})
+
+    @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_messages_success(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -173,7 +205,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/messages")
 
@@ -181,8 +213,8 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(response.json(), {"messages": []})
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_messages_with_conversation_id(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_messages_with_conversation_id(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -191,7 +223,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/messages?conversation_id=conv-123")
 
@@ -206,7 +238,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: message\n\n"
+            yield b"data: message\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -216,8 +248,8 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(response.headers["content-type"], "text/event-stream; charset=utf-8")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_chunks_success(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_chunks_success(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -226,7 +258,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/chunks")
 
@@ -239,7 +271,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: chunk\n\n"
+            yield b"data: chunk\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -254,7 +286,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: chunk\n\n"
+            yield b"data: chunk\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -265,10 +297,32 @@ class TestBrokerAPI(unittest.TestCase):
         call_args = mock_proxy_sse.call_args[0][0]
         self.assertIn("stream/query-123", call_args)
         self.assertIn("from-beginning=true", call_args)
+        self.assertEqual(response.text, "data: chunk\n\n")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_purge_traces_success(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.proxy_sse_stream')
+    def test_get_chunks_watch_with_query_id_resumes_from_last_event_id(self, mock_proxy_sse, mock_get_broker_url):
+        mock_get_broker_url.return_value = "http://broker:8080"
+
+        async def mock_stream():
+            yield b"id: 8\ndata: chunk\n\n"
+
+        mock_proxy_sse.return_value = mock_stream()
+
+        response = self.client.get(
+            "/v1/broker/chunks?watch=true&query-id=query-123",
+            headers={"Last-Event-ID": "7"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "id: 8\ndata: chunk\n\n")
+        call_args = mock_proxy_sse.call_args[0][0]
+        self.assertIn("stream/query-123?cursor=7", call_args)
+        self.assertNotIn("from-beginning", call_args)
+
+    @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_purge_traces_success(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -277,7 +331,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.delete = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.delete("/v1/broker/traces")
 
@@ -296,13 +350,13 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(data["error"]["type"], "service_unavailable")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_purge_traces_connection_error(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_purge_traces_connection_error(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_client_instance = AsyncMock()
         mock_client_instance.delete = AsyncMock(side_effect=httpx.ConnectError("Connection failed"))
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.delete("/v1/broker/traces")
 
@@ -312,8 +366,8 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(data["error"]["type"], "connection_error")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_events_success(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_events_success(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -322,7 +376,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/events")
 
@@ -341,13 +395,13 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(data["error"]["type"], "service_unavailable")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_events_connection_error(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_events_connection_error(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(side_effect=httpx.ConnectError("Connection failed"))
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/events")
 
@@ -357,13 +411,13 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(data["error"]["type"], "connection_error")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_events_generic_error(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_events_generic_error(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(side_effect=Exception("Generic error"))
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/events")
 
@@ -378,7 +432,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: event\n\n"
+            yield b"data: event\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -388,8 +442,8 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(response.headers["content-type"], "text/event-stream; charset=utf-8")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_get_events_with_query_id(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_get_events_with_query_id(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -398,7 +452,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.get("/v1/broker/events/query-123")
 
@@ -413,7 +467,7 @@ class TestBrokerAPI(unittest.TestCase):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         async def mock_stream():
-            yield "data: event\n\n"
+            yield b"data: event\n\n"
 
         mock_proxy_sse.return_value = mock_stream()
 
@@ -426,8 +480,8 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertIn("watch=true", call_args)
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_purge_events_success(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_purge_events_success(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_response = MagicMock()
@@ -436,7 +490,7 @@ class TestBrokerAPI(unittest.TestCase):
 
         mock_client_instance = AsyncMock()
         mock_client_instance.delete = AsyncMock(return_value=mock_response)
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.delete("/v1/broker/events")
 
@@ -455,13 +509,13 @@ class TestBrokerAPI(unittest.TestCase):
         self.assertEqual(data["error"]["type"], "service_unavailable")
 
     @patch('ark_api.api.v1.broker.get_broker_url', new_callable=AsyncMock)
-    @patch('ark_api.api.v1.broker.httpx.AsyncClient')
-    def test_purge_events_connection_error(self, mock_async_client, mock_get_broker_url):
+    @patch('ark_api.api.v1.broker.get_http_client')
+    def test_purge_events_connection_error(self, mock_get_http_client, mock_get_broker_url):
         mock_get_broker_url.return_value = "http://broker:8080"
 
         mock_client_instance = AsyncMock()
         mock_client_instance.delete = AsyncMock(side_effect=httpx.ConnectError("Connection failed"))
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_http_client.return_value = mock_client_instance
 
         response = self.client.delete("/v1/broker/events")
 
@@ -516,6 +570,44 @@ class TestHelperFunctions(unittest.IsolatedAsyncioTestCase):
 
         self.assertIsNone(result)
 
+    @patch('ark_api.api.v1.broker.wait_for_change', new_callable=AsyncMock)
+    @patch('ark_api.api.v1.broker.get_all_memory_resources')
+    @patch('ark_api.api.v1.broker.with_ark_client')
+    async def test_get_broker_url_cached_until_memory_changes(self, mock_client, mock_get_resources, mock_wait):
+        from ark_api.api.v1.broker import BrokerUrlCache, get_broker_url
+
+        changed = asyncio.Event()
+
+        async def wait_for_memory_change(*args, **kwargs):
+            await changed.wait()
+            return "MODIFIED"
+
+        mock_wait.side_effect = wait_for_memory_change
+        mock_client_instance = AsyncMock()
+        mock_client_instance.namespace = "default"
+        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_get_resources.return_value = [{
+            "metadata": {"name": "default", "resourceVersion": "42"},
+            "status": {"lastResolvedAddress": "http://broker-service:8080/"}
+        }]
+
+        with patch('ark_api.api.v1.broker._broker_url_cache', BrokerUrlCache()):
+            first = await get_broker_url("default")
+            second = await get_broker_url("default")
+            # Let the watch task start
+            await asyncio.sleep(0)
+            self.assertEqual(mock_get_resources.call_count, 1)
+            self.assertEqual(mock_wait.call_args.args[2], "42")
+
+            changed.set()
+            await asyncio.sleep(0)
+            third = await get_broker_url("default")
+
+        self.assertEqual(first, "http://broker-service:8080")
+        self.assertEqual(second, first)
+        self.assertEqual(third, first)
+        self.assertEqual(mock_get_resources.call_count, 2)
+
     async def test_proxy_sse_stream_success(self):
         from ark_api.api.v1.broker import proxy_sse_stream
         from unittest.mock import MagicMock
@@ -523,32 +615,56 @@ class TestHelperFunctions(unittest.IsolatedAsyncioTestCase):
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        async def mock_aiter_lines():
-            yield "data: test1"
-            yield "data: test2"
+        async def mock_aiter_raw():
+            yield b"data: test1\n\ndata: te"
+            yield b"st2\n\n"
 
-        mock_response.aiter_lines = mock_aiter_lines
+        mock_response.aiter_raw = mock_aiter_raw
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
         mock_client = MagicMock()
         mock_client.stream = MagicMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch('ark_api.api.v1.broker.httpx.AsyncClient') as mock_async_client:
-            mock_async_client.return_value = mock_client
+        with patch('ark_api.api.v1.broker.get_http_client', return_value=mock_client):
+            result = []
+            async for chunk in proxy_sse_stream("http://broker:8080/traces"):
+                result.append(chunk)
+
+            # Chunks are relayed unchanged, even when they split an event
+            self.assertEqual(result, [b"data: test1\n\ndata: te", b"st2\n\n"])
+
+    async def test_proxy_sse_stream_error_mid_event(self):
+        from ark_api.api.v1.broker import proxy_sse_stream
+        from unittest.mock import MagicMock
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        async def mock_aiter_raw():
+            yield b"data: partial"
+            raise httpx.ReadError("Connection reset")
+
+        mock_response.aiter_raw = mock_aiter_raw
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_client = MagicMock()
+        mock_client.stream = MagicMock(return_value=mock_response)
 
+        with patch('ark_api.api.v1.broker.get_http_client', return_value=mock_client):
             result = []
             async for chunk in proxy_sse_stream("http://broker:8080/traces"):
                 result.append(chunk)
 
-            self.assertEqual(len(result), 2)
-            self.assertIn("test1", result[0])
-            self.assertIn("test2", result[1])
+            self.assertEqual(result[0], b"data: partial")
+            # The partial event is terminated before the error event
+            self.assertTrue(result[1].startswith(b"\n\ndata: "))
+            self.assertIn(b"server_error", result[1])
 
     async def test_proxy_sse_stream_error_response(self):
         from ark_api.api.v1.broker import proxy_sse_stream
+        from unittest.mock import MagicMock
 
         mock_response = AsyncMock()
         mock_response.status_code = 500
@@ -559,22 +675,16 @@ class TestHelperFunctions(unittest.IsolatedAsyncioTestCase):
         mock_stream_context.__aenter__.return_value = mock_response
         mock_stream_context.__aexit__.return_value = None
 
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
         mock_client.stream.return_value = mock_stream_context
 
-        mock_client_context = AsyncMock()
-        mock_client_context.__aenter__.return_value = mock_client
-        mock_client_context.__aexit__.return_value = None
-
-        with patch('ark_api.api.v1.broker.httpx.AsyncClient') as mock_async_client:
-            mock_async_client.return_value = mock_client_context
-
+        with patch('ark_api.api.v1.broker.get_http_client', return_value=mock_client):
             result = []
             async for chunk in proxy_sse_stream("http://broker:8080/traces"):
                 result.append(chunk)
 
             self.assertEqual(len(result), 1)
-            self.assertIn("error", result[0])
+            self.assertIn(b"server error", result[0])
 
     async def test_proxy_sse_stream_connection_error(self):
         from ark_api.api.v1.broker import proxy_sse_stream
@@ -582,18 +692,14 @@ class TestHelperFunctions(unittest.IsolatedAsyncioTestCase):
 
         mock_client = MagicMock()
         mock_client.stream.side_effect = httpx.ConnectError("Connection failed")
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch('ark_api.api.v1.broker.httpx.AsyncClient') as mock_async_client:
-            mock_async_client.return_value = mock_client
 
+        with patch('ark_api.api.v1.broker.get_http_client', return_value=mock_client):
             result = []
             async for chunk in proxy_sse_stream("http://broker:8080/traces"):
                 result.append(chunk)
 
             self.assertEqual(len(result), 1)
-            self.assertIn("connection_error", result[0])
+            self.assertIn(b"connection_error", result[0])
 
     async def test_proxy_sse_stream_generic_exception(self):
         from ark_api.api.v1.broker import proxy_sse_stream
@@ -601,16 +707,10 @@ class TestHelperFunctions(unittest.IsolatedAsyncioTestCase):
         mock_client = AsyncMock()
         mock_client.stream.side_effect = Exception("Unexpected error")
 
-        mock_client_context = AsyncMock()
-        mock_client_context.__aenter__.return_value = mock_client
-        mock_client_context.__aexit__.return_value = None
-
-        with patch('ark_api.api.v1.broker.httpx.AsyncClient') as mock_async_client:
-            mock_async_client.return_value = mock_client_context
-
+        with patch('ark_api.api.v1.broker.get_http_client', return_value=mock_client):
             result = []
             async for chunk in proxy_sse_stream("http://broker:8080/traces"):
                 result.append(chunk)
 
             self.assertEqual(len(result), 1)
-            self.assertIn("server_error", result[0])
+            self.assertIn(b"server_error", result[0])
@@ -0,0 +1,114 @@
+import json
+import os
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+
+os.environ["AUTH_MODE"] = "open"
+
+with patch('importlib.metadata.version', return_value="0.1.0-test"):
+    from ark_api.main import app
+
+from ark_sdk.informer import Informer
+
+test_client = TestClient(app)
+
+
+def make_event(name, kind="Agent", object_name="helper", event_type="Normal", created="2024-01-01T00:00:00Z"):
+    return {
+        "metadata": {"name": name, "namespace": "default", "uid": name, "creationTimestamp": created},
+        "involvedObject": {"kind": kind, "name": object_name},
+        "type": event_type,
+        "reason": "Resolved",
+        "message": "ok",
+    }
+
+
+def raw_response(payload):
+    response = MagicMock()
+    response.read = AsyncMock(return_value=json.dumps(payload).encode())
+    return response
+
+
+class TestEventsAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = test_client
+
+    def _patch_core_api(self, *pages):
+        core_api = MagicMock()
+        core_api.list_namespaced_event = AsyncMock(side_effect=[raw_response(page) for page in pages])
+        patcher = patch('ark_api.api.v1.events.client.CoreV1Api', return_value=core_api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        api_client_patcher = patch('ark_api.api.v1.events.ApiClient')
+        api_client = api_client_patcher.start()
+        api_client.return_value.__aenter__ = AsyncMock()
+        api_client.return_value.__aexit__ = AsyncMock(return_value=False)
+        self.addCleanup(api_client_patcher.stop)
+        return core_api
+
+    def test_page_pushes_type_and_kind_into_field_selector(self):
+        core_api = self._patch_core_api({"metadata": {}, "items": [
+            make_event("old", created="2024-01-01T00:00:00Z"),
+            make_event("new", created="2024-01-02T00:00:00Z"),
+        ]})
+
+        response = self.client.get("/v1/events?namespace=default&type=Warning&kind=Agent&page=1&limit=1")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([item["name"] for item in data["items"]], ["new"])
+        self.assertEqual(data["total"], 2)
+        kwargs = core_api.list_namespaced_event.call_args.kwargs
+        self.assertEqual(kwargs["field_selector"], "type=Warning,involvedObject.kind=Agent")
+
+    def test_cursor_skips_chunks_without_name_match(self):
+        core_api = self._patch_core_api(
+            {"metadata": {"continue": "c1"}, "items": [make_event("e1", object_name="other")]},
+            {"metadata": {"continue": "c2"}, "items": [make_event("e2"), make_event("e3")]},
+        )
+
+        response = self.client.get("/v1/events?namespace=default&name=HELP&limit=2&cursor=c0")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([item["name"] for item in data["items"]], ["e2", "e3"])
+        self.assertEqual(data["cursor"], "c2")
+        calls = core_api.list_namespaced_event.call_args_list
+        self.assertEqual((calls[0].kwargs["limit"], calls[0].kwargs["_continue"]), (2, "c0"))
+        self.assertEqual((calls[1].kwargs["limit"], calls[1].kwargs["_continue"]), (2, "c1"))
+
+    def test_cursor_returns_short_page_with_name_filter(self):
+        core_api = self._patch_core_api(
+            {"metadata": {"continue": "c1"}, "items": [make_event("e1", object_name="other"), make_event("e2")]},
+        )
+
+        response = self.client.get("/v1/events?namespace=default&name=HELP&limit=2")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([item["name"] for item in data["items"]], ["e2"])
+        self.assertEqual(data["cursor"], "c1")
+        core_api.list_namespaced_event.assert_awaited_once()
+
+    def test_page_served_from_informer_cache(self):
+        informer = Informer("", "v1", "events", "default")
+        informer.apply("ADDED", make_event("e1", kind="Agent", object_name="my-helper"))
+        informer.apply("ADDED", make_event("e2", kind="Team", object_name="my-helper"))
+        informer.apply("ADDED", make_event("e3", kind="Agent", object_name="writer"))
+        registry = MagicMock()
+        registry.get_synced.return_value = informer
+
+        with patch('ark_api.api.v1.events.get_informer_registry', return_value=registry), \
+             patch('ark_api.api.v1.events.client.CoreV1Api') as core_api:
+            response = self.client.get("/v1/events?namespace=default&kind=Agent&name=helper&page=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["name"] for item in response.json()["items"]], ["e1"])
+        core_api.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
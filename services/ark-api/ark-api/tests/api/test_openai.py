@@ -1,7 +1,8 @@
 """Tests for OpenAI-compatible API endpoints."""
+import asyncio
 import os
 import unittest.mock
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock, Mock
 from fastapi.testclient import TestClient
 import json
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
@@ -262,3 +263,146 @@ class TestOpenAIChatCompletions(unittest.TestCase):
         self.assertEqual(session_id, "test-session-123")
         self.assertEqual(conversation_id, "conv-456-789")
 
+
+
+class TestOpenAIStreamingCompletions(unittest.TestCase):
+    """Test cases for streaming chat completions through the broker."""
+
+    def setUp(self):
+        """Set up test client."""
+        from ark_api.main import app
+        self.client = TestClient(app)
+        self.request_data = {
+            "model": "agent/test-agent",
+            "messages": [{"role": "user", "content": "Hello"}],
+            "stream": True,
+        }
+
+    def _setup_mocks(self, mock_cache, mock_get_namespace, mock_parse_target, mock_with_ark_client):
+        mock_get_namespace.return_value = "default"
+        mock_parse_target.return_value = {"name": "test-agent", "type": "agent"}
+        mock_cache.return_value.resolve = AsyncMock(
+            return_value=(unittest.mock.Mock(enabled=True), "http://ark-broker:8080")
+        )
+        mock_client = AsyncMock()
+        mock_with_ark_client.return_value.__aenter__.return_value = mock_client
+        return mock_client
+
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    @patch('ark_api.api.v1.openai.parse_model_to_query_target')
+    @patch('ark_api.api.v1.openai.get_namespace')
+    @patch('ark_api.api.v1.openai.get_streaming_endpoint_cache')
+    def test_stream_is_opened_before_query_is_created(self, mock_cache, mock_get_namespace, mock_parse_target, mock_with_ark_client):
+        """Test the broker stream is started before the Query and its chunks are relayed."""
+        mock_client = self._setup_mocks(mock_cache, mock_get_namespace, mock_parse_target, mock_with_ark_client)
+        started_urls = []
+
+        async def fake_pump(proxy):
+            started_urls.append(proxy.streaming_url)
+            proxy._queue.put_nowait(b'data: {"id": "chunk-1"}\n\n')
+            proxy._queue.put_nowait(None)
+
+        async def create_query(query):
+            # The stream is requested while the create call is in flight
+            await asyncio.sleep(0)
+            self.assertEqual(len(started_urls), 1)
+
+        mock_client.queries.a_create = AsyncMock(side_effect=create_query)
+
+        with patch('ark_api.api.v1.openai.StreamingProxy._pump', fake_pump):
+            response = self.client.post("/openai/v1/chat/completions", json=self.request_data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, 'data: {"id": "chunk-1"}\n\n')
+        self.assertTrue(started_urls[0].startswith("http://ark-broker:8080/stream/openai-query-"))
+        self.assertIn("wait-for-query=300", started_urls[0])
+        mock_client.queries.a_create.assert_awaited_once()
+
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    @patch('ark_api.api.v1.openai.parse_model_to_query_target')
+    @patch('ark_api.api.v1.openai.get_namespace')
+    @patch('ark_api.api.v1.openai.get_streaming_endpoint_cache')
+    def test_stream_error_before_first_chunk_sets_status(self, mock_cache, mock_get_namespace, mock_parse_target, mock_with_ark_client):
+        """Test a broker error arriving before the first chunk is returned with its status code."""
+        mock_client = self._setup_mocks(mock_cache, mock_get_namespace, mock_parse_target, mock_with_ark_client)
+        mock_client.queries.a_create = AsyncMock()
+
+        async def fake_pump(proxy):
+            proxy._queue.put_nowait({"error": {"status": 404, "message": "Query not found", "type": "not_found", "code": "not_found"}})
+            proxy._queue.put_nowait(None)
+
+        with patch('ark_api.api.v1.openai.StreamingProxy._pump', fake_pump):
+            response = self.client.post("/openai/v1/chat/completions", json=self.request_data)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"error": {"message": "Query not found", "type": "not_found", "code": "not_found"}})
+
+
+class TestStreamingProxy(unittest.IsolatedAsyncioTestCase):
+    """Test cases for StreamingProxy."""
+
+    async def test_relay_sends_keep_alive_while_idle(self):
+        """Test keep-alive comments are sent until the next chunk arrives."""
+        from ark_api.api.v1.openai import StreamingProxy
+
+        proxy = StreamingProxy("http://ark-broker:8080/stream/q")
+
+        async def deliver_later():
+            await asyncio.sleep(0.05)
+            proxy._queue.put_nowait(b"data: chunk\n\n")
+            proxy._queue.put_nowait(None)
+
+        task = asyncio.create_task(deliver_later())
+        self.assertIsNone(await proxy.wait_first(0.01))
+        chunks = [chunk async for chunk in proxy.relay(0.01)]
+        await task
+
+        self.assertEqual(chunks[-1], b"data: chunk\n\n")
+        self.assertIn(b": keep-alive\n\n", chunks[:-1])
+
+    async def test_relay_forwards_error_after_chunks(self):
+        """Test an upstream error is sent as an SSE event after a complete event."""
+        from ark_api.api.v1.openai import StreamingProxy
+
+        proxy = StreamingProxy("http://ark-broker:8080/stream/q")
+        proxy._queue.put_nowait(b"data: chunk\n")
+        proxy._queue.put_nowait({"error": {"status": 502, "message": "reset", "type": "server_error"}})
+        proxy._queue.put_nowait(None)
+
+        chunks = [chunk async for chunk in proxy.relay(0)]
+
+        self.assertEqual(chunks[0], b"data: chunk\n")
+        self.assertTrue(chunks[1].startswith(b"\n\ndata: "))
+        self.assertIn(b"server_error", chunks[1])
+
+    async def test_upstream_read_pauses_for_slow_client(self):
+        """Test the broker is only read as far as the client keeps up."""
+        from ark_api.api.v1 import openai
+
+        read = []
+
+        async def upstream():
+            for i in range(10):
+                read.append(i)
+                yield f"data: {i}\n\n".encode()
+
+        response = Mock(status_code=200)
+        stream = MagicMock()
+        stream.__aenter__ = AsyncMock(return_value=response)
+        stream.__aexit__ = AsyncMock(return_value=False)
+        client = Mock()
+        client.stream.return_value = stream
+
+        with patch.object(openai, "STREAM_PROXY_QUEUE_SIZE", 2), \
+                patch.object(openai, "get_http_client", return_value=client), \
+                patch.object(openai, "sse_body", return_value=upstream()):
+            proxy = openai.StreamingProxy("http://ark-broker:8080/stream/q")
+            proxy.start()
+            self.assertEqual(await proxy.wait_first(1), b"data: 0\n\n")
+            await asyncio.sleep(0.01)
+            # One chunk taken, two buffered and one waiting for space
+            self.assertEqual(len(read), 4)
+
+            chunks = [chunk async for chunk in proxy.relay(1)]
+
+        self.assertEqual(len(chunks), 10)
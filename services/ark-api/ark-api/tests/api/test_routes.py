@@ -4,6 +4,7 @@ import unittest
 import unittest.mock
 from unittest.mock import Mock, patch, AsyncMock
 from fastapi.testclient import TestClient
+import httpx
 
 # Set environment variable to skip authentication before importing the app
 os.environ["AUTH_MODE"] = "open"
@@ -272,8 +273,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_session_success(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_session_success(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test successful session deletion."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -292,7 +293,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = True
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete = AsyncMock(return_value=mock_http_response)
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         # Make the request
         response = self.client.delete("/v1/conversations/test-session")
@@ -305,8 +306,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_all_sessions_success(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_all_sessions_success(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test successful deletion of all sessions."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -325,7 +326,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = True
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         # Make the request
         response = self.client.delete("/v1/conversations")
@@ -338,8 +339,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_query_messages_success(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_query_messages_success(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test successful query message deletion."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -358,7 +359,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = True
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         # Make the request
         response = self.client.delete("/v1/conversations/test-session/queries/test-query/messages")
@@ -370,8 +371,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_session_all_services_unreachable(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_session_all_services_unreachable(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test session deletion when all memory services are unreachable (503)."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -388,7 +389,7 @@ class TestSessionEndpoints(unittest.TestCase):
         # Simulate network error
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.side_effect = Exception("Connection refused")
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         # Make the request
         response = self.client.delete("/v1/conversations/test-session")
@@ -400,8 +401,34 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_session_multiple_services(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_session_timeout_is_not_confirmed(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
+        """Test a deletion timing out is reported as unconfirmed (504), not as unreachable."""
+        mock_client = AsyncMock()
+        mock_with_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        mock_get_memory_resources.return_value = [
+            {
+                "metadata": {"name": "test-memory"}, 
+                "spec": {"service": {"name": "memory-service"}},
+                "status": {"lastResolvedAddress": "http://memory-service:8080"}
+            }
+        ]
+        
+        mock_http_client_instance = AsyncMock()
+        mock_http_client_instance.delete.side_effect = httpx.ReadTimeout("timed out")
+        mock_get_http_client.return_value = mock_http_client_instance
+        
+        response = self.client.delete("/v1/conversations/test-session")
+        
+        self.assertEqual(response.status_code, 504)
+        self.assertIn("may still complete on: test-memory", response.json()["detail"])
+        self.assertEqual(mock_http_client_instance.delete.call_args.kwargs["timeout"], 30.0)
+    
+    @patch('ark_api.api.v1.conversations.with_ark_client')
+    @patch('ark_api.api.v1.conversations.get_all_memory_resources')
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_session_multiple_services(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test session deletion across multiple memory services."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -426,7 +453,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = True
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         # Make the request
         response = self.client.delete("/v1/conversations/test-session")
@@ -438,8 +465,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_session_database_error_500(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_session_database_error_500(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test session deletion when database returns 500 error."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -457,7 +484,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = False
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations/test-session")
         
@@ -468,8 +495,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_session_idempotent_404(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_session_idempotent_404(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test session deletion when session is not found (404) - should succeed as idempotent."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -487,7 +514,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = False
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations/test-session")
         
@@ -497,8 +524,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_session_partial_failure(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_session_partial_failure(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test session deletion when some services succeed and some fail."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -529,7 +556,7 @@ class TestSessionEndpoints(unittest.TestCase):
         
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.side_effect = side_effect
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations/test-session")
         
@@ -555,8 +582,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_all_sessions_database_error_500(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_all_sessions_database_error_500(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test delete all sessions when database returns 500 error."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -574,7 +601,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = False
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations")
         
@@ -584,8 +611,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_all_sessions_all_unreachable(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_all_sessions_all_unreachable(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test delete all sessions when all memory services are unreachable."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -605,7 +632,7 @@ class TestSessionEndpoints(unittest.TestCase):
         
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.side_effect = Exception("Connection refused")
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations")
         
@@ -617,8 +644,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_all_sessions_multiple_services(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_all_sessions_multiple_services(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test delete all sessions across multiple memory services."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -641,7 +668,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = True
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations")
         
@@ -651,8 +678,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_query_messages_database_error_500(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_query_messages_database_error_500(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test query messages deletion when database returns 500 error."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -670,7 +697,7 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = False
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations/test-session/queries/test-query/messages")
         
@@ -681,8 +708,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_query_messages_all_unreachable(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_query_messages_all_unreachable(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test query messages deletion when all memory services are unreachable."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -697,7 +724,7 @@ class TestSessionEndpoints(unittest.TestCase):
         
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.side_effect = Exception("Connection refused")
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations/test-session/queries/test-query/messages")
         
@@ -707,8 +734,8 @@ class TestSessionEndpoints(unittest.TestCase):
     
     @patch('ark_api.api.v1.conversations.with_ark_client')
     @patch('ark_api.api.v1.conversations.get_all_memory_resources')
-    @patch('ark_api.api.v1.conversations.httpx.AsyncClient')
-    def test_delete_query_messages_multiple_services(self, mock_httpx_client, mock_get_memory_resources, mock_with_ark_client):
+    @patch('ark_api.api.v1.conversations.get_http_client')
+    def test_delete_query_messages_multiple_services(self, mock_get_http_client, mock_get_memory_resources, mock_with_ark_client):
         """Test query messages deletion across multiple memory services."""
         mock_client = AsyncMock()
         mock_with_ark_client.return_value.__aenter__.return_value = mock_client
@@ -731,13 +758,46 @@ class TestSessionEndpoints(unittest.TestCase):
         mock_http_response.is_success = True
         mock_http_client_instance = AsyncMock()
         mock_http_client_instance.delete.return_value = mock_http_response
-        mock_httpx_client.return_value.__aenter__.return_value = mock_http_client_instance
+        mock_get_http_client.return_value = mock_http_client_instance
         
         response = self.client.delete("/v1/conversations/test-session/queries/test-query/messages")
         
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertIn("deleted successfully from 2 memory service(s)", data["message"])
+    
+    @patch('ark_api.api.v1.memories.with_ark_client')
+    @patch('ark_api.api.v1.memories.get_all_memory_resources')
+    @patch('ark_api.api.v1.memories.iter_memory_messages')
+    def test_export_memory_messages_merges_memories(self, mock_iter_messages, mock_get_memory_resources, mock_with_ark_client):
+        """Test the NDJSON export merges memories by sequence and reports failed memories."""
+        import json
+        from fastapi import HTTPException
+        
+        mock_with_ark_client.return_value.__aenter__.return_value = AsyncMock()
+        mock_get_memory_resources.return_value = [
+            {"metadata": {"name": f"memory-{i}"}, "status": {"lastResolvedAddress": f"http://memory-{i}:8080"}}
+            for i in (1, 2, 3)
+        ]
+        
+        async def iter_messages(service_url, params, memory_name):
+            if memory_name == "memory-3":
+                raise HTTPException(status_code=503, detail="Memory service memory-3 unavailable")
+            sequences = [1, 4] if memory_name == "memory-1" else [2, 3]
+            for sequence in sequences:
+                yield {"conversation_id": "c1", "message": {"role": "user"}, "sequence": sequence}
+        
+        mock_iter_messages.side_effect = iter_messages
+        
+        response = self.client.get("/v1/memory-messages/export?conversation=c1")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([line.get("sequence") for line in lines[:4]], [1, 2, 3, 4])
+        self.assertEqual(lines[0]["memoryName"], "memory-1")
+        self.assertEqual(lines[4], {"memoryName": "memory-3", "error": "Memory service memory-3 unavailable"})
+        self.assertEqual(mock_iter_messages.call_args.args[1], {"conversation_id": "c1"})
 
 
 class TestAgentsEndpoint(unittest.TestCase):
@@ -756,8 +816,7 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock agent objects
-        mock_agent1 = Mock()
-        mock_agent1.to_dict.return_value = {
+        mock_agent1 = {
             "metadata": {"name": "test-agent", "namespace": "default"},
             "spec": {
                 "description": "Test agent",
@@ -767,8 +826,7 @@ class TestAgentsEndpoint(unittest.TestCase):
             "status": {"conditions": [{"type": "Available", "status": "True"}]}
         }
         
-        mock_agent2 = Mock()
-        mock_agent2.to_dict.return_value = {
+        mock_agent2 = {
             "metadata": {"name": "another-agent", "namespace": "default"},
             "spec": {
                 "description": "Another test agent",
@@ -905,8 +963,7 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock the agent response
-        mock_agent = Mock()
-        mock_agent.to_dict.return_value = {
+        mock_agent = {
             "metadata": {"name": "test-agent", "namespace": "default"},
             "spec": {
                 "description": "Test agent",
@@ -932,7 +989,31 @@ class TestAgentsEndpoint(unittest.TestCase):
         self.assertEqual(data["prompt"], "You are a helpful assistant")
         self.assertEqual(data["modelRef"]["name"], "gpt-4")
         self.assertEqual(data["status"]["phase"], "Ready")
-    
+
+    @patch('ark_api.api.v1.agents.agent_to_detail_response')
+    @patch('ark_api.api.v1.agents.with_ark_client')
+    def test_get_agent_not_modified(self, mock_ark_client, mock_to_detail):
+        """Test a matching If-None-Match returns 304 without converting the agent."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+
+        mock_client.agents.a_get = AsyncMock(return_value={
+            "metadata": {"name": "test-agent", "namespace": "default", "resourceVersion": "42"},
+            "spec": {"prompt": "You are a helpful assistant"}
+        })
+
+        # Make the request
+        response = self.client.get(
+            "/v1/agents/test-agent?namespace=default",
+            headers={"If-None-Match": 'W/"41", W/"42"'}
+        )
+
+        # Assert response
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["etag"], '"42"')
+        mock_to_detail.assert_not_called()
+
     @patch('ark_api.api.v1.agents.with_ark_client')
     def test_update_agent_success(self, mock_ark_client):
         """Test successful agent update."""
@@ -1063,8 +1144,7 @@ class TestModelsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock model objects
-        mock_model1 = Mock()
-        mock_model1.to_dict.return_value = {
+        mock_model1 = {
             "metadata": {"name": "gpt-4-model", "namespace": "default"},
             "spec": {
                 "type": "openai",
@@ -1075,8 +1155,7 @@ class TestModelsEndpoint(unittest.TestCase):
             ]}
         }
         
-        mock_model2 = Mock()
-        mock_model2.to_dict.return_value = {
+        mock_model2 = {
             "metadata": {"name": "claude-model", "namespace": "default"},
             "spec": {
                 "type": "bedrock",
@@ -1296,8 +1375,7 @@ class TestModelsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
 
         # Mock the model response
-        mock_model = Mock()
-        mock_model.to_dict.return_value = {
+        mock_model = {
             "metadata": {"name": "gpt-4-model", "namespace": "default"},
             "spec": {
                 "type": "completions",
@@ -1488,8 +1566,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock query objects
-        mock_query1 = Mock()
-        mock_query1.to_dict.return_value = {
+        mock_query1 = {
             "metadata": {"name": "test-query", "namespace": "default"},
             "spec": {
                 "input": "What is the weather today?"
@@ -1510,8 +1587,7 @@ class TestQueriesEndpoint(unittest.TestCase):
             }
         }
         
-        mock_query2 = Mock()
-        mock_query2.to_dict.return_value = {
+        mock_query2 = {
             "metadata": {"name": "another-query", "namespace": "default"},
             "spec": {
                 "input": "Tell me a joke"
@@ -1584,6 +1660,79 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["count"], 0)
         self.assertEqual(data["items"], [])
     
+    @patch('ark_api.api.v1.queries.with_ark_client')
+    def test_list_queries_filtered_by_index(self, mock_ark_client):
+        """Test filtering queries by session and target uses the session index."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        mock_query1 = {
+            "metadata": {"name": "agent-query", "namespace": "default"},
+            "spec": {"input": "hi", "sessionId": "s1", "target": {"type": "agent", "name": "helper"}},
+            "status": {}
+        }
+        mock_query2 = {
+            "metadata": {"name": "team-query", "namespace": "default"},
+            "spec": {"input": "hi", "sessionId": "s1", "target": {"type": "team", "name": "crew"}},
+            "status": {}
+        }
+        mock_client.queries.a_list_by_index = AsyncMock(return_value=[mock_query1, mock_query2])
+        
+        # Make the request
+        response = self.client.get("/v1/queries?namespace=default&session_id=s1&target=agent/helper")
+        
+        # Assert response
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["items"][0]["name"], "agent-query")
+        mock_client.queries.a_list_by_index.assert_called_once_with("sessionId", "s1", raw=True)
+        mock_client.queries.a_list.assert_not_called()
+    
+    @patch('ark_api.api.v1.queries.with_ark_client')
+    def test_list_queries_paginated(self, mock_ark_client):
+        """Test cursor pagination is passed through to the Kubernetes list."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        mock_query = {
+            "metadata": {"name": "page-query", "namespace": "default"},
+            "spec": {"input": "hi"},
+            "status": {}
+        }
+        mock_client.queries.a_list_page = AsyncMock(return_value=([mock_query], "next-token"))
+        
+        # Make the request
+        response = self.client.get("/v1/queries?namespace=default&limit=1&cursor=this-token")
+        
+        # Assert response
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["cursor"], "next-token")
+        mock_client.queries.a_list_page.assert_called_once_with(limit=1, continue_token="this-token", raw=True)
+    
+    @patch('ark_api.api.v1.queries.with_ark_client')
+    def test_list_queries_expired_cursor(self, mock_ark_client):
+        """Test an expired cursor is reported as 410 Gone."""
+        from kubernetes_asyncio.client.rest import ApiException
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client.queries.a_list_page = AsyncMock(side_effect=ApiException(status=410, reason="Gone"))
+        
+        response = self.client.get("/v1/queries?namespace=default&limit=1&cursor=stale-token")
+        
+        self.assertEqual(response.status_code, 410)
+        self.assertIn("restart the list", response.json()["detail"])
+    
+    def test_list_queries_pagination_with_filter_rejected(self):
+        """Test pagination can't be combined with index filters."""
+        response = self.client.get("/v1/queries?namespace=default&limit=1&session_id=s1")
+        
+        self.assertEqual(response.status_code, 400)
+    
     @patch('ark_api.api.v1.queries.with_ark_client')
     def test_create_query_simple(self, mock_ark_client):
         """Test creating a simple query."""
@@ -1707,8 +1856,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock the query response
-        mock_query = Mock()
-        mock_query.to_dict.return_value = {
+        mock_query = {
             "metadata": {"name": "test-query", "namespace": "default"},
             "spec": {
                 "input": "What is the meaning of life?",
@@ -1881,8 +2029,7 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock team objects
-        mock_team1 = Mock()
-        mock_team1.to_dict.return_value = {
+        mock_team1 = {
             "metadata": {"name": "dev-team", "namespace": "default"},
             "spec": {
                 "description": "Development team",
@@ -1895,8 +2042,7 @@ class TestTeamsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_team2 = Mock()
-        mock_team2.to_dict.return_value = {
+        mock_team2 = {
             "metadata": {"name": "research-team", "namespace": "default"},
             "spec": {
                 "strategy": "parallel",
@@ -2177,8 +2323,7 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock the team response
-        mock_team = Mock()
-        mock_team.to_dict.return_value = {
+        mock_team = {
             "metadata": {"name": "dev-team", "namespace": "default"},
             "spec": {
                 "description": "Development team",
@@ -1,13 +1,21 @@
 """Test cases for API key service."""
 
+import asyncio
 import unittest
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timezone, timedelta
 import base64
 import json
 
-from ark_api.services.api_keys import APIKeyService, API_KEY_TYPE, API_KEY_ANNOTATION
+from ark_api.services.api_keys import (
+    APIKeyService,
+    APIKeyCache,
+    LastUsedRecorder,
+    API_KEY_TYPE,
+    API_KEY_ANNOTATION
+)
 from ark_api.models.auth import APIKeyCreateRequest
+from kubernetes_asyncio.client.rest import ApiException
 
 
 class TestAPIKeyService(unittest.TestCase):
@@ -269,8 +277,8 @@ class TestAPIKeyServiceIntegration(unittest.TestCase):
         self.assertEqual(result["name"], "Test Key")
         self.assertTrue(result["is_active"])
         
-        # Verify last used timestamp was updated
-        mock_api_instance.patch_namespaced_secret.assert_called_once()
+        # Verify last used timestamp is left for the next batched write
+        mock_api_instance.patch_namespaced_secret.assert_not_called()
     
     @patch('ark_api.services.api_keys.ApiClient')
     @patch('ark_api.services.api_keys.client.CoreV1Api')
@@ -304,6 +312,161 @@ class TestAPIKeyServiceIntegration(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestAPIKeyVerificationCache(unittest.IsolatedAsyncioTestCase):
+    """Test caching of verified API keys and batched last-used writes."""
+    
+    async def asyncSetUp(self):
+        """Set up test fixtures."""
+        self.cache = APIKeyCache()
+        self.recorder = LastUsedRecorder(interval=3600)
+        # Watch events are applied by the tests, see test_watch_event_invalidates_cache
+        self.watch_secrets = patch.object(self.cache, '_watch_secrets', AsyncMock())
+        self.watch_secrets.start()
+        
+        for target, value in [
+            ('ark_api.services.api_keys.get_context', Mock(return_value={"namespace": "test-namespace"})),
+            ('ark_api.services.api_keys.get_api_key_cache', Mock(return_value=self.cache)),
+            ('ark_api.services.api_keys.get_last_used_recorder', Mock(return_value=self.recorder)),
+        ]:
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        api_client_patcher = patch('ark_api.services.api_keys.ApiClient')
+        mock_api_client = api_client_patcher.start()
+        mock_api_client.return_value.__aenter__.return_value = AsyncMock()
+        self.addCleanup(api_client_patcher.stop)
+        
+        v1_patcher = patch('ark_api.services.api_keys.client.CoreV1Api')
+        self.v1 = v1_patcher.start().return_value
+        self.addCleanup(v1_patcher.stop)
+        
+        self.service = APIKeyService()
+        self.secret_key = "sk-ark-test-secret"
+        self.hashed = self.service._hash_secret_key(self.secret_key)
+        self.v1.read_namespaced_secret = AsyncMock(side_effect=lambda **kwargs: self._secret("1"))
+        self.v1.patch_namespaced_secret = AsyncMock(side_effect=lambda **kwargs: self._secret("2"))
+    
+    async def asyncTearDown(self):
+        self.watch_secrets.stop()
+        await self.cache.close()
+        await self.recorder.close()
+    
+    def _secret(self, resource_version):
+        secret = Mock()
+        secret.type = API_KEY_TYPE
+        secret.metadata.uid = "test-uid-123"
+        secret.metadata.name = "api-key-test"
+        secret.metadata.resource_version = resource_version
+        secret.metadata.annotations = {
+            API_KEY_ANNOTATION: json.dumps({"name": "Test Key", "createdAt": "2024-01-01T00:00:00+00:00"})
+        }
+        secret.data = {
+            "public_key": base64.b64encode(b"pk-ark-test").decode(),
+            "secret_key_hash": base64.b64encode(self.hashed.encode()).decode(),
+            "is_active": base64.b64encode(b"true").decode()
+        }
+        return secret
+    
+    async def test_verified_key_served_from_cache(self):
+        """Test a verified key is not read or checked again, and a wrong secret is still rejected."""
+        with patch.object(self.service, '_verify_secret_key', wraps=self.service._verify_secret_key) as verify:
+            self.assertIsNotNone(await self.service.verify_api_key("pk-ark-test", self.secret_key))
+            self.assertIsNotNone(await self.service.verify_api_key("pk-ark-test", self.secret_key))
+            self.assertEqual(verify.call_count, 1)
+            self.assertEqual(self.v1.read_namespaced_secret.call_count, 1)
+            
+            self.assertIsNone(await self.service.verify_api_key("pk-ark-test", "sk-ark-wrong-secret"))
+        
+        self.v1.patch_namespaced_secret.assert_not_called()
+    
+    async def test_secret_change_invalidates_cache(self):
+        """Test a change to the key's secret drops the cached key, and an older event does not."""
+        await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        
+        self.cache._on_secret_change("api-key-test", "0")
+        self.assertIsNotNone(self.cache.get("pk-ark-test", self.secret_key))
+        
+        self.cache._on_secret_change("api-key-test", "5")
+        self.assertIsNone(self.cache.get("pk-ark-test", self.secret_key))
+    
+    async def test_watch_event_invalidates_cache(self):
+        """Test the secrets watch drops a key when its secret is modified."""
+        self.watch_secrets.stop()
+        self.v1.list_namespaced_secret = AsyncMock(return_value=Mock(items=[self._secret("1")]))
+        self.v1.list_namespaced_secret.return_value.metadata.resource_version = "1"
+        
+        async def stream(*args, **kwargs):
+            yield {"type": "MODIFIED", "raw_object": {"metadata": {"name": "api-key-test", "resourceVersion": "3"}}}
+        
+        with patch('ark_api.services.api_keys.watch.Watch') as mock_watch:
+            mock_watch.return_value.stream = stream
+            mock_watch.return_value.close = AsyncMock()
+            await self.service.verify_api_key("pk-ark-test", self.secret_key)
+            # The watch ends once no keys are cached
+            await asyncio.wait_for(self.cache._watch, 1)
+        
+        self.assertIsNone(self.cache.get("pk-ark-test", self.secret_key))
+        self.assertEqual(self.v1.list_namespaced_secret.call_args.kwargs["label_selector"], f"{API_KEY_TYPE}=true")
+    
+    async def test_forbidden_watch_is_not_retried(self):
+        """Test a watch refused by RBAC stops for good instead of relisting in a loop."""
+        self.watch_secrets.stop()
+        self.v1.list_namespaced_secret = AsyncMock(side_effect=ApiException(status=403, reason="Forbidden"))
+        
+        await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        await asyncio.wait_for(self.cache._watch, 1)
+        self.cache.put("pk-ark-other", self.secret_key, {"secret_name": "other", "resource_version": "1"}, "test-namespace")
+        
+        self.assertTrue(self.cache._watch.done())
+        self.v1.list_namespaced_secret.assert_awaited_once()
+        # Cached keys are still served until their TTL
+        self.assertIsNotNone(self.cache.get("pk-ark-test", self.secret_key))
+    
+    async def test_one_watch_for_all_keys(self):
+        """Test cached keys share a single secrets watch."""
+        for index in range(3):
+            data = {"secret_name": f"api-key-{index}", "secret_key_hash": "hash", "resource_version": "1"}
+            self.cache.put(f"pk-ark-{index}", self.secret_key, data, "test-namespace")
+        await asyncio.sleep(0)
+        
+        self.cache._watch_secrets.assert_called_once_with("test-namespace")
+    
+    async def test_refresh_survives_event_ordering(self):
+        """Test the last-used patch keeps the key cached whether its watch event comes first or last."""
+        await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        patched = self.service._api_key_data_from_secret(self._secret("2"), "pk-ark-test")
+        
+        # Event before the patch response
+        self.cache._on_secret_change("api-key-test", "2")
+        self.cache.refresh("pk-ark-test", patched)
+        self.assertEqual(self.cache.get("pk-ark-test", self.secret_key)["resource_version"], "2")
+        
+        # Event after the patch response
+        patched = self.service._api_key_data_from_secret(self._secret("3"), "pk-ark-test")
+        self.cache.refresh("pk-ark-test", patched)
+        self.cache._on_secret_change("api-key-test", "3")
+        self.assertEqual(self.cache.get("pk-ark-test", self.secret_key)["resource_version"], "3")
+        
+        # Another change in between still drops the key
+        self.cache._on_secret_change("api-key-test", "5")
+        self.cache.refresh("pk-ark-test", self.service._api_key_data_from_secret(self._secret("4"), "pk-ark-test"))
+        self.assertIsNone(self.cache.get("pk-ark-test", self.secret_key))
+    
+    async def test_last_used_writes_coalesced(self):
+        """Test repeated uses are written once, with the latest time, keeping the key cached."""
+        await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        
+        await self.recorder.flush()
+        
+        self.v1.patch_namespaced_secret.assert_called_once()
+        body = self.v1.patch_namespaced_secret.call_args.kwargs["body"]
+        self.assertIn("lastUsedAt", json.loads(body.metadata.annotations[API_KEY_ANNOTATION]))
+        cached = self.cache.get("pk-ark-test", self.secret_key)
+        self.assertEqual(cached["resource_version"], "2")
+
+
 class TestAPIKeyNamespaceScoping(unittest.TestCase):
     """Test namespace scoping for API keys (multi-tenant isolation)."""
     
@@ -11,7 +11,7 @@ import os
 from ark_api.auth.middleware import AuthMiddleware, TokenValidationError
 
 
-class TestAuthMiddleware(unittest.TestCase):
+class TestAuthMiddleware(unittest.IsolatedAsyncioTestCase):
     """Test cases for AuthMiddleware."""
 
     def setUp(self):
@@ -30,16 +30,11 @@ class TestAuthMiddleware(unittest.TestCase):
         request.url.path = "/api/v1/agents"
         request.headers = {}
 
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
-        # Verify that call_next was called and response was returned
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+        # Verify that the request may proceed
+        self.assertIsNone(response)
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
@@ -53,15 +48,12 @@ class TestAuthMiddleware(unittest.TestCase):
         request.url.path = "/api/v1/agents"
         request.headers = {}
 
-        # Mock call_next
-        call_next = AsyncMock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
         # Verify that a 401 response is returned
         self.assertEqual(response.status_code, 401)
-        self.assertIn("Missing or invalid authorization header", response.body.decode())
+        self.assertIn("Missing authorization header", response.body.decode())
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
@@ -75,23 +67,20 @@ class TestAuthMiddleware(unittest.TestCase):
         request.url.path = "/api/v1/agents"
         request.headers = {"Authorization": "Invalid token"}
 
-        # Mock call_next
-        call_next = AsyncMock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
         # Verify that a 401 response is returned
         self.assertEqual(response.status_code, 401)
-        self.assertIn("Missing or invalid authorization header", response.body.decode())
+        self.assertIn("Invalid authorization header", response.body.decode())
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
         'ARK_OKTA_ISSUER': 'https://test-issuer.com',
         'OIDC_APPLICATION_ID': 'test-app-id'
     })
-    @patch('ark_sdk.auth.validator.TokenValidator')
-    async def test_skip_auth_disabled_valid_token(self, mock_validator_class):
+    @patch('ark_api.auth.middleware.get_token_validator')
+    async def test_skip_auth_disabled_valid_token(self, mock_get_validator):
         """Test that authentication succeeds with valid token."""
         # Mock request
         request = Mock()
@@ -100,28 +89,23 @@ class TestAuthMiddleware(unittest.TestCase):
 
         # Mock validator instance
         mock_validator = AsyncMock()
-        mock_validator_class.return_value = mock_validator
+        mock_get_validator.return_value = mock_validator
         mock_validator.validate_token.return_value = {"sub": "test-user"}
 
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
-        # Verify that validator was called and call_next was called
+        # Verify that validator was called and the request may proceed
         mock_validator.validate_token.assert_called_once_with("valid-token")
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+        self.assertIsNone(response)
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
         'ARK_OKTA_ISSUER': 'https://test-issuer.com',
         'OIDC_APPLICATION_ID': 'test-app-id'
     })
-    @patch('ark_sdk.auth.validator.TokenValidator')
-    async def test_skip_auth_disabled_invalid_token(self, mock_validator_class):
+    @patch('ark_api.auth.middleware.get_token_validator')
+    async def test_skip_auth_disabled_invalid_token(self, mock_get_validator):
         """Test that authentication fails with invalid token."""
         # Mock request
         request = Mock()
@@ -130,14 +114,11 @@ class TestAuthMiddleware(unittest.TestCase):
 
         # Mock validator instance to raise TokenValidationError
         mock_validator = AsyncMock()
-        mock_validator_class.return_value = mock_validator
+        mock_get_validator.return_value = mock_validator
         mock_validator.validate_token.side_effect = TokenValidationError("Invalid token")
 
-        # Mock call_next
-        call_next = AsyncMock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
         # Verify that a 401 response is returned
         self.assertEqual(response.status_code, 401)
@@ -150,16 +131,11 @@ class TestAuthMiddleware(unittest.TestCase):
         request.url.path = "/health"
         request.headers = {}
 
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
-        # Verify that call_next was called (authentication was skipped)
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+        # Verify that the request may proceed (authentication was skipped)
+        self.assertIsNone(response)
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
@@ -173,15 +149,12 @@ class TestAuthMiddleware(unittest.TestCase):
         request.url.path = "/api/v1/agents"
         request.headers = {}
 
-        # Mock call_next
-        call_next = AsyncMock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
         # Verify that a 401 response is returned (authentication required)
         self.assertEqual(response.status_code, 401)
-        self.assertIn("Missing or invalid authorization header", response.body.decode())
+        self.assertIn("Missing authorization header", response.body.decode())
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'open',
@@ -195,108 +168,100 @@ class TestAuthMiddleware(unittest.TestCase):
         request.url.path = "/api/v1/agents"
         request.headers = {}
 
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
-
         # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.authenticate(request)
 
-        # Verify that call_next was called (authentication was skipped)
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+        # Verify that the request may proceed (authentication was skipped)
+        self.assertIsNone(response)
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'invalid',
         'ARK_OKTA_ISSUER': 'https://test-issuer.com',
         'OIDC_APPLICATION_ID': 'test-app-id'
     })
-    async def test_auth_mode_invalid_disables_auth(self):
-        """Test that any AUTH_MODE other than 'sso' disables authentication."""
-        # Mock request
-        request = Mock()
-        request.url.path = "/api/v1/agents"
-        request.headers = {}
-
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
-
-        # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+    def test_auth_mode_invalid_rejected(self):
+        """Test that an unknown AUTH_MODE fails at startup."""
+        with self.assertRaises(ValueError) as context:
+            AuthMiddleware(Mock())
 
-        # Verify that call_next was called (authentication was skipped)
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+        self.assertIn("Invalid AUTH_MODE 'invalid'", str(context.exception))
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
         'OIDC_ISSUER_URL': '',
         'OIDC_APPLICATION_ID': 'test-app-id'
     })
-    async def test_missing_oidc_issuer_disables_auth(self):
-        """Test that missing OIDC_ISSUER_URL disables authentication even with AUTH_MODE=sso."""
-        # Mock request
-        request = Mock()
-        request.url.path = "/api/v1/agents"
-        request.headers = {}
-
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
-
-        # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
+    def test_missing_oidc_issuer_rejected(self):
+        """Test that AUTH_MODE=sso without OIDC_ISSUER_URL fails at startup."""
+        with self.assertRaises(ValueError) as context:
+            AuthMiddleware(Mock())
 
-        # Verify that call_next was called (authentication was skipped)
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+        self.assertIn("OIDC_ISSUER_URL", str(context.exception))
+        self.assertNotIn("OIDC_APPLICATION_ID", str(context.exception))
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
         'OIDC_ISSUER_URL': 'https://test-issuer.com',
         'OIDC_APPLICATION_ID': ''
     })
-    async def test_missing_oidc_app_id_disables_auth(self):
-        """Test that missing OIDC_APPLICATION_ID disables authentication even with AUTH_MODE=sso."""
-        # Mock request
-        request = Mock()
-        request.url.path = "/api/v1/agents"
-        request.headers = {}
-
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
+    def test_missing_oidc_app_id_rejected(self):
+        """Test that AUTH_MODE=sso without OIDC_APPLICATION_ID fails at startup."""
+        with self.assertRaises(ValueError) as context:
+            AuthMiddleware(Mock())
 
-        # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
-
-        # Verify that call_next was called (authentication was skipped)
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+        self.assertIn("OIDC_APPLICATION_ID", str(context.exception))
+        self.assertNotIn("OIDC_ISSUER_URL", str(context.exception))
 
     @patch.dict(os.environ, {
         'AUTH_MODE': 'sso',
         'OIDC_ISSUER_URL': '',
         'OIDC_APPLICATION_ID': ''
     })
-    async def test_missing_both_oidc_configs_disables_auth(self):
-        """Test that missing both OIDC configs disables authentication even with AUTH_MODE=sso."""
-        # Mock request
-        request = Mock()
-        request.url.path = "/api/v1/agents"
-        request.headers = {}
+    def test_missing_both_oidc_configs_rejected(self):
+        """Test that AUTH_MODE=sso without any OIDC configuration fails at startup."""
+        with self.assertRaises(ValueError) as context:
+            AuthMiddleware(Mock())
 
-        # Mock call_next
-        call_next = AsyncMock()
-        call_next.return_value = Mock()
+        self.assertIn("OIDC_ISSUER_URL, OIDC_APPLICATION_ID", str(context.exception))
 
-        # Test middleware
-        response = await self.middleware.dispatch(request, call_next)
 
-        # Verify that call_next was called (authentication was skipped)
-        call_next.assert_called_once_with(request)
-        self.assertIsNotNone(response)
+class TestAuthMiddlewareASGI(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AuthMiddleware as raw ASGI middleware."""
+
+    async def _call(self, path, headers=None, scope_type="http"):
+        app = AsyncMock()
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": scope_type, "method": "GET", "path": path, "query_string": b"", "headers": headers or []}
+        with patch.dict(os.environ, {'AUTH_MODE': 'basic'}):
+            await AuthMiddleware(app)(scope, AsyncMock(), send)
+        return app, scope, send, sent
+
+    async def test_unauthenticated_request_rejected(self):
+        """Test that a protected route without credentials gets a 401 without reaching the app."""
+        app, _, _, sent = await self._call("/v1/agents")
+
+        app.assert_not_called()
+        self.assertEqual(sent[0]["status"], 401)
+
+    async def test_public_route_reaches_app_unwrapped(self):
+        """Test that a public route is passed the server's own send, so streams are not copied."""
+        app, scope, send, sent = await self._call("/health")
+
+        app.assert_called_once()
+        self.assertIs(app.call_args.args[0], scope)
+        self.assertIs(app.call_args.args[2], send)
+        self.assertEqual(sent, [])
+
+    async def test_non_http_scope_passes_through(self):
+        """Test that lifespan and websocket scopes are not authenticated."""
+        app, _, _, sent = await self._call("", scope_type="lifespan")
+
+        app.assert_called_once()
+        self.assertEqual(sent, [])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,39 @@
+"""Tests for the ETag helpers."""
+import unittest
+
+from ark_api.utils.etag import collection_etag, etag_matches, resource_etag
+
+
+def _resource(name, resource_version):
+    return {"metadata": {"name": name, "resourceVersion": resource_version}}
+
+
+class TestETags(unittest.TestCase):
+    """Test cases for resource and collection ETags."""
+
+    def test_resource_etag_from_resource_version(self):
+        """Test a resource's ETag quotes its resourceVersion."""
+        self.assertEqual(resource_etag(_resource("a", "42")), '"42"')
+        self.assertIsNone(resource_etag({"metadata": {"name": "a"}}))
+
+    def test_collection_etag_follows_items(self):
+        """Test a list's ETag changes when an item is modified, added or removed."""
+        items = [_resource("a", "1"), _resource("b", "2")]
+        etag = collection_etag(items)
+
+        self.assertEqual(collection_etag([_resource("a", "1"), _resource("b", "2")]), etag)
+        self.assertNotEqual(collection_etag([_resource("a", "1"), _resource("b", "3")]), etag)
+        self.assertNotEqual(collection_etag(items[:1]), etag)
+        self.assertIsNone(collection_etag([_resource("a", "1"), {"metadata": {"name": "b"}}]))
+
+    def test_etag_matches(self):
+        """Test If-None-Match lists, weak validators and the wildcard."""
+        self.assertTrue(etag_matches('"1", "2"', '"2"'))
+        self.assertTrue(etag_matches('W/"2"', '"2"'))
+        self.assertTrue(etag_matches("*", '"2"'))
+        self.assertFalse(etag_matches('"1"', '"2"'))
+        self.assertFalse(etag_matches(None, '"2"'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests for the shared HTTP client registry."""
+import os
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from ark_api.utils.http_clients import BROKER, HTTP_MAX_CONNECTIONS, MEMORY, PROXY, STREAMING, HTTPClientRegistry
+
+
+async def _handle(transport, request):
+    return httpx.Response(200, stream=httpx.ByteStream(b'{"ok": true}'), request=request)
+
+
+class TestHTTPClientRegistry(unittest.IsolatedAsyncioTestCase):
+    """Test cases for HTTPClientRegistry."""
+
+    async def asyncSetUp(self):
+        self.registry = HTTPClientRegistry()
+        patcher = patch.object(httpx.AsyncHTTPTransport, "handle_async_request", _handle)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.registry.aclose()
+
+    async def test_one_client_per_upstream(self):
+        """Test a client is created once per upstream and reused."""
+        broker = self.registry.get(BROKER)
+
+        self.assertIs(self.registry.get(BROKER), broker)
+        self.assertIsNot(self.registry.get(MEMORY), broker)
+
+    async def test_per_upstream_limits(self):
+        """Test per-upstream settings override the shared defaults."""
+        with patch.dict(os.environ, {"HTTP_BROKER_MAX_CONNECTIONS": "7"}):
+            self.registry.get(BROKER)
+        self.registry.get(MEMORY)
+
+        stats = self.registry.stats()
+        self.assertEqual(stats[BROKER]["max_connections"], 7)
+        self.assertEqual(stats[MEMORY]["max_connections"], HTTP_MAX_CONNECTIONS)
+
+    async def test_stream_upstreams_are_unbounded(self):
+        """Test the broker and streaming pools hold more concurrent SSE streams than the shared limit."""
+        for upstream in (BROKER, STREAMING):
+            client = self.registry.get(upstream)
+
+            streams = [
+                await client.send(client.build_request("GET", f"http://{upstream}:8080/stream/{i}"), stream=True)
+                for i in range(HTTP_MAX_CONNECTIONS + 1)
+            ]
+
+            stats = self.registry.stats()[upstream]
+            self.assertIsNone(stats["max_connections"])
+            self.assertEqual(stats["in_flight"], HTTP_MAX_CONNECTIONS + 1)
+            self.assertEqual(stats["saturated"], 0)
+            self.assertGreater(self.registry._transports[upstream]._pool._max_connections, HTTP_MAX_CONNECTIONS)
+            for response in streams:
+                await response.aclose()
+
+    async def test_response_cookies_are_not_kept(self):
+        """Test a cookie set on one proxied response is not sent with later requests."""
+        sent = []
+
+        async def handle(transport, request):
+            sent.append(request)
+            return httpx.Response(200, headers={"Set-Cookie": "session=alice-secret; Path=/"}, request=request)
+
+        client = self.registry.get(PROXY)
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", handle):
+            await client.get("http://service:8080/login")
+            await client.get("http://service:8080/data")
+
+        self.assertNotIn("cookie", sent[1].headers)
+        self.assertEqual(len(client.cookies), 0)
+
+    async def test_stats_track_in_flight_requests(self):
+        """Test requests are counted until their response is closed."""
+        client = self.registry.get(BROKER)
+
+        async with client.stream("GET", "http://broker:8080/traces") as response:
+            self.assertEqual(self.registry.stats()[BROKER]["in_flight"], 1)
+            await response.aread()
+        response = await client.get("http://broker:8080/traces")
+
+        self.assertEqual(response.json(), {"ok": True})
+        stats = self.registry.stats()[BROKER]
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["peak_in_flight"], 1)
+        self.assertEqual(stats["saturated"], 0)
+
+    async def test_saturated_requests_are_counted(self):
+        """Test requests started while every connection is busy are counted as saturated."""
+        with patch.dict(os.environ, {"HTTP_BROKER_MAX_CONNECTIONS": "1"}):
+            client = self.registry.get(BROKER)
+
+        async with client.stream("GET", "http://broker:8080/traces"):
+            await client.get("http://broker:8080/events")
+
+        self.assertEqual(self.registry.stats()[BROKER]["saturated"], 1)
+
+    async def test_aclose_closes_clients(self):
+        """Test closed clients are replaced on next use."""
+        client = self.registry.get(BROKER)
+
+        await self.registry.aclose()
+
+        self.assertTrue(client.is_closed)
+        self.assertEqual(self.registry.stats(), {})
+        self.assertIsNot(self.registry.get(BROKER), client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests for the memory service fan-out helpers."""
+import asyncio
+import unittest
+
+from fastapi import HTTPException
+
+from ark_api.utils.memory_client import (
+    fan_out_to_memories,
+    memory_errors,
+    merge_by_sequence,
+    merge_streams_by_sequence
+)
+
+
+def _memory(name):
+    return {
+        "metadata": {"name": name},
+        "status": {"lastResolvedAddress": f"http://{name}:8080"}
+    }
+
+
+class TestFanOutToMemories(unittest.IsolatedAsyncioTestCase):
+    """Test cases for fan_out_to_memories."""
+
+    async def test_results_in_memory_order(self):
+        """Test results keep the order of the memories, not of completion."""
+        async def call(memory_name, service_url):
+            await asyncio.sleep(0.02 if memory_name == "memory-1" else 0)
+            return service_url
+
+        results = await fan_out_to_memories([_memory("memory-1"), _memory("memory-2")], call)
+
+        self.assertEqual([r.memory_name for r in results], ["memory-1", "memory-2"])
+        self.assertEqual(results[0].value, "http://memory-1:8080")
+        self.assertIsNone(memory_errors(results))
+
+    async def test_calls_run_concurrently_up_to_limit(self):
+        """Test no more calls than the concurrency limit are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def call(memory_name, service_url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        memories = [_memory(f"memory-{i}") for i in range(5)]
+        await fan_out_to_memories(memories, call, concurrency=2)
+
+        self.assertEqual(peak, 2)
+
+    async def test_failures_reported_per_memory(self):
+        """Test a failing or slow memory is reported without failing the others."""
+        async def call(memory_name, service_url):
+            if memory_name == "slow":
+                await asyncio.sleep(1)
+            if memory_name == "broken":
+                raise HTTPException(status_code=500, detail="Memory service error")
+            return []
+
+        results = await fan_out_to_memories(
+            [_memory("ok"), _memory("slow"), _memory("broken")], call, deadline=0.05
+        )
+
+        self.assertEqual(results[0].value, [])
+        errors = memory_errors(results)
+        self.assertEqual([e["memoryName"] for e in errors], ["slow", "broken"])
+        self.assertIn("did not respond", errors[0]["error"])
+        self.assertEqual(errors[1]["error"], "Memory service error")
+
+
+class TestMergeBySequence(unittest.TestCase):
+    """Test cases for merge_by_sequence."""
+
+    def test_merges_descending(self):
+        """Test lists in either order are merged newest first."""
+        merged = merge_by_sequence([[5, 3, 1], [2, 4, 6], []], key=lambda x: x)
+
+        self.assertEqual(merged, [6, 5, 4, 3, 2, 1])
+
+    def test_unsorted_lists_are_sorted(self):
+        """Test a list out of sequence order is sorted before merging."""
+        merged = merge_by_sequence([[3, 9, 1], [2]], key=lambda x: x)
+
+        self.assertEqual(merged, [9, 3, 2, 1])
+
+
+class TestMergeStreamsBySequence(unittest.IsolatedAsyncioTestCase):
+    """Test cases for merge_streams_by_sequence."""
+
+    async def test_merges_ascending_lazily(self):
+        """Test streams are merged oldest first, reading one item ahead per stream."""
+        read = []
+
+        async def stream(name, sequences):
+            for sequence in sequences:
+                read.append((name, sequence))
+                yield sequence
+
+        merged = merge_streams_by_sequence([stream("a", [1, 4, 5]), stream("b", [2, 3, 6])], key=lambda x: x)
+
+        self.assertEqual(await merged.__anext__(), 1)
+        self.assertEqual(read, [("a", 1), ("b", 2)])
+        self.assertEqual([item async for item in merged], [2, 3, 4, 5, 6])
+
+    async def test_closing_merge_closes_streams(self):
+        """Test closing the merge early closes the unfinished streams."""
+        closed = []
+
+        async def stream(name):
+            try:
+                for sequence in range(10):
+                    yield sequence
+            finally:
+                closed.append(name)
+
+        merged = merge_streams_by_sequence([stream("a"), stream("b")], key=lambda x: x)
+        await merged.__anext__()
+        await merged.aclose()
+
+        self.assertEqual(sorted(closed), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,13 @@
 """Tests for OpenAPI security injection based on AUTH_MODE."""
+import json
 import os
+import time
 import unittest
 from unittest.mock import Mock, patch
 
-from ark_api.main import app, custom_openapi
+from fastapi.testclient import TestClient
+
+from ark_api.main import app, custom_openapi, openapi_documents
 from ark_api.auth.constants import AuthMode
 
 
@@ -11,13 +15,14 @@ class TestOpenAPISecurity(unittest.TestCase):
     def setUp(self):
         # Ensure we start with a fresh OpenAPI schema each time
         app.openapi_schema = None
+        openapi_documents.clear()
 
     async def _get_schema(self) -> dict:
         # Minimal Request mock: only headers are used by custom_openapi
         request = Mock()
         request.headers = {}
-        schema = await custom_openapi(request)
-        return schema
+        response = await custom_openapi(request)
+        return json.loads(response.body)
 
     @patch.dict(os.environ, {"AUTH_MODE": AuthMode.BASIC})
     async def test_basic_mode_exposes_basic_auth(self):
@@ -58,6 +63,42 @@ class TestOpenAPISecurity(unittest.TestCase):
         self.assertIsNone(schema.get("components", {}).get("securitySchemes"))
 
 
+
+class TestOpenAPIDocumentCache(unittest.TestCase):
+    def setUp(self):
+        app.openapi_schema = None
+        openapi_documents.clear()
+        self.client = TestClient(app)
+
+    def test_second_fetch_served_from_cache(self):
+        first = self.client.get("/openapi.json")
+        self.assertEqual(first.status_code, 200)
+
+        # A second fetch must not rebuild the schema
+        with patch('ark_api.openapi.schema.add_security_to_openapi', side_effect=AssertionError("schema rebuilt")):
+            start = time.perf_counter()
+            second = self.client.get("/openapi.json")
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.headers["etag"], first.headers["etag"])
+        self.assertLess(elapsed, 0.5)
+
+    def test_if_none_match_returns_not_modified(self):
+        etag = self.client.get("/openapi.json").headers["etag"]
+
+        response = self.client.get("/openapi.json", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_forwarded_prefix_does_not_leak_between_requests(self):
+        forwarded = self.client.get("/openapi.json", headers={"X-Forwarded-Prefix": "/api", "X-Forwarded-Host": "ark.example.com"})
+        plain = self.client.get("/openapi.json")
+
+        self.assertEqual(forwarded.json()["servers"], [{"url": "http://ark.example.com/api", "description": "Current server"}])
+        self.assertNotIn("servers", plain.json())
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,160 @@
+"""Tests for the shared query completion hub."""
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock, patch
+
+from fastapi import HTTPException
+
+from ark_api.utils import query_watch
+from ark_api.utils.query_watch import QueryCompletionHub, watch_query_completion
+
+
+def _query(name, phase, **status):
+    return {"metadata": {"name": name}, "status": {"phase": phase, **status}}
+
+
+class TestQueryCompletionHub(unittest.IsolatedAsyncioTestCase):
+    """Test cases for QueryCompletionHub."""
+
+    async def asyncSetUp(self):
+        self.runs = 0
+
+        async def fake_run(ns_watch):
+            # Stand-in for the watch loop: ready at once, events are dispatched by the test
+            self.runs += 1
+            ns_watch._ready.set()
+            await asyncio.Event().wait()
+
+        @asynccontextmanager
+        async def fake_api_client():
+            yield Mock()
+
+        self.custom_api = Mock()
+        self.custom_api.get_namespaced_custom_object = AsyncMock(side_effect=lambda **kwargs: _query(kwargs["name"], "running"))
+        self.patchers = [
+            patch.object(query_watch._NamespaceWatch, "_run", fake_run),
+            patch.object(query_watch, "get_api_client_pool", return_value=Mock(api_client=fake_api_client)),
+            patch.object(query_watch.client, "CustomObjectsApi", return_value=self.custom_api),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.hub = QueryCompletionHub()
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+        for patcher in self.patchers:
+            patcher.stop()
+
+    async def test_concurrent_waiters_share_one_watch(self):
+        """Test awaiters in the same namespace are served by one watch."""
+        waiters = [
+            asyncio.create_task(self.hub.wait_for_completion("default", name, 5))
+            for name in ("q1", "q2", "q2")
+        ]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        ns_watch = self.hub._watches["default"]
+        ns_watch.dispatch("MODIFIED", _query("q1", "running"))
+        ns_watch.dispatch("MODIFIED", _query("q1", "done"))
+        ns_watch.dispatch("MODIFIED", _query("q2", "error"))
+        results = await asyncio.gather(*waiters)
+
+        self.assertEqual([result["status"]["phase"] for result in results], ["done", "error", "error"])
+        self.assertEqual(self.runs, 1)
+        self.assertEqual(ns_watch.pending, 0)
+
+    async def test_already_finished_query(self):
+        """Test a query that finished before the awaiter registered is still returned."""
+        self.custom_api.get_namespaced_custom_object.side_effect = None
+        self.custom_api.get_namespaced_custom_object.return_value = _query("q1", "done")
+
+        result = await self.hub.wait_for_completion("default", "q1", 5)
+
+        self.assertEqual(result["status"]["phase"], "done")
+
+    async def test_timeout_cleans_up_awaiter(self):
+        """Test a timed out awaiter is removed from the watch."""
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.hub.wait_for_completion("default", "q1", 0.01)
+
+        self.assertEqual(self.hub._watches["default"].pending, 0)
+
+    async def test_idle_watch_is_closed(self):
+        """Test a namespace watch is stopped once it has no awaiters."""
+        self.hub.idle_timeout = 0
+        self.custom_api.get_namespaced_custom_object.side_effect = None
+        self.custom_api.get_namespaced_custom_object.return_value = _query("q1", "done")
+
+        await self.hub.wait_for_completion("default", "q1", 5)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.hub._watches, {})
+
+    async def test_close_waits_for_idle_stop(self):
+        """Test closing the hub finishes stopping a watch closed for being idle."""
+        self.hub.idle_timeout = 0
+        self.custom_api.get_namespaced_custom_object.side_effect = None
+        self.custom_api.get_namespaced_custom_object.return_value = _query("q1", "done")
+
+        await self.hub.wait_for_completion("default", "q1", 5)
+        ns_watch = next(iter(self.hub._watches.values()))
+        while self.hub._watches:
+            await asyncio.sleep(0)
+        self.assertEqual(len(self.hub._stopping), 1)
+
+        await self.hub.close()
+
+        self.assertIsNone(ns_watch._task)
+        self.assertEqual(self.hub._stopping, set())
+
+    async def test_deleted_query_fails_awaiter(self):
+        """Test deleting a query fails its awaiters instead of waiting for the timeout."""
+        waiter = asyncio.create_task(self.hub.wait_for_completion("default", "q1", 5))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        self.hub._watches["default"].dispatch("DELETED", _query("q1", "running"))
+
+        with self.assertRaises(HTTPException):
+            await waiter
+
+
+class TestWatchQueryCompletion(unittest.IsolatedAsyncioTestCase):
+    """Test cases for watch_query_completion."""
+
+    @patch("ark_api.utils.query_watch.get_query_completion_hub")
+    async def test_done_query_returns_completion(self, mock_get_hub):
+        mock_get_hub.return_value.wait_for_completion = AsyncMock(
+            return_value=_query("q1", "done", response={"content": "hello"})
+        )
+
+        completion = await watch_query_completion(Mock(namespace="default"), "q1", "agent/a", [], 5)
+
+        self.assertEqual(completion.choices[0].message.content, "hello")
+        mock_get_hub.return_value.wait_for_completion.assert_awaited_once_with("default", "q1", 5)
+
+    @patch("ark_api.utils.query_watch.get_query_completion_hub")
+    async def test_error_query_raises(self, mock_get_hub):
+        mock_get_hub.return_value.wait_for_completion = AsyncMock(
+            return_value=_query("q1", "error", message="boom")
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            await watch_query_completion(Mock(namespace="default"), "q1", "agent/a", [], 5)
+
+        self.assertEqual(context.exception.status_code, 500)
+
+    @patch("ark_api.utils.query_watch.get_query_completion_hub")
+    async def test_timeout_raises_504(self, mock_get_hub):
+        mock_get_hub.return_value.wait_for_completion = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        with self.assertRaises(HTTPException) as context:
+            await watch_query_completion(Mock(namespace="default"), "q1", "agent/a", [], 5)
+
+        self.assertEqual(context.exception.status_code, 504)
+
+
+if __name__ == '__main__':
+    unittest.main()
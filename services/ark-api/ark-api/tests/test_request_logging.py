@@ -0,0 +1,73 @@
+"""Tests for the sampled access logging middleware."""
+import unittest
+from unittest.mock import patch
+
+from ark_api.core.request_logging import RequestLoggingMiddleware
+
+
+def _app(status, chunks=(b"",)):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": chunk != chunks[-1]})
+    return app
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+class TestRequestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
+    """Test cases for RequestLoggingMiddleware."""
+
+    async def _request(self, middleware, path="/v1/agents"):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"watch=true",
+            "headers": [(b"x-session-id", b"s1")],
+        }
+        await middleware(scope, _receive, send)
+        return sent
+
+    async def test_stream_passes_through(self):
+        """Test that every chunk of a streaming response reaches the server unchanged."""
+        middleware = RequestLoggingMiddleware(_app(200, (b"data: 1\n\n", b"data: 2\n\n")), sample_rate=1)
+
+        with patch('ark_api.core.request_logging.logger') as mock_logger:
+            sent = await self._request(middleware)
+
+        self.assertEqual([m.get("body") for m in sent], [None, b"data: 1\n\n", b"data: 2\n\n"])
+        mock_logger.info.assert_called_once()
+        line = mock_logger.info.call_args.args[0]
+        self.assertIn("GET /v1/agents?watch=true - session=s1 - Status: 200", line)
+
+    async def test_unsampled_requests_not_logged_but_errors_are(self):
+        """Test that sampling skips successful requests but never server errors."""
+        with patch('ark_api.core.request_logging.logger') as mock_logger:
+            await self._request(RequestLoggingMiddleware(_app(200), sample_rate=0))
+            mock_logger.info.assert_not_called()
+
+            await self._request(RequestLoggingMiddleware(_app(503), sample_rate=0))
+            mock_logger.info.assert_called_once()
+
+    async def test_sampled_lines_rate_limited(self):
+        """Test that no more than max_per_second sampled lines are logged a second."""
+        middleware = RequestLoggingMiddleware(_app(200), sample_rate=1, max_per_second=2)
+
+        with patch('ark_api.core.request_logging.logger') as mock_logger, \
+                patch('ark_api.core.request_logging.time.monotonic', return_value=100.0):
+            for _ in range(5):
+                await self._request(middleware)
+
+        self.assertEqual(mock_logger.info.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+"""Tests for the resource watch hub."""
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from ark_api.utils import resource_watch
+from ark_api.utils.resource_watch import ResourceWatchHub, merge_patch
+
+
+class FakeInformer:
+    """Synced informer whose changes are applied by the test."""
+
+    plural = "agents"
+
+    def __init__(self, objects, resource_version="10"):
+        self.objects = objects
+        self.resource_version = resource_version
+        self.handlers = []
+
+    async def wait_for_sync(self, timeout=None):
+        return True
+
+    def list(self):
+        return list(self.objects)
+
+    def add_event_handler(self, handler):
+        self.handlers.append(handler)
+
+    def remove_event_handler(self, handler):
+        self.handlers.remove(handler)
+
+    def apply(self, event_type, obj):
+        for handler in self.handlers:
+            handler(event_type, obj)
+
+
+class FakeRegistry:
+    def __init__(self, informer):
+        self.informer = informer
+        self.holders = 0
+
+    def acquire(self, group, version, plural, namespace):
+        self.holders += 1
+        return self.informer
+
+    async def release(self, group, version, plural, namespace):
+        self.holders -= 1
+
+
+def make_agent(name, resource_version, description=None):
+    return {"metadata": {"name": name, "resourceVersion": resource_version}, "spec": {"description": description}}
+
+
+def to_item(obj):
+    item = {"name": obj["metadata"]["name"]}
+    if obj["spec"].get("description"):
+        item["description"] = obj["spec"]["description"]
+    return item
+
+
+def parse(event):
+    fields = dict(line.split(": ", 1) for line in event.decode().strip().split("\n"))
+    return fields.get("id"), fields["event"], json.loads(fields["data"])
+
+
+async def _next(events):
+    return parse(await asyncio.wait_for(events.__anext__(), 1))
+
+
+class TestMergePatch(unittest.TestCase):
+    """Test cases for merge_patch."""
+
+    def test_changed_added_and_removed_fields(self):
+        old = {"name": "a", "status": {"phase": "running", "message": "x"}, "gone": 1}
+        new = {"name": "a", "status": {"phase": "done", "message": "x"}, "count": 2}
+
+        self.assertEqual(merge_patch(old, new), {"status": {"phase": "done"}, "gone": None, "count": 2})
+
+
+class TestResourceWatchHub(unittest.IsolatedAsyncioTestCase):
+    """Test cases for ResourceWatchHub."""
+
+    async def asyncSetUp(self):
+        self.informer = FakeInformer([make_agent("a", "5")])
+        self.registry = FakeRegistry(self.informer)
+        patcher = patch.object(resource_watch, "get_informer_registry", return_value=self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.hub = ResourceWatchHub()
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+
+    async def _watch(self, last_event_id=None):
+        return await self.hub.watch("ark.mckinsey.com", "v1alpha1", "agents", "default", to_item, last_event_id)
+
+    async def test_sync_then_deltas(self):
+        """Test a stream starts with the list and then sends changes as patches."""
+        events = await self._watch()
+
+        self.assertEqual(await _next(events), ("10", "SYNC", {"type": "SYNC", "items": [{"name": "a"}]}))
+
+        self.informer.apply("ADDED", make_agent("b", "11"))
+        self.informer.apply("MODIFIED", make_agent("a", "12", description="helper"))
+        self.informer.apply("MODIFIED", make_agent("a", "13", description="helper"))
+        self.informer.apply("DELETED", make_agent("b", "14"))
+
+        self.assertEqual(await _next(events), ("11", "ADDED", {"type": "ADDED", "name": "b", "object": {"name": "b"}}))
+        self.assertEqual(
+            await _next(events),
+            ("12", "MODIFIED", {"type": "MODIFIED", "name": "a", "patch": {"description": "helper"}})
+        )
+        self.assertEqual(await _next(events), ("14", "DELETED", {"type": "DELETED", "name": "b"}))
+
+    async def test_clients_share_one_informer(self):
+        """Test all clients of a collection are served by one informer handler."""
+        first = await self._watch()
+        second = await self._watch()
+        await _next(first)
+        await _next(second)
+
+        self.informer.apply("ADDED", make_agent("b", "11"))
+
+        self.assertEqual((await _next(first))[1], "ADDED")
+        self.assertEqual((await _next(second))[1], "ADDED")
+        self.assertEqual(len(self.informer.handlers), 1)
+        self.assertEqual(self.hub.stats(), {"streams": 1, "subscribers": 2})
+
+    async def test_last_client_releases_informer(self):
+        """Test the informer is released once every client of a collection has left."""
+        first = await self._watch()
+        second = await self._watch()
+        await _next(first)
+        await _next(second)
+        self.assertEqual(self.registry.holders, 1)
+
+        await first.aclose()
+        self.assertEqual(self.hub.stats(), {"streams": 1, "subscribers": 1})
+
+        await second.aclose()
+        self.assertEqual(self.hub.stats(), {"streams": 0, "subscribers": 0})
+        self.assertEqual(self.informer.handlers, [])
+        self.assertEqual(self.registry.holders, 0)
+
+        # A new client watches again
+        events = await self._watch()
+        self.assertEqual((await _next(events))[1], "SYNC")
+        self.assertEqual(self.registry.holders, 1)
+
+    async def test_unstarted_stream_releases_informer(self):
+        """Test a stream whose client left before it started does not keep the informer."""
+        with patch.object(resource_watch, "RESOURCE_WATCH_START_TIMEOUT", 0.01):
+            await self._watch()
+            self.assertEqual(self.registry.holders, 1)
+
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(self.hub.stats(), {"streams": 0, "subscribers": 0})
+        self.assertEqual(self.informer.handlers, [])
+        self.assertEqual(self.registry.holders, 0)
+
+    async def test_stream_started_after_release_watches_again(self):
+        """Test a stream starting after its topic was released gets a new one."""
+        with patch.object(resource_watch, "RESOURCE_WATCH_START_TIMEOUT", 0.01):
+            events = await self._watch()
+            await asyncio.sleep(0.05)
+
+        self.assertEqual((await _next(events))[1], "SYNC")
+        self.assertEqual(self.hub.stats(), {"streams": 1, "subscribers": 1})
+        self.assertEqual(self.registry.holders, 1)
+
+    async def test_resume_from_last_event_id(self):
+        """Test a client resuming from a buffered event id only gets what it missed."""
+        events = await self._watch()
+        await _next(events)
+        self.informer.apply("ADDED", make_agent("b", "11"))
+        self.informer.apply("ADDED", make_agent("c", "12"))
+
+        resumed = await self._watch(last_event_id="11")
+        self.assertEqual((await _next(resumed))[:2], ("12", "ADDED"))
+
+        unknown = await self._watch(last_event_id="3")
+        self.assertEqual((await _next(unknown))[1], "SYNC")
+
+    async def test_bookmark_on_idle_stream(self):
+        """Test idle streams receive bookmarks with the latest resourceVersion."""
+        with patch.object(resource_watch, "RESOURCE_WATCH_BOOKMARK_INTERVAL", 0.01):
+            events = await self._watch()
+            await _next(events)
+
+            self.assertEqual(await _next(events), ("10", "BOOKMARK", {"type": "BOOKMARK", "resourceVersion": "10"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
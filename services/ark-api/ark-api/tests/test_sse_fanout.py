@@ -0,0 +1,193 @@
+"""Tests for the SSE fan-out hub."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from ark_api.utils import sse_fanout
+from ark_api.utils.sse_fanout import SSEFanoutHub
+
+
+class FakeUpstream:
+    """Upstream stream fed by the test."""
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+        self.chunks: asyncio.Queue = asyncio.Queue()
+
+    async def stream(self):
+        self.opened += 1
+        try:
+            while True:
+                chunk = await self.chunks.get()
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            self.closed += 1
+
+
+async def _next(events):
+    return await asyncio.wait_for(events.__anext__(), 1)
+
+
+class TestSSEFanoutHub(unittest.IsolatedAsyncioTestCase):
+    """Test cases for SSEFanoutHub."""
+
+    async def asyncSetUp(self):
+        self.hub = SSEFanoutHub()
+        self.upstream = FakeUpstream()
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+
+    def _subscribe(self, key="trace-1"):
+        return self.hub.subscribe(key, self.upstream.stream)
+
+    async def test_subscribers_share_one_upstream(self):
+        """Test subscribers of the same key share one upstream stream."""
+        first = self._subscribe()
+        second = self._subscribe()
+        first_event = asyncio.ensure_future(_next(first))
+        second_event = asyncio.ensure_future(_next(second))
+        await asyncio.sleep(0)
+
+        self.upstream.chunks.put_nowait(b"data: span1\n\n")
+
+        self.assertEqual(await first_event, b"data: span1\n\n")
+        self.assertEqual(await second_event, b"data: span1\n\n")
+        self.assertEqual(self.upstream.opened, 1)
+        self.assertEqual(self.hub.stats(), {"streams": 1, "subscribers": 2})
+
+    async def test_late_joiner_receives_replay(self):
+        """Test a subscriber joining an open stream first gets the buffered events."""
+        first = self._subscribe()
+        pending = asyncio.ensure_future(_next(first))
+        await asyncio.sleep(0)
+        self.upstream.chunks.put_nowait(b"data: span1\n\ndata: span2\n\n")
+        await pending
+
+        late = self._subscribe()
+
+        self.assertEqual(await _next(late), b"data: span1\n\n")
+        self.assertEqual(await _next(late), b"data: span2\n\n")
+        self.assertEqual(self.upstream.opened, 1)
+
+    async def test_from_beginning_after_replay_wrapped_opens_own_upstream(self):
+        """Test a from-beginning subscriber gets every event once the replay no longer has them."""
+        count = sse_fanout.SSE_FANOUT_REPLAY_SIZE + 44
+        first = self.hub.subscribe("chunks-1", self.upstream.stream, from_beginning=True)
+        pending = asyncio.ensure_future(_next(first))
+        await asyncio.sleep(0)
+        self.upstream.chunks.put_nowait(b"".join(f"data: {i}\n\n".encode() for i in range(count)))
+        await pending
+        for _ in range(count - 1):
+            await _next(first)
+
+        history = FakeUpstream()
+        history.chunks.put_nowait(b"".join(f"data: {i}\n\n".encode() for i in range(count)))
+        late = self.hub.subscribe("chunks-1", history.stream, from_beginning=True)
+
+        self.assertEqual(await _next(late), b"data: 0\n\n")
+        self.assertEqual(history.opened, 1)
+        for i in range(1, count):
+            self.assertEqual(await _next(late), f"data: {i}\n\n".encode())
+
+    async def test_from_beginning_shares_while_replay_complete(self):
+        """Test a from-beginning subscriber joins an open stream whose replay holds every event."""
+        first = self.hub.subscribe("chunks-1", self.upstream.stream, from_beginning=True)
+        pending = asyncio.ensure_future(_next(first))
+        await asyncio.sleep(0)
+        self.upstream.chunks.put_nowait(b"data: 0\n\ndata: 1\n\n")
+        await pending
+
+        late = self.hub.subscribe("chunks-1", self.upstream.stream, from_beginning=True)
+
+        self.assertEqual(await _next(late), b"data: 0\n\n")
+        self.assertEqual(await _next(late), b"data: 1\n\n")
+        self.assertEqual(self.upstream.opened, 1)
+
+    async def test_events_split_across_chunks(self):
+        """Test events are only published once they are complete."""
+        events = self._subscribe()
+        pending = asyncio.ensure_future(_next(events))
+        await asyncio.sleep(0)
+
+        self.upstream.chunks.put_nowait(b"data: sp")
+        await asyncio.sleep(0.01)
+        self.assertFalse(pending.done())
+        self.upstream.chunks.put_nowait(b"an1\n\ndata: span2\r\n\r\n")
+
+        self.assertEqual(await pending, b"data: span1\n\n")
+        self.assertEqual(await _next(events), b"data: span2\r\n\r\n")
+
+    async def test_upstream_closed_when_last_subscriber_leaves(self):
+        """Test the upstream stream is closed once no subscriber is left."""
+        first = self._subscribe()
+        second = self._subscribe()
+        first_event = asyncio.ensure_future(_next(first))
+        second_event = asyncio.ensure_future(_next(second))
+        await asyncio.sleep(0)
+        self.upstream.chunks.put_nowait(b"data: span1\n\n")
+        await asyncio.gather(first_event, second_event)
+
+        await first.aclose()
+        await asyncio.sleep(0)
+        self.assertEqual(self.upstream.closed, 0)
+
+        await second.aclose()
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.upstream.closed, 1)
+        self.assertEqual(self.hub.stats(), {"streams": 0, "subscribers": 0})
+
+    async def test_subscribers_end_with_upstream(self):
+        """Test subscriptions end when the upstream stream ends."""
+        events = self._subscribe()
+        pending = asyncio.ensure_future(_next(events))
+        await asyncio.sleep(0)
+
+        self.upstream.chunks.put_nowait(b"data: span1\n\n")
+        self.upstream.chunks.put_nowait(None)
+
+        self.assertEqual(await pending, b"data: span1\n\n")
+        with self.assertRaises(StopAsyncIteration):
+            await _next(events)
+
+    async def test_slow_consumer_is_disconnected(self):
+        """Test a subscriber whose queue overflows gets an error event and is disconnected."""
+        with patch.object(sse_fanout, "SSE_FANOUT_QUEUE_SIZE", 2):
+            events = self._subscribe()
+            first = await asyncio.wait_for(self._feed_and_read(events, [b"data: 1\n\n"]), 1)
+        self.assertEqual(first, b"data: 1\n\n")
+
+        self.upstream.chunks.put_nowait(b"data: 2\n\ndata: 3\n\ndata: 4\n\n")
+        await asyncio.sleep(0.01)
+
+        error = await _next(events)
+        self.assertIn(b"slow_consumer", error)
+        with self.assertRaises(StopAsyncIteration):
+            await _next(events)
+
+    async def test_slow_consumer_drops_oldest(self):
+        """Test the drop-oldest policy keeps the most recent events."""
+        with patch.object(sse_fanout, "SSE_FANOUT_QUEUE_SIZE", 2), \
+                patch.object(sse_fanout, "SSE_FANOUT_SLOW_CONSUMER", "drop-oldest"):
+            events = self._subscribe()
+            await asyncio.wait_for(self._feed_and_read(events, [b"data: 1\n\n"]), 1)
+
+        self.upstream.chunks.put_nowait(b"data: 2\n\ndata: 3\n\ndata: 4\n\n")
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(await _next(events), b"data: 3\n\n")
+        self.assertEqual(await _next(events), b"data: 4\n\n")
+
+    async def _feed_and_read(self, events, chunks):
+        pending = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)
+        for chunk in chunks:
+            self.upstream.chunks.put_nowait(chunk)
+        return await pending
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
+import asyncio
 import json
+import unittest
+
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 from openai.types.chat.chat_completion import CompletionUsage, Choice
-from ark_api.utils.streaming import create_single_chunk_sse_response
+from ark_api.utils.streaming import SSE_HEARTBEAT, SSERelay, create_single_chunk_sse_response
 
 
 def test_create_single_chunk_sse_response_basic():
@@ -154,4 +157,94 @@ def test_create_single_chunk_sse_response_none_content():
 
     # Content should be None
     assert chunk_data["choices"][0]["delta"]["content"] is None
-    assert chunk_data["choices"][0]["finish_reason"] == "stop"
\ No newline at end of file
+    assert chunk_data["choices"][0]["finish_reason"] == "stop"
+
+
+class Upstream:
+    """Async iterator over chunks, with an optional delay before given chunks."""
+
+    def __init__(self, chunks, delays=None, error=None):
+        self.chunks = list(chunks)
+        self.delays = delays or {}
+        self.error = error
+        self.closed = False
+        self.reads = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        index = self.reads
+        self.reads += 1
+        if index in self.delays:
+            await asyncio.sleep(self.delays[index])
+        if index < len(self.chunks):
+            return self.chunks[index]
+        if self.error is not None:
+            raise self.error
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestSSERelay(unittest.IsolatedAsyncioTestCase):
+    """Test cases for SSERelay."""
+
+    async def test_chunks_forwarded_unchanged(self):
+        upstream = Upstream([b"data: 1\n", b"\n", b"data: 2\n\n"])
+
+        chunks = [chunk async for chunk in SSERelay(1).relay(upstream)]
+
+        self.assertEqual(chunks, [b"data: 1\n", b"\n", b"data: 2\n\n"])
+        self.assertTrue(upstream.closed)
+
+    async def test_heartbeat_only_between_events(self):
+        upstream = Upstream([b"data: 1\n\n", b"data: 2", b"\n\n"], delays={1: 0.05, 2: 0.05})
+
+        chunks = [chunk async for chunk in SSERelay(0.01).relay(upstream)]
+
+        first, partial = chunks.index(b"data: 1\n\n"), chunks.index(b"data: 2")
+        self.assertIn(SSE_HEARTBEAT, chunks[first:partial])
+        self.assertNotIn(SSE_HEARTBEAT, chunks[partial:])
+        self.assertEqual([chunk for chunk in chunks if chunk != SSE_HEARTBEAT], upstream.chunks)
+
+    async def test_upstream_error_raised_after_chunks(self):
+        upstream = Upstream([b"data: 1\n\n"], error=ValueError("reset"))
+
+        chunks = []
+        with self.assertRaises(ValueError):
+            async for chunk in SSERelay(1).relay(upstream):
+                chunks.append(chunk)
+
+        self.assertEqual(chunks, [b"data: 1\n\n"])
+        self.assertTrue(upstream.closed)
+
+    async def test_one_reader_task_for_the_stream(self):
+        upstream = Upstream([b"data: %d\n\n" % i for i in range(50)])
+        created = []
+        loop = asyncio.get_running_loop()
+        factory = loop.get_task_factory()
+
+        def count_tasks(loop, coro, **kwargs):
+            created.append(coro)
+            return asyncio.Task(coro, loop=loop, **kwargs) if factory is None else factory(loop, coro, **kwargs)
+
+        loop.set_task_factory(count_tasks)
+        try:
+            chunks = [chunk async for chunk in SSERelay(1).relay(upstream)]
+        finally:
+            loop.set_task_factory(factory)
+
+        self.assertEqual(len(chunks), 50)
+        self.assertLess(len(created), 10)
+
+    async def test_closing_relay_cancels_read_and_closes_upstream(self):
+        upstream = Upstream([b"data: 1\n\n"], delays={1: 10})
+        relay = SSERelay(1).relay(upstream)
+
+        self.assertEqual(await relay.__anext__(), b"data: 1\n\n")
+        await relay.aclose()
+
+        self.assertTrue(upstream.closed)
+
@@ -1,6 +1,6 @@
 import { Router } from 'express';
 import { EventBroker, EventData } from '../event-broker.js';
-import { streamSSE } from '../sse.js';
+import { streamSSE, toSSEEvent, SSEEvent } from '../sse.js';
 import { parsePaginationParams, PaginationError, PaginatedList } from '../pagination.js';
 
 export function createEventsRouter(events: EventBroker): Router {
@@ -13,11 +13,11 @@ export function createEventsRouter(events: EventBroker): Router {
       const cursor = req.query['cursor'] ? parseInt(req.query['cursor'] as string, 10) : undefined;
       console.log(`[EVENTS] GET /events?watch=true${cursor ? `&cursor=${cursor}` : ''} - starting SSE stream for all events`);
 
-      let replayItems: EventData[] | undefined;
+      let replayItems: SSEEvent[] | undefined;
       if (cursor !== undefined && !isNaN(cursor)) {
         replayItems = events.all()
           .filter(item => item.sequenceNumber > cursor)
-          .map(item => item.data);
+          .map(item => toSSEEvent(item));
       }
 
       streamSSE({
@@ -25,7 +25,7 @@ export function createEventsRouter(events: EventBroker): Router {
         req,
         tag: 'EVENTS',
         itemName: 'events',
-        subscribe: (callback) => events.subscribe((item) => callback(item.data)),
+        subscribe: (callback) => events.subscribe((item) => callback(toSSEEvent(item))),
         replayItems
       });
     } else {
@@ -62,13 +62,13 @@ export function createEventsRouter(events: EventBroker): Router {
     if (watch) {
       console.log(`[EVENTS] GET /events/${query_id}?watch=true - starting SSE stream`);
 
-      let replayItems: EventData[] | undefined;
+      let replayItems: SSEEvent[] | undefined;
       if (fromBeginning) {
-        replayItems = events.getEventsByQuery(query_id);
+        replayItems = events.getByQuery(query_id).map(item => toSSEEvent(item));
       } else if (cursor !== undefined && !isNaN(cursor)) {
         replayItems = events.getByQuery(query_id)
           .filter(item => item.sequenceNumber > cursor)
-          .map(item => item.data);
+          .map(item => toSSEEvent(item));
       }
 
       streamSSE({
@@ -76,7 +76,7 @@ export function createEventsRouter(events: EventBroker): Router {
         req,
         tag: 'EVENTS',
         itemName: 'events',
-        subscribe: (callback) => events.subscribeToQuery(query_id, (item) => callback(item.data)),
+        subscribe: (callback) => events.subscribeToQuery(query_id, (item) => callback(toSSEEvent(item))),
         replayItems,
         identifier: `Query ${query_id}`
       });
@@ -1,7 +1,7 @@
 import { Router } from 'express';
 import { randomUUID } from 'crypto';
 import { MemoryBroker } from '../memory-broker.js';
-import { streamSSE } from '../sse.js';
+import { streamSSE, toSSEEvent, SSEEvent } from '../sse.js';
 import { parsePaginationParams, PaginationError, PaginatedList } from '../pagination.js';
 
 export function createMemoryRouter(memory: MemoryBroker): Router {
@@ -83,13 +83,13 @@ export function createMemoryRouter(memory: MemoryBroker): Router {
       const cursor = req.query['cursor'] ? parseInt(req.query['cursor'] as string, 10) : undefined;
       console.log(`[MESSAGES] GET /messages?watch=true${cursor ? `&cursor=${cursor}` : ''} - starting SSE stream for all messages`);
 
-      let replayItems: Array<{ timestamp: string; conversation_id: string; query_id: string; message: unknown; sequence: number }> | undefined;
+      let replayItems: SSEEvent[] | undefined;
       if (cursor !== undefined && !isNaN(cursor)) {
         let items = memory.all().filter(item => item.sequenceNumber > cursor);
         if (conversationId) {
           items = items.filter(item => item.data.conversationId === conversationId);
         }
-        replayItems = items.map(item => ({
+        replayItems = items.map(item => toSSEEvent(item, {
           timestamp: item.timestamp.toISOString(),
           conversation_id: item.data.conversationId,
           query_id: item.data.queryId,
@@ -104,13 +104,13 @@ export function createMemoryRouter(memory: MemoryBroker): Router {
         tag: 'MESSAGES',
         itemName: 'messages',
         subscribe: (callback) => memory.subscribe((item) => {
-          callback({
+          callback(toSSEEvent(item, {
             timestamp: item.timestamp.toISOString(),
             conversation_id: item.data.conversationId,
             query_id: item.data.queryId,
             message: item.data.message,
             sequence: item.sequenceNumber
-          });
+          }));
         }),
         filter: conversationId ? (msg) => msg.conversation_id === conversationId : undefined,
         replayItems
@@ -69,7 +69,7 @@ describe('Streaming API', () => {
   };
 
   // Helper to consume SSE stream with timeout
-  const consumeStream = (queryId: string, options: { fromBeginning?: boolean, timeout?: number } = {}): Promise<string[]> => {
+  const consumeStream = (queryId: string, options: { fromBeginning?: boolean, timeout?: number, ids?: number[] } = {}): Promise<string[]> => {
     return new Promise((resolve, reject) => {
       const events: string[] = [];
       const timeout = setTimeout(() => {
@@ -93,6 +93,8 @@ describe('Streaming API', () => {
             lines.forEach(line => {
               if (line.startsWith('data: ')) {
                 events.push(line.substring(6));
+              } else if (line.startsWith('id: ')) {
+                options.ids?.push(parseInt(line.substring(4), 10));
               }
             });
           });
@@ -263,4 +265,58 @@ describe('Streaming API', () => {
     });
   });
 
+  describe('Resuming with event ids', () => {
+    // Events of a finished SSE response as id and data
+    const parseEvents = (text: string) => text.split('\n\n')
+      .filter(block => block.includes('data: '))
+      .map(block => {
+        const lines = block.split('\n');
+        const id = lines.find(line => line.startsWith('id: '));
+        return {
+          id: id ? parseInt(id.substring(4), 10) : undefined,
+          data: lines.find(line => line.startsWith('data: '))!.substring(6)
+        };
+      });
+
+    it('should send the sequence number of each chunk as its event id', async () => {
+      const queryId = 'test-query-6';
+      await sendChunks(queryId, [createTextChunk('First'), createTextChunk(' second')]);
+      await request(app).post(`/stream/${queryId}/complete`);
+      const sequenceNumbers = chunks.getByQuery(queryId).map(item => item.sequenceNumber);
+
+      const response = await request(app).get(`/stream/${queryId}?from-beginning=true`);
+      const events = parseEvents(response.text);
+
+      expect(events.map(event => event.id)).toEqual([sequenceNumbers[0], sequenceNumbers[1], undefined]);
+      expect(events[2].data).toBe('[DONE]');
+    });
+
+    it('should send event ids with live chunks', async () => {
+      const queryId = 'test-query-7';
+      const ids: number[] = [];
+      const streamPromise = consumeStream(queryId, { ids });
+
+      await new Promise(resolve => setTimeout(resolve, 100));
+      await sendChunks(queryId, [createTextChunk('Live'), createFinishChunk()]);
+      await request(app).post(`/stream/${queryId}/complete`);
+      await streamPromise;
+
+      expect(ids).toEqual(chunks.getByQuery(queryId).slice(0, 2).map(item => item.sequenceNumber));
+    });
+
+    it('should replay only the chunks after the cursor', async () => {
+      const queryId = 'test-query-8';
+      await sendChunks(queryId, [createTextChunk('Seen'), createTextChunk('Missed'), createFinishChunk()]);
+      await request(app).post(`/stream/${queryId}/complete`);
+      const cursor = chunks.getByQuery(queryId)[0].sequenceNumber;
+
+      const response = await request(app).get(`/stream/${queryId}?cursor=${cursor}`);
+      const events = parseEvents(response.text);
+
+      expect(events.length).toBe(3);
+      expect(events[0].id).toBe(cursor + 1);
+      expect(JSON.parse(events[0].data).choices[0].delta.content).toBe('Missed');
+      expect(events[2].data).toBe('[DONE]');
+    });
+  });
 });
@@ -1,7 +1,7 @@
 import { Router } from 'express';
 import { CompletionChunkBroker } from '../completion-chunk-broker.js';
 import { StreamError } from '../types.js';
-import { streamSSE, writeSSEEvent } from '../sse.js';
+import { streamSSE, writeSSEEvent, toSSEEvent, SSEEvent } from '../sse.js';
 import { parsePaginationParams, PaginationError } from '../pagination.js';
 
 const parseTimeout = (timeoutStr: string | undefined, defaultTimeout: number): number => {
@@ -46,13 +46,23 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
     const watch = req.query['watch'] === 'true';
 
     if (watch) {
-      console.log('[STREAM] GET /stream?watch=true - starting SSE stream for all chunks');
+      const cursor = req.query['cursor'] ? parseInt(req.query['cursor'] as string, 10) : undefined;
+      console.log(`[STREAM] GET /stream?watch=true${cursor ? `&cursor=${cursor}` : ''} - starting SSE stream for all chunks`);
+
+      let replayItems: SSEEvent[] | undefined;
+      if (cursor !== undefined && !isNaN(cursor)) {
+        replayItems = chunks.all()
+          .filter(item => item.sequenceNumber > cursor)
+          .map(item => toSSEEvent(item, item.data.chunk));
+      }
+
       streamSSE({
         res,
         req,
         tag: 'STREAM',
         itemName: 'chunks',
-        subscribe: (callback) => chunks.subscribe((item) => callback(item.data.chunk))
+        subscribe: (callback) => chunks.subscribe((item) => callback(toSSEEvent(item, item.data.chunk))),
+        replayItems
       });
     } else {
       try {
@@ -93,6 +103,11 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
    *           default: false
    *         description: Replay all chunks from the beginning
    *       - in: query
+   *         name: cursor
+   *         schema:
+   *           type: integer
+   *         description: Replay the chunks after this sequence number, e.g. the last event id received
+   *       - in: query
    *         name: wait-for-query
    *         schema:
    *           type: string
@@ -116,6 +131,7 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
     try {
       const { query_name } = req.params;
       const fromBeginning = req.query['from-beginning'] === 'true';
+      const cursor = req.query['cursor'] ? parseInt(req.query['cursor'] as string, 10) : undefined;
       // Parse wait-for-query parameter - timeout value (e.g., "30s")
       const waitForQueryParam = req.query['wait-for-query'] as string;
       let waitForQuery = false;
@@ -135,7 +151,7 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
         }
       }
 
-      console.log(`[STREAM] GET /stream/${query_name} - from-beginning=${fromBeginning}, wait-for-query=${waitForQueryParam}, timeout=${timeout}ms, max-chunk-size=${maxChunkSize}`);
+      console.log(`[STREAM] GET /stream/${query_name} - from-beginning=${fromBeginning}${cursor ? `, cursor=${cursor}` : ''}, wait-for-query=${waitForQueryParam}, timeout=${timeout}ms, max-chunk-size=${maxChunkSize}`);
 
       // Set SSE headers
       res.setHeader('Content-Type', 'text/event-stream');
@@ -186,7 +202,7 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
 
           // Error chunks should be sent as SSE events, not JSON responses
           // This allows OpenAI SDK and other clients to properly handle errors
-          if (!writeSSEEvent(res, chunk)) {
+          if (!writeSSEEvent(res, chunk, item.sequenceNumber)) {
             console.log(`[STREAM-OUT] Query ${query_name}: Failed to write error chunk, client may have disconnected`);
             unsubscribeChunks();
             unsubscribeComplete();
@@ -201,7 +217,7 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
         }
 
         // Chunks are already in OpenAI format, just forward them (including finish_reason chunks)
-        if (!writeSSEEvent(res, chunk)) {
+        if (!writeSSEEvent(res, chunk, item.sequenceNumber)) {
           console.log(`[STREAM-OUT] Query ${query_name}: Client disconnected (write failed)`);
           unsubscribeChunks();
           unsubscribeComplete();
@@ -269,13 +285,16 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
         }, timeout);
       }
 
-      // If from-beginning, send existing chunks first
-      if (fromBeginning) {
-        const existingChunks = chunks.getChunksByQuery(query_name);
-        console.log(`[STREAM] Sending ${existingChunks.length} existing chunks for query ${query_name}`);
+      // If from-beginning, send existing chunks first; with a cursor, only those after it
+      if (fromBeginning || (cursor !== undefined && !isNaN(cursor))) {
+        let existingItems = chunks.getByQuery(query_name);
+        if (cursor !== undefined && !isNaN(cursor)) {
+          existingItems = existingItems.filter(item => item.sequenceNumber > cursor);
+        }
+        console.log(`[STREAM] Sending ${existingItems.length} existing chunks for query ${query_name}`);
         
-        for (let i = 0; i < existingChunks.length; i++) {
-          const chunk = existingChunks[i];
+        for (const item of existingItems) {
+          const chunk = item.data.chunk;
           
           // Check for [DONE] marker - if found, send it properly and close
           if (chunk === '[DONE]') {
@@ -288,7 +307,7 @@ export function createStreamRouter(chunks: CompletionChunkBroker): Router {
           }
           
           // Chunks are already in OpenAI format, just forward them
-          if (!writeSSEEvent(res, chunk)) {
+          if (!writeSSEEvent(res, chunk, item.sequenceNumber)) {
             console.log(`[STREAM] Error writing existing chunk for query ${query_name}`);
             unsubscribeChunks();
             unsubscribeComplete();
@@ -1,6 +1,6 @@
 import { Router } from 'express';
 import { TraceBroker, OTELSpan } from '../trace-broker.js';
-import { streamSSE } from '../sse.js';
+import { streamSSE, toSSEEvent, SSEEvent } from '../sse.js';
 import { parsePaginationParams, PaginationError, PaginatedList } from '../pagination.js';
 
 export function createTracesRouter(traces: TraceBroker): Router {
@@ -13,11 +13,11 @@ export function createTracesRouter(traces: TraceBroker): Router {
       const cursor = req.query['cursor'] ? parseInt(req.query['cursor'] as string, 10) : undefined;
       console.log(`[TRACES] GET /traces?watch=true${cursor ? `&cursor=${cursor}` : ''} - starting SSE stream for all spans`);
 
-      let replayItems: OTELSpan[] | undefined;
+      let replayItems: SSEEvent[] | undefined;
       if (cursor !== undefined && !isNaN(cursor)) {
         replayItems = traces.all()
           .filter(item => item.sequenceNumber > cursor)
-          .map(item => item.data);
+          .map(item => toSSEEvent(item));
       }
 
       streamSSE({
@@ -25,7 +25,7 @@ export function createTracesRouter(traces: TraceBroker): Router {
         req,
         tag: 'TRACES',
         itemName: 'spans',
-        subscribe: (callback) => traces.subscribe((item) => callback(item.data)),
+        subscribe: (callback) => traces.subscribe((item) => callback(toSSEEvent(item))),
         replayItems
       });
     } else {
@@ -62,13 +62,13 @@ export function createTracesRouter(traces: TraceBroker): Router {
     if (watch) {
       console.log(`[TRACES] GET /traces/${trace_id}?watch=true - starting SSE stream`);
 
-      let replayItems: OTELSpan[] | undefined;
+      let replayItems: SSEEvent[] | undefined;
       if (fromBeginning) {
-        replayItems = traces.getSpansByTraceId(trace_id);
+        replayItems = traces.getByTraceId(trace_id).map(item => toSSEEvent(item));
       } else if (cursor !== undefined && !isNaN(cursor)) {
         replayItems = traces.getByTraceId(trace_id)
           .filter(item => item.sequenceNumber > cursor)
-          .map(item => item.data);
+          .map(item => toSSEEvent(item));
       }
 
       streamSSE({
@@ -76,7 +76,7 @@ export function createTracesRouter(traces: TraceBroker): Router {
         req,
         tag: 'TRACES',
         itemName: 'spans',
-        subscribe: (callback) => traces.subscribeToTrace(trace_id, (item) => callback(item.data)),
+        subscribe: (callback) => traces.subscribeToTrace(trace_id, (item) => callback(toSSEEvent(item))),
         replayItems,
         identifier: `Trace ${trace_id}`
       });
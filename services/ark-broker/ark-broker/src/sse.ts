@@ -1,8 +1,21 @@
 import { Request, Response } from 'express';
+import { BrokerItem } from './broker-item.js';
 
-export const writeSSEEvent = (res: Response, data: unknown): boolean => {
+/** An SSE event payload, with the sequence number sent as its `id:` so clients can resume from it */
+export interface SSEEvent {
+  data: unknown;
+  id?: number;
+}
+
+export const toSSEEvent = <T>(item: BrokerItem<T>, data: unknown = item.data): SSEEvent => ({
+  data,
+  id: item.sequenceNumber
+});
+
+export const writeSSEEvent = (res: Response, data: unknown, id?: number): boolean => {
   try {
-    res.write(`data: ${JSON.stringify(data)}\n\n`);
+    const idLine = id !== undefined ? `id: ${id}\n` : '';
+    res.write(`${idLine}data: ${JSON.stringify(data)}\n\n`);
     return true;
   } catch (error) {
     console.error('Error writing SSE event:', error);
@@ -27,9 +40,9 @@ interface SSEStreamOptions {
   req: Request;
   tag: string;
   itemName: string;
-  subscribe: (callback: (item: any) => void) => () => void;
-  replayItems?: any[];
-  filter?: (item: any) => boolean;
+  subscribe: (callback: (event: SSEEvent) => void) => () => void;
+  replayItems?: SSEEvent[];
+  filter?: (data: any) => boolean;
   identifier?: string;
 }
 
@@ -51,8 +64,8 @@ export const streamSSE = (options: SSEStreamOptions): void => {
 
   if (replayItems && replayItems.length > 0) {
     console.log(`[${tag}] Sending ${replayItems.length} existing ${itemName} for${idStr}`);
-    for (const item of replayItems) {
-      if (!writeSSEEvent(res, item)) {
+    for (const event of replayItems) {
+      if (!writeSSEEvent(res, event.data, event.id)) {
         console.log(`[${tag}-OUT]${idStr}: Error writing existing ${itemName.slice(0, -1)}`);
         clearInterval(heartbeat);
         return;
@@ -61,12 +74,12 @@ export const streamSSE = (options: SSEStreamOptions): void => {
     }
   }
 
-  const unsubscribe = subscribe((item: any) => {
-    if (filter && !filter(item)) {
+  const unsubscribe = subscribe((event: SSEEvent) => {
+    if (filter && !filter(event.data)) {
       return;
     }
 
-    if (!writeSSEEvent(res, item)) {
+    if (!writeSSEEvent(res, event.data, event.id)) {
       console.log(`[${tag}-OUT]${idStr}: Client disconnected (write failed)`);
       clearInterval(heartbeat);
       unsubscribe();